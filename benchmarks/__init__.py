@@ -0,0 +1 @@
+"""Performance benchmarks for the package, these are not installed."""
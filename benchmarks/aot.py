@@ -0,0 +1,98 @@
+"""Import time of builders generated at runtime and ahead of time.
+
+Each measurement imports a module defining many builder classes in a fresh
+interpreter, after a first import has written the bytecode cache, which is
+what the cold start of a short lived worker pays.
+
+Run with::
+
+    python -m benchmarks.aot
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+from dataclass_builder import generate_builder_source
+
+from .common import report
+
+_IMPORT = """\
+import sys, time
+sys.path.insert(0, {path!r})
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+
+def write_models(path: Path, count: int, size: int) -> List[str]:
+    """Write a module `models` defining `count` dataclasses of `size` fields.
+
+    :return:
+        Names of the dataclasses.
+    """
+    names = [f"Model{i}" for i in range(count)]
+    lines = ["from dataclasses import dataclass", ""]
+    for name in names:
+        lines += ["", "@dataclass", f"class {name}:"]
+        lines += [f"    f{j}: int = {j}" for j in range(size)]
+    (path / "models.py").write_text("\n".join(lines) + "\n")
+    return names
+
+
+def import_time(path: Path, module: str, repeat: int = 5) -> float:
+    """Fastest time, in seconds, to import `module` in a new interpreter."""
+    code = _IMPORT.format(path=str(path), module=module)
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    times = []
+    for _ in range(repeat + 1):  # the first run writes the bytecode cache
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        times.append(float(output.stdout))
+    return min(times[1:])
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rows: Dict[str, Dict[str, float]] = {}
+    for count in (10, 100, 500):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory)
+            names = write_models(path, count, 10)
+            sys.path.insert(0, directory)
+            try:
+                import models  # type: ignore
+            finally:
+                sys.path.remove(directory)
+            dynamic = [
+                "import models",
+                "from dataclass_builder import dataclass_builder",
+            ]
+            aot = ["import models"]
+            for name in names:
+                dynamic.append(f"{name}Builder = dataclass_builder(models.{name})")
+                source = generate_builder_source(getattr(models, name))
+                (path / f"{name.lower()}_builder.py").write_text(source)
+                aot.append(f"from {name.lower()}_builder import {name}Builder")
+            del sys.modules["models"]
+            (path / "dynamic.py").write_text("\n".join(dynamic) + "\n")
+            (path / "aot.py").write_text("\n".join(aot) + "\n")
+            rows[f"{count} classes"] = {
+                "factory": import_time(path, "dynamic") * 1e3,
+                "generated": import_time(path, "aot") * 1e3,
+            }
+    report("Import time of builder classes", rows, "ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Helpers shared by the benchmarks."""
+
+import dataclasses
+import timeit
+from typing import Any, Callable, Dict
+
+
+def make_dataclass(size: int, *, optional: float = 0.5, **kwargs: Any) -> Any:
+    """Create a dataclass with `size` integer fields named f0, f1, ...
+
+    :param size:
+        Number of fields.
+    :param optional:
+        Fraction of the fields, taken from the end, that have a default.
+    :param \\*\\*kwargs:
+        Passed through to :func:`dataclasses.make_dataclass`.
+
+    :return:
+        The new dataclass.
+    """
+    num_required = size - int(size * optional)
+    fields = []
+    for i in range(size):
+        if i < num_required:
+            fields.append((f"f{i}", int))
+        else:
+            fields.append((f"f{i}", int, dataclasses.field(default=i)))
+    return dataclasses.make_dataclass(f"Data{size}", fields, **kwargs)
+
+
+def values(dataclass: Any, *, optional: bool = True) -> Dict[str, Any]:
+    """Field values to build `dataclass` with.
+
+    :param dataclass:
+        Dataclass made by :func:`make_dataclass`.
+    :param optional:
+        Set to False to only give values for the required fields.
+
+    :return:
+        Mapping of field names to values.
+    """
+    return {
+        field.name: i
+        for i, field in enumerate(dataclasses.fields(dataclass))
+        if optional or field.default is dataclasses.MISSING
+    }
+
+
+def rate(func: Callable[[], Any], repeat: int = 5) -> float:
+    """Measure the number of calls per second of a function.
+
+    :param func:
+        Function to call with no arguments.
+    :param repeat:
+        Number of timing runs, the fastest is reported.
+
+    :return:
+        Calls per second.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return number / min(timer.repeat(repeat=repeat, number=number))
+
+
+def report(title: str, rows: Dict[str, Dict[str, float]], unit: str) -> None:
+    """Print a table of results.
+
+    :param title:
+        Heading of the table.
+    :param rows:
+        Mapping from row labels to mappings from column labels to values,
+        rows without a value for a column are shown with a dash.
+    :param unit:
+        Unit of the values.
+    """
+    columns = list(dict.fromkeys(c for row in rows.values() for c in row))
+    print(f"{title} ({unit})")
+    print(f"{'':>12}" + "".join(f"{c:>18}" for c in columns))
+    for label, row in rows.items():
+        cells = (f"{row[c]:>18,.0f}" if c in row else f"{'-':>18}" for c in columns)
+        print(f"{label:>12}" + "".join(cells))
+    print()
@@ -0,0 +1,83 @@
+"""Events per second of a shared assembler fed by 1 to N threads.
+
+An :class:`Assembler` behind one global lock is compared to a
+:class:`ConcurrentAssembler`.  Throughput can only scale with the number of
+threads on a free-threaded build of CPython, with the global interpreter lock
+this shows the cost of the locking instead.
+
+Run with::
+
+    python -m benchmarks.concurrent
+"""
+
+import dataclasses
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from dataclass_builder import Assembler, ConcurrentAssembler
+
+from .common import report
+
+_KEYS = 20_000
+_FIELDS = 4
+
+
+def _dataclass() -> Any:
+    fields = [("id", int)] + [(f"f{i}", int) for i in range(_FIELDS)]
+    return dataclasses.make_dataclass("Entity", fields)
+
+
+def _run(add: Callable[[Mapping[str, Any]], Optional[Any]], threads: int) -> float:
+    # each thread assembles its own keys, sending one event per field
+    def feed(start: int) -> None:
+        for key in range(start, start + _KEYS):
+            for i in range(_FIELDS):
+                add({"id": key, f"f{i}": i})
+
+    workers = [
+        threading.Thread(target=feed, args=(n * _KEYS,)) for n in range(threads)
+    ]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return threads * _KEYS * _FIELDS / (time.perf_counter() - start)
+
+
+def _global_lock(dataclass: Any) -> Callable[[Mapping[str, Any]], Optional[Any]]:
+    assembler = Assembler(dataclass, key="id")
+    lock = threading.Lock()
+
+    def add(event: Mapping[str, Any]) -> Optional[Any]:
+        with lock:
+            return assembler.add(event)
+
+    return add
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the benchmark.
+
+    :param argv:
+        Optionally the maximum number of threads, by default 8.
+    """
+    args = sys.argv[1:] if argv is None else argv
+    max_threads = int(args[0]) if args else 8
+    dataclass = _dataclass()
+    rows: Dict[str, Dict[str, float]] = {}
+    threads = 1
+    while threads <= max_threads:
+        rows[f"{threads} threads"] = {
+            "global lock": _run(_global_lock(dataclass), threads),
+            "striped": _run(ConcurrentAssembler(dataclass, key="id").add, threads),
+        }
+        threads *= 2
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    report(f"shared assembler (GIL {'on' if gil else 'off'})", rows, "events/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Builds per second of `dataclass_builder` classes.
+
+Compares the generated `build` method against the closure it replaced, which
+is reproduced here as the baseline.
+
+Run with::
+
+    python -m benchmarks.factory_build
+"""
+
+from typing import Any, Dict
+
+from dataclass_builder import OPTIONAL, REQUIRED, MissingFieldError, dataclass_builder
+from dataclass_builder._common import _dataclass_info
+
+from .common import make_dataclass, rate, report, values
+
+
+def closure_build(dataclass: Any) -> Any:
+    """Build method as implemented before code generation."""
+    info = _dataclass_info(dataclass)
+    required_fields = info.required
+    settable_fields = info.settable
+
+    def _build_method(self: Any) -> Any:
+        for name, field in required_fields.items():
+            if getattr(self, name) is REQUIRED:
+                raise MissingFieldError("", dataclass, field)
+        kwargs = {
+            name: getattr(self, name)
+            for name in settable_fields
+            if getattr(self, name) is not OPTIONAL
+        }
+        return dataclass(**kwargs)
+
+    return _build_method
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rows: Dict[str, Dict[str, float]] = {}
+    for size in (5, 50, 500):
+        dataclass = make_dataclass(size)
+        builder = dataclass_builder(dataclass)(**values(dataclass, optional=False))
+        old = closure_build(dataclass)
+        rows[f"{size} fields"] = {
+            "closure": rate(lambda o=old, b=builder: o(b)),
+            "generated": rate(builder.build),
+        }
+    report("factory build", rows, "builds/s")
+
+
+if __name__ == "__main__":
+    main()
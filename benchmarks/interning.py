@@ -0,0 +1,41 @@
+"""Builds per second of frozen dataclasses with and without interning.
+
+Run with::
+
+    python -m benchmarks.interning
+"""
+
+from typing import Dict
+
+from dataclass_builder import (
+    DataclassBuilder,
+    build,
+    dataclass_builder,
+    intern_builds,
+    stop_interning,
+)
+
+from .common import make_dataclass, rate, report, values
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rows: Dict[str, Dict[str, float]] = {}
+    for size in (2, 10, 100):
+        dataclass = make_dataclass(size, frozen=True)
+        kwargs = values(dataclass, optional=False)
+        wrapper = DataclassBuilder(dataclass, **kwargs)
+        builder = dataclass_builder(dataclass)(**kwargs)
+        row = rows[f"{size} fields"] = {
+            "wrapper": rate(lambda w=wrapper: build(w)),
+            "factory": rate(builder.build),
+        }
+        intern_builds(dataclass)
+        row["wrapper interned"] = rate(lambda w=wrapper: build(w))
+        row["factory interned"] = rate(builder.build)
+        stop_interning(dataclass)
+    report("frozen build with interning (every build hits)", rows, "builds/s")
+
+
+if __name__ == "__main__":
+    main()
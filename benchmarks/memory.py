@@ -0,0 +1,60 @@
+"""Memory used by each builder instance, measured with :mod:`tracemalloc`.
+
+Run with::
+
+    python -m benchmarks.memory
+"""
+
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from dataclass_builder import DataclassBuilder, dataclass_builder
+
+from .common import make_dataclass, report, values
+
+
+def bytes_per_instance(factory: Callable[[], Any], count: int = 10_000) -> float:
+    """Measure the average memory allocated by each object from `factory`.
+
+    :param factory:
+        Function creating a single object.
+    :param count:
+        Number of objects to create, all are kept alive during the measurement.
+
+    :return:
+        Bytes per object.
+    """
+    factory()  # warm up any caches
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objects = [factory() for _ in range(count)]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # don't count the list holding the objects
+    return (after - before - objects.__sizeof__()) / count
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rows: Dict[str, Dict[str, float]] = {}
+    for size in (2, 10, 50):
+        dataclass = make_dataclass(size)
+        kwargs = values(dataclass, optional=False)
+        builder = dataclass_builder(dataclass)
+        slots_builder = dataclass_builder(dataclass, slots=True)
+        rows[f"{size} fields"] = {
+            "DataclassBuilder": bytes_per_instance(
+                lambda d=dataclass, k=kwargs: DataclassBuilder(d, **k)
+            ),
+            "factory": bytes_per_instance(lambda b=builder, k=kwargs: b(**k)),
+            "factory slots": bytes_per_instance(
+                lambda b=slots_builder, k=kwargs: b(**k)
+            ),
+        }
+    report("builder memory", rows, "bytes/instance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Build nested dataclasses with nested builders and by hand.
+
+Each level of the tree is a dataclass with a few integer fields and a field
+holding the next level.  Nested builders create the builders of the levels
+as they are read, by hand a builder is created for each level and they are
+built from the bottom up.
+
+Run with::
+
+    python -m benchmarks.nested
+"""
+
+import dataclasses
+from typing import Any, Dict, List
+
+from dataclass_builder import DataclassBuilder, build
+
+from .common import rate, report
+
+
+def make_levels(depth: int) -> List[Any]:
+    """Create dataclasses nested `depth` levels deep, outermost first.
+
+    :param depth:
+        Number of levels.
+
+    :return:
+        The dataclass of each level, each has fields a, b and c and all but
+        the last have a field named child holding the next level.
+    """
+    levels = [dataclasses.make_dataclass("Level0", ["a", "b", "c"])]
+    for i in range(1, depth):
+        fields = ["a", "b", "c", ("child", levels[-1])]
+        levels.append(dataclasses.make_dataclass(f"Level{i}", fields))
+    return levels[::-1]
+
+
+def by_hand(levels: List[Any]) -> Any:
+    """Build the levels bottom up with a builder for each."""
+    value = None
+    for dataclass in reversed(levels):
+        builder = DataclassBuilder(dataclass, a=1, b=2, c=3)
+        if value is not None:
+            builder.child = value
+        value = build(builder)
+    return value
+
+
+def nested(levels: List[Any]) -> Any:
+    """Build the levels with a nested builder."""
+    root = DataclassBuilder(levels[0], nested=True)
+    builder = root
+    for _ in range(len(levels) - 1):
+        builder.a, builder.b, builder.c = 1, 2, 3
+        builder = builder.child
+    builder.a, builder.b, builder.c = 1, 2, 3
+    return build(root)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rows: Dict[str, Dict[str, float]] = {}
+    for depth in (1, 3, 5):
+        levels = make_levels(depth)
+        assert by_hand(levels) == nested(levels)
+        rows[f"{depth} levels"] = {
+            "by hand": rate(lambda n=levels: by_hand(n)),
+            "nested": rate(lambda n=levels: nested(n)),
+        }
+    report("build a nested dataclass", rows, "builds/s")
+
+
+if __name__ == "__main__":
+    main()
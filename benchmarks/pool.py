@@ -0,0 +1,77 @@
+"""Time and garbage collections of a build loop with and without a pool.
+
+Run with::
+
+    python -m benchmarks.pool [RECORDS]
+"""
+
+import gc
+import sys
+import time
+from typing import Any, Callable, Dict
+
+from dataclass_builder import BuilderPool, DataclassBuilder, build, dataclass_builder
+
+from .common import make_dataclass, report
+
+
+def measure(loop: Callable[[int], Any], records: int) -> Dict[str, float]:
+    """Run a build loop and measure it.
+
+    :param loop:
+        Function building the given number of records.
+    :param records:
+        Number of records to build.
+
+    :return:
+        The elapsed time in milliseconds and the number of garbage collections
+        of each generation.
+    """
+    gc.collect()
+    before = [stats["collections"] for stats in gc.get_stats()]
+    start = time.perf_counter()
+    loop(records)
+    elapsed = time.perf_counter() - start
+    after = [stats["collections"] for stats in gc.get_stats()]
+    result = {"time (ms)": elapsed * 1000}
+    for generation, (first, last) in enumerate(zip(before, after)):
+        result[f"gen{generation} gcs"] = last - first
+    return result
+
+
+def main() -> None:
+    """Run the benchmark."""
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    dataclass = make_dataclass(5, optional=0.4)
+    builder_class = dataclass_builder(dataclass)
+
+    def fresh(cls: Any) -> Callable[[int], None]:
+        def loop(n: int) -> None:
+            for i in range(n):
+                builder = cls()
+                builder.f0 = builder.f1 = builder.f2 = i
+                build(builder)
+
+        return loop
+
+    def pooled(pool: BuilderPool) -> Callable[[int], None]:
+        def loop(n: int) -> None:
+            for i in range(n):
+                builder = pool.acquire()
+                builder.f0 = builder.f1 = builder.f2 = i
+                build(builder)
+                pool.release(builder)
+
+        return loop
+
+    rows = {
+        "wrapper": measure(fresh(lambda: DataclassBuilder(dataclass)), records),
+        "wrapper pool": measure(pooled(BuilderPool(dataclass)), records),
+        "factory": measure(fresh(builder_class), records),
+        "factory pool": measure(pooled(BuilderPool(builder_class)), records),
+    }
+    report(f"build loop of {records:,} records", rows, "ms and collections")
+
+
+if __name__ == "__main__":
+    main()
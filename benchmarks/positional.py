@@ -0,0 +1,35 @@
+"""Builds per second passing fields positionally and by keyword.
+
+Builders pass fields to the dataclass positionally when they can, keyword
+only fields are always passed by keyword, so the same dataclasses with every
+field keyword only show the cost of the keyword path.
+
+Run with::
+
+    python -m benchmarks.positional
+"""
+
+from typing import Dict
+
+from dataclass_builder import DataclassBuilder, build, dataclass_builder
+
+from .common import make_dataclass, rate, report, values
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rows: Dict[str, Dict[str, float]] = {}
+    for size in (2, 10, 100):
+        row = rows[f"{size} fields"] = {}
+        for suffix, kw_only in (("", False), (" kw_only", True)):
+            dataclass = make_dataclass(size, kw_only=kw_only)
+            kwargs = values(dataclass)
+            wrapper = DataclassBuilder(dataclass, **kwargs)
+            builder = dataclass_builder(dataclass)(**kwargs)
+            row[f"wrapper{suffix}"] = rate(lambda w=wrapper: build(w))
+            row[f"factory{suffix}"] = rate(builder.build)
+    report("build with every field set", rows, "builds/s")
+
+
+if __name__ == "__main__":
+    main()
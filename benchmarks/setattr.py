@@ -0,0 +1,33 @@
+"""Field assignments per second of each kind of builder.
+
+Run with::
+
+    python -m benchmarks.setattr
+"""
+
+from typing import Dict
+
+from dataclass_builder import DataclassBuilder, dataclass_builder
+
+from .common import make_dataclass, rate, report
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rows: Dict[str, Dict[str, float]] = {}
+    for size in (2, 10, 100):
+        dataclass = make_dataclass(size)
+        builders = {
+            "wrapper": DataclassBuilder(dataclass),
+            "factory": dataclass_builder(dataclass)(),
+            "factory slots": dataclass_builder(dataclass, slots=True)(),
+        }
+        rows[f"{size} fields"] = {
+            label: rate(lambda builder=builder: setattr(builder, "f0", 1))
+            for label, builder in builders.items()
+        }
+    report("field assignment", rows, "assignments/s")
+
+
+if __name__ == "__main__":
+    main()
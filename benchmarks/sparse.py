@@ -0,0 +1,38 @@
+"""Cost of builders of wide dataclasses with only a few fields set.
+
+Run with::
+
+    python -m benchmarks.sparse
+"""
+
+from typing import Dict
+
+from dataclass_builder import DataclassBuilder, build
+
+from .common import make_dataclass, rate, report
+from .memory import bytes_per_instance
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rates: Dict[str, Dict[str, float]] = {}
+    memory: Dict[str, Dict[str, float]] = {}
+    for size in (10, 100, 400):
+        dataclass = make_dataclass(size, optional=1.0)
+        kwargs = {"f0": 0, "f1": 1, "f2": 2}
+        builder = DataclassBuilder(dataclass, **kwargs)
+        rates[f"{size} fields"] = {
+            "create": rate(lambda d=dataclass, k=kwargs: DataclassBuilder(d, **k)),
+            "build": rate(lambda b=builder: build(b)),
+        }
+        memory[f"{size} fields"] = {
+            "DataclassBuilder": bytes_per_instance(
+                lambda d=dataclass, k=kwargs: DataclassBuilder(d, **k), count=2_000
+            )
+        }
+    report("builders with 3 fields set", rates, "calls/s")
+    report("builders with 3 fields set", memory, "bytes/instance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""Benchmark suite comparing builders against constructing dataclasses directly.
+
+Measures creating builders, assigning fields, building, getting the fields and
+:func:`dataclass_builder.utility.update` for
+:class:`dataclass_builder.wrapper.DataclassBuilder`, classes from
+:func:`dataclass_builder.factory.dataclass_builder` and, where it applies, the
+dataclass itself.  Results are written as JSON and can be compared against a
+saved baseline to catch regressions.
+
+Run with::
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline results.json
+
+or through invoke::
+
+    invoke benchmark --baseline results.json
+"""
+
+import argparse
+import dataclasses
+import json
+import platform
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from dataclass_builder import DataclassBuilder, build, dataclass_builder, fields, update
+
+from .common import make_dataclass, rate, report, values
+
+Results = Dict[str, Dict[str, Dict[str, float]]]
+
+
+def _post_init(self: Any) -> None:
+    if self.f0 < 0:
+        raise ValueError("f0 cannot be negative")
+
+
+def cases() -> Iterator[Tuple[str, Any]]:
+    """Dataclasses to benchmark, similar to those in `tests/conftest.py`.
+
+    :return:
+        Pairs of case names and dataclasses.
+    """
+    for size in (2, 10, 100, 1000):
+        yield f"{size} fields", make_dataclass(size)
+    yield "frozen", make_dataclass(10, frozen=True)
+    factory_fields = [(f"f{i}", int) for i in range(5)] + [
+        (f"f{i}", List[int], dataclasses.field(default_factory=list))
+        for i in range(5, 10)
+    ]
+    yield "default_factory", dataclasses.make_dataclass("Factory", factory_fields)
+    yield "post_init", make_dataclass(10, namespace={"__post_init__": _post_init})
+
+
+def operations(dataclass: Any) -> Dict[str, Dict[str, Callable[[], Any]]]:
+    """Functions performing each benchmarked operation on a dataclass.
+
+    :param dataclass:
+        The dataclass to benchmark.
+
+    :return:
+        Mapping from operation names to mappings from implementation names to
+        functions performing the operation.
+    """
+    kwargs = values(dataclass)
+    items = list(kwargs.items())
+    Builder = dataclass_builder(dataclass)
+    builders = {
+        "DataclassBuilder": DataclassBuilder(dataclass, **kwargs),
+        "factory": Builder(**kwargs),
+    }
+    # update fresh builders, frozen dataclasses cannot be updated
+    targets = {
+        "DataclassBuilder": DataclassBuilder(dataclass),
+        "factory": Builder(),
+    }
+
+    def assign(builder: Any) -> None:
+        for name, value in items:
+            setattr(builder, name, value)
+
+    return {
+        "create": {
+            "dataclass": lambda: dataclass(**kwargs),
+            "DataclassBuilder": lambda: DataclassBuilder(dataclass, **kwargs),
+            "factory": lambda: Builder(**kwargs),
+        },
+        "assign": {
+            label: (lambda b=builder: assign(b)) for label, builder in builders.items()
+        },
+        "build": {
+            label: (lambda b=builder: build(b)) for label, builder in builders.items()
+        },
+        "fields": {
+            label: (lambda b=builder: fields(b)) for label, builder in builders.items()
+        },
+        "update": {
+            label: (lambda b=builder, t=targets[label]: update(t, b))
+            for label, builder in builders.items()
+        },
+    }
+
+
+def run(repeat: int = 5) -> Results:
+    """Run the benchmarks.
+
+    :param repeat:
+        Number of timing runs of each benchmark, the fastest is reported.
+
+    :return:
+        Calls per second, by case, operation and implementation.
+    """
+    results: Results = {}
+    for case, dataclass in cases():
+        results[case] = {
+            operation: {label: rate(func, repeat) for label, func in funcs.items()}
+            for operation, funcs in operations(dataclass).items()
+        }
+        report(case, results[case], "calls/s")
+    return results
+
+
+def compare(
+    results: Results, baseline: Results, threshold: float
+) -> List[Tuple[str, float]]:
+    """Find the benchmarks that are slower than a baseline.
+
+    :param results:
+        Results of the current run.
+    :param baseline:
+        Results of a previous run, benchmarks missing from either are ignored.
+    :param threshold:
+        Fraction by which a benchmark must be slower to be a regression.
+
+    :return:
+        The name and ratio to the baseline of each regressed benchmark.
+    """
+    regressions = []
+    for case, operations_ in results.items():
+        for operation, rates in operations_.items():
+            for label, value in rates.items():
+                try:
+                    old = baseline[case][operation][label]
+                except KeyError:
+                    continue
+                ratio = value / old
+                if ratio < 1.0 - threshold:
+                    regressions.append((f"{case}/{operation}/{label}", ratio))
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark suite.
+
+    :return:
+        Exit status, 1 if any benchmark regressed from the baseline.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    parser.add_argument("-o", "--output", help="file to write JSON results to")
+    parser.add_argument("-b", "--baseline", help="JSON results to compare against")
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="slowdown relative to the baseline that is a regression",
+    )
+    parser.add_argument(
+        "-q", "--quick", action="store_true", help="time each benchmark only once"
+    )
+    args = parser.parse_args(argv)
+    results = run(repeat=1 if args.quick else 5)
+    if args.output:
+        with open(args.output, "w") as outfile:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": results,
+                },
+                outfile,
+                indent=2,
+            )
+    if args.baseline:
+        with open(args.baseline) as infile:
+            baseline = json.load(infile)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for name, ratio in regressions:
+            print(f"regression: {name} at {ratio:.0%} of baseline")
+        if regressions:
+            return 1
+        print("no regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
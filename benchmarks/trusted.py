@@ -0,0 +1,50 @@
+"""Builds per second of normal and trusted builds.
+
+Run with::
+
+    python -m benchmarks.trusted
+"""
+
+import dataclasses
+from typing import Any, Dict, List
+
+from dataclass_builder import DataclassBuilder, build, dataclass_builder
+
+from .common import make_dataclass, rate, report, values
+
+
+def _post_init(self: Any) -> None:
+    if self.f0 < 0:
+        raise ValueError("f0 cannot be negative")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    factory_fields = [(f"f{i}", int) for i in range(5)] + [
+        (f"f{i}", List[int], dataclasses.field(default_factory=list))
+        for i in range(5, 10)
+    ]
+    cases = {
+        "10 fields": make_dataclass(10),
+        "100 fields": make_dataclass(100),
+        "frozen": make_dataclass(10, frozen=True),
+        "slots": make_dataclass(10, slots=True),
+        "factory": dataclasses.make_dataclass("Factory", factory_fields),
+        "post_init": make_dataclass(10, namespace={"__post_init__": _post_init}),
+    }
+    rows: Dict[str, Dict[str, float]] = {}
+    for case, dataclass in cases.items():
+        kwargs = values(dataclass, optional=False)
+        wrapper = DataclassBuilder(dataclass, **kwargs)
+        builder = dataclass_builder(dataclass)(**kwargs)
+        rows[case] = {
+            "wrapper": rate(lambda w=wrapper: build(w)),
+            "wrapper trusted": rate(lambda w=wrapper: build(w, trusted=True)),
+            "factory": rate(builder.build),
+            "factory trusted": rate(lambda b=builder: b.build(trusted=True)),
+        }
+    report("normal and trusted build", rows, "builds/s")
+
+
+if __name__ == "__main__":
+    main()
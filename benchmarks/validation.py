@@ -0,0 +1,52 @@
+"""Field assignments per second with and without type validation.
+
+Each builder is assigned a value to a field of a simple type and to a field
+of a generic type, a list of ten integers, which checks every item.
+
+Run with::
+
+    python -m benchmarks.validation
+"""
+
+import dataclasses
+from typing import Dict, List, Optional
+
+from dataclass_builder import DataclassBuilder, dataclass_builder
+
+from .common import rate, report
+
+
+@dataclasses.dataclass
+class Record:
+    """Dataclass with fields of simple and generic types."""
+
+    id: int
+    values: List[int]
+    note: Optional[str] = None
+
+
+def main() -> None:
+    """Run the benchmark."""
+    values = list(range(10))
+    rows: Dict[str, Dict[str, float]] = {}
+    for label, validate in (("off", False), ("on", True)):
+        builders = {
+            "wrapper": DataclassBuilder(Record, validate=validate),
+            "factory": dataclass_builder(Record, validate=validate)(),
+            "factory slots": dataclass_builder(
+                Record, slots=True, validate=validate
+            )(),
+        }
+        rows[f"int {label}"] = {
+            name: rate(lambda builder=builder: setattr(builder, "id", 1))
+            for name, builder in builders.items()
+        }
+        rows[f"List[int] {label}"] = {
+            name: rate(lambda builder=builder: setattr(builder, "values", values))
+            for name, builder in builders.items()
+        }
+    report("field assignment", rows, "assignments/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,39 @@
 """
 
 from .__version__ import __version__
-from ._common import MISSING, OPTIONAL, REQUIRED
-from .exceptions import DataclassBuilderError, MissingFieldError, UndefinedFieldError
-from .factory import dataclass_builder
-from .utility import build, fields, update
+from ._common import MISSING, OPTIONAL, REQUIRED, Lazy, lazy
+from .assembler import Assembler, ConcurrentAssembler
+from .batch import BatchBuilder
+from .exceptions import (
+    DataclassBuilderError,
+    FieldTypeError,
+    MissingFieldError,
+    UndefinedFieldError,
+)
+from .factory import (
+    BuilderCacheInfo,
+    builder_cache_info,
+    clear_builder_cache,
+    dataclass_builder,
+    generate_builder_source,
+)
+from .instrumentation import AggregatingSink, MetricsSink, attach_sink, detach_sink
+from .interning import InternCacheInfo, intern_builds, intern_cache_info, stop_interning
+from .pool import BuilderPool
+from .utility import (
+    RowError,
+    abuild,
+    build,
+    build_many,
+    build_parallel,
+    changed_fields,
+    clone,
+    fields,
+    is_complete,
+    missing,
+    reset,
+    update,
+)
 from .wrapper import DataclassBuilder
 
 __all__ = [
@@ -15,12 +44,40 @@ __all__ = [
     "DataclassBuilderError",
     "UndefinedFieldError",
     "MissingFieldError",
+    "FieldTypeError",
     "DataclassBuilder",
+    "BatchBuilder",
+    "BuilderPool",
+    "Assembler",
+    "ConcurrentAssembler",
     "REQUIRED",
     "OPTIONAL",
     "MISSING",
+    "lazy",
+    "Lazy",
     "dataclass_builder",
+    "generate_builder_source",
+    "builder_cache_info",
+    "clear_builder_cache",
+    "BuilderCacheInfo",
+    "intern_builds",
+    "stop_interning",
+    "intern_cache_info",
+    "InternCacheInfo",
     "build",
     "fields",
     "update",
+    "changed_fields",
+    "clone",
+    "is_complete",
+    "missing",
+    "reset",
+    "abuild",
+    "build_parallel",
+    "build_many",
+    "RowError",
+    "MetricsSink",
+    "AggregatingSink",
+    "attach_sink",
+    "detach_sink",
 ]
@@ -0,0 +1,90 @@
+"""Generate the source code of builder modules ahead of time.
+
+Specialized builder classes are normally generated at runtime by
+:func:`dataclass_builder.factory.dataclass_builder`.  This command writes the
+same builder class to a Python module so it can be imported instead.
+
+.. code-block:: console
+
+    $ python -m dataclass_builder package.module:Point -o point_builder.py
+
+"""
+
+import argparse
+import importlib
+import sys
+from typing import Any, List, Optional
+
+from .factory import generate_builder_source
+
+__all__ = ["main"]
+
+
+def _import_dataclass(path: str) -> Any:
+    """Import an object given as 'module:qualname'.
+
+    :param path:
+        Module and qualified name of the object separated by a colon.
+
+    :return:
+        The imported object.
+
+    :raises ValueError:
+        If `path` is not of the form 'module:qualname'.
+    """
+    module, sep, qualname = path.partition(":")
+    if not sep or not module or not qualname:
+        raise ValueError(f"'{path}' is not of the form 'module:qualname'")
+    imported = importlib.import_module(module)
+    for attribute in qualname.split("."):
+        imported = getattr(imported, attribute)
+    return imported
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the builder source generator.
+
+    :param argv:
+        Command line arguments, excluding the program name.  Defaults to
+        :data:`sys.argv`.
+
+    :return:
+        Exit status of the program.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m dataclass_builder",
+        description="Generate the source code of a module with a builder class.",
+    )
+    parser.add_argument(
+        "dataclass", help="dataclass to create the builder for, as module:qualname"
+    )
+    parser.add_argument("--name", help="name of the builder class")
+    parser.add_argument(
+        "--slots", action="store_true", help="give the builder class __slots__"
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="check the types of the values assigned to fields",
+    )
+    parser.add_argument(
+        "-o", "--output", help="file to write the module to, default is stdout"
+    )
+    args = parser.parse_args(argv)
+    try:
+        dataclass = _import_dataclass(args.dataclass)
+        source = generate_builder_source(
+            dataclass, name=args.name, slots=args.slots, validate=args.validate
+        )
+    except (ImportError, AttributeError, TypeError, ValueError) as error:
+        parser.error(str(error))
+    if args.output is None:
+        sys.stdout.write(source)
+    else:
+        with open(args.output, "w") as outfile:
+            outfile.write(source)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,41 @@
 """Common utilities."""
 
 import dataclasses
-from typing import Any, Mapping
+import inspect
+import sys
+import typing
+import weakref
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
 
 __all__ = [
     "REQUIRED",
     "OPTIONAL",
     "MISSING",
+    "Lazy",
+    "lazy",
     "_is_settable",
     "_is_required",
     "_is_optional",
     "_settable_fields",
     "_required_fields",
     "_optional_fields",
+    "_DataclassInfo",
+    "_dataclass_info",
+    "_FieldTypes",
+    "_field_types",
 ]
 
 
@@ -29,6 +52,10 @@ class _RequiredType:
         # return the original
         return self
 
+    def __reduce__(self) -> str:
+        # pickled by reference so unpickling gives the singleton
+        return "REQUIRED"
+
     def __repr__(self) -> str:
         return "REQUIRED"
 
@@ -44,6 +71,10 @@ class _OptionalType:
         # sentinel object so copy will break it
         return self
 
+    def __reduce__(self) -> str:
+        # pickled by reference so unpickling gives the singleton
+        return "OPTIONAL"
+
     def __repr__(self) -> str:
         return "OPTIONAL"
 
@@ -64,6 +95,10 @@ class _MissingType:
         # return the original
         return self
 
+    def __reduce__(self) -> str:
+        # pickled by reference so unpickling gives the singleton
+        return "MISSING"
+
     def __repr__(self) -> str:
         return "MISSING"
 
@@ -81,6 +116,71 @@ OPTIONAL = _OptionalType()
 MISSING = _MissingType()
 
 
+class Lazy:
+    """Field value computed by a function the first time it is needed.
+
+    Builders resolve lazy values when they are built, after checking that all
+    required fields are assigned, so nothing is computed for builds that fail.
+    The value is kept after it has been computed, so builders that share a
+    lazy value, such as copies and clones, only compute it once.  Create these with
+    :func:`lazy`.
+    """
+
+    __slots__ = ("__func", "__value")
+
+    # Set once any lazy value has been created, until then builders skip
+    # looking for lazy values when they are built.
+    _used = False
+
+    def __init__(self, func: Callable[[], Any]) -> None:
+        """
+        :param func:
+            Function, taking no arguments, that computes the value.
+        """
+        Lazy._used = True
+        self.__func: Optional[Callable[[], Any]] = func
+        self.__value: Any = None
+
+    @property
+    def resolved(self) -> bool:
+        """True if the value has been computed."""
+        return self.__func is None
+
+    def resolve(self) -> Any:
+        """Get the value, computing it if this is the first time.
+
+        :return:
+            The value returned by the function.
+        """
+        func = self.__func
+        if func is not None:
+            self.__value = func()
+            self.__func = None
+        return self.__value
+
+    def __repr__(self) -> str:
+        if self.__func is None:
+            return f"lazy(resolved={self.__value!r})"
+        return f"lazy({self.__func!r})"
+
+
+def lazy(func: Callable[[], Any]) -> Lazy:
+    """Create a field value that is only computed when a builder is built.
+
+    Assign the result to a field of a builder, the function is called when the
+    builder is built, unless a required field is missing, and its result used
+    as the value of the field.  Until then the builder's `repr` shows the
+    function instead of calling it.
+
+    :param func:
+        Function, taking no arguments, that computes the value of the field.
+
+    :return:
+        A :class:`Lazy` value that can be assigned to a field.
+    """
+    return Lazy(func)
+
+
 def _is_settable(field: "dataclasses.Field[Any]") -> bool:
     """Determine if the given :class:`dataclasses.Field` is settable.
 
@@ -125,6 +225,546 @@ def _is_optional(field: "dataclasses.Field[Any]") -> bool:
     )
 
 
+class _DataclassInfo:
+    """Classification of the fields of a :func:`dataclasses.dataclass`.
+
+    The fields are walked exactly once, at construction, and the result is
+    shared by every builder of the dataclass.  Use :func:`_dataclass_info`
+    instead of constructing this directly so the cached instance is reused.
+
+    .. note::
+
+        Instances must not hold a reference to the dataclass itself, they are
+        the values of a weak keyed cache whose keys are the dataclasses.
+    """
+
+    __slots__ = (
+        "settable",
+        "required",
+        "optional",
+        "names",
+        "index",
+        "defaults",
+        "arguments",
+        "sentinels",
+        "bits",
+        "required_mask",
+        "trusted_constructor",
+        "interner",
+        "positional",
+        "keywords",
+    )
+
+    def __init__(self, dataclass: Any) -> None:
+        """
+        :param dataclass:
+            The :func:`dataclasses.dataclass` to classify the fields of.
+        """
+        settable: Dict[str, "dataclasses.Field[Any]"] = {}
+        required: Dict[str, "dataclasses.Field[Any]"] = {}
+        optional: Dict[str, "dataclasses.Field[Any]"] = {}
+        for field in dataclasses.fields(dataclass):
+            if _is_settable(field):
+                settable[field.name] = field
+            if _is_required(field):
+                required[field.name] = field
+            if _is_optional(field):
+                optional[field.name] = field
+        self.settable: Mapping[str, "dataclasses.Field[Any]"] = MappingProxyType(
+            settable
+        )
+        """Settable fields, in the same order as the dataclass."""
+        self.required: Mapping[str, "dataclasses.Field[Any]"] = MappingProxyType(
+            required
+        )
+        """Required fields, in the same order as the dataclass."""
+        self.optional: Mapping[str, "dataclasses.Field[Any]"] = MappingProxyType(
+            optional
+        )
+        """Optional fields, in the same order as the dataclass."""
+        self.names: Tuple[str, ...] = tuple(settable)
+        """Names of the settable fields, in the same order as the dataclass."""
+        self.index: Mapping[str, int] = MappingProxyType(
+            {name: i for i, name in enumerate(self.names)}
+        )
+        """Position of each settable field in :attr:`names`."""
+        self.sentinels: Mapping[str, Any] = MappingProxyType(
+            {name: REQUIRED if name in required else OPTIONAL for name in self.names}
+        )
+        """Value of each settable field before it is assigned."""
+        self.bits: Mapping[str, int] = MappingProxyType(
+            {name: 1 << i for i, name in enumerate(self.names)}
+        )
+        """Bit of each settable field in a set field mask."""
+        self.required_mask: int = sum(self.bits[name] for name in required)
+        """Set field mask with the bit of every required field set."""
+        self.defaults: Optional[Mapping[str, Any]] = _init_defaults(
+            dataclass, [name for name in self.names if name not in required]
+        )
+        """
+        Default argument of the dataclass's `__init__` method for each settable
+        field that is not required, or None if they could not all be found.
+
+        Passing one of these explicitly is identical to omitting the argument,
+        this includes fields with a `default_factory` where `__init__` uses a
+        sentinel default and calls the factory itself.
+        """
+        self.arguments: Optional[Tuple[Any, ...]] = None
+        """
+        Argument of the dataclass's `__init__` method for each settable field
+        while it is unset, in the same order as :attr:`names`.  This is the
+        default from :attr:`defaults`, or REQUIRED for required fields, and is
+        None if :attr:`defaults` is.
+        """
+        self.positional: Optional[Tuple[int, ...]] = None
+        """
+        Positions in :attr:`names` of the fields that can be passed to the
+        dataclass's `__init__` method positionally, in the order it takes them,
+        or None if they must all be passed by keyword.  This requires every
+        field that is not required to have a known default, see
+        :attr:`defaults`.
+        """
+        self.keywords: Tuple[int, ...] = ()
+        """
+        Positions in :attr:`names` of the keyword only fields, which are passed
+        by keyword when the others are passed positionally.
+        """
+        if self.defaults is not None:
+            self.arguments = tuple(
+                self.defaults.get(name, REQUIRED) for name in self.names
+            )
+            layout = _init_layout(dataclass, self.names)
+            if layout is not None:
+                self.positional, self.keywords = layout
+        self.trusted_constructor: Optional[Callable[..., Any]] = None
+        """Constructor used by :meth:`build_trusted`, created on first use."""
+        self.interner: Optional[Callable[[], Any]] = None
+        """
+        Weak reference to the interner of built instances, or None if builds
+        are not interned, see :mod:`dataclass_builder.interning`.  The
+        interner is owned by the dataclass as it holds its instances.
+        """
+
+    def __copy__(self) -> "_DataclassInfo":
+        # immutable and shared by all builders of the dataclass
+        return self
+
+    def __deepcopy__(self, memo: Any = None) -> "_DataclassInfo":
+        # immutable and shared by all builders of the dataclass
+        return self
+
+    def missing(self, mask: int) -> Mapping[str, "dataclasses.Field[Any]"]:
+        """Get the required fields that are not set in a set field mask.
+
+        :param mask:
+            Set field mask, with the bit of each assigned field set.
+
+        :return:
+            A mapping from field names to :class:`dataclasses.Field`'s of the
+            required fields that are missing from the `mask`, in the same order
+            as the dataclass.
+        """
+        if mask & self.required_mask == self.required_mask:
+            return {}
+        return {
+            name: field
+            for name, field in self.required.items()
+            if not mask & self.bits[name]
+        }
+
+    def positions(self, mask: int) -> List[int]:
+        """Get the positions of the fields that are set in a set field mask.
+
+        :param mask:
+            Set field mask, with the bit of each assigned field set.
+
+        :return:
+            Positions in :attr:`names` of the fields set in the `mask`, in
+            ascending order.
+        """
+        positions = []
+        while mask:
+            # only visits the set bits, lowest first
+            bit = mask & -mask
+            positions.append(bit.bit_length() - 1)
+            mask ^= bit
+        return positions
+
+    def assigned(self, mask: int, order: Tuple[str, ...] = ()) -> Tuple[str, ...]:
+        """Get the names of the fields that are set in a set field mask.
+
+        Builders only record the order of their fields once a field is
+        assigned before one that comes after it in the dataclass, fields
+        assigned in field order are given by the `mask` alone.
+
+        :param mask:
+            Set field mask, with the bit of each assigned field set.
+        :param order:
+            Names of fields set in the `mask`, in the order they were
+            assigned.  The other fields set in the `mask` were assigned after
+            these, in the same order as the dataclass.
+
+        :return:
+            Names of the fields set in the `mask`, in the order they were
+            assigned.
+        """
+        names = self.names
+        bits = self.bits
+        assigned = list(order)
+        for name in order:
+            mask ^= bits[name]
+        while mask:
+            bit = mask & -mask
+            assigned.append(names[bit.bit_length() - 1])
+            mask ^= bit
+        return tuple(assigned)
+
+    def build_trusted(self, dataclass: Any, values: Sequence[Any]) -> Any:
+        """Build a dataclass without calling its `__init__` method.
+
+        The instance is created with :code:`object.__new__` and its fields are
+        assigned directly, as the generated `__init__` would, including
+        defaults and default factories of unset fields.  `__post_init__` is
+        called if the dataclass defines it.  Dataclasses that don't use a
+        generated `__init__` or have init-only variables are built normally.
+
+        :param dataclass:
+            The :func:`dataclasses.dataclass` these fields are from.
+        :param values:
+            A value for each of the settable fields, in the order of
+            :attr:`names`, which may be `OPTIONAL` for unset optional fields.
+
+        :return:
+            An instance of the `dataclass`.
+        """
+        constructor = self.trusted_constructor
+        if constructor is None:
+            constructor = self.trusted_constructor = _trusted_constructor(
+                dataclass, self.names
+            )
+        return constructor(dataclass, *values)
+
+
+# copied (and modified) from dataclasses._create_fn to avoid dependency on
+# private functions in dataclasses
+def _create_fn(
+    name: str,
+    args: Sequence[str],
+    body: Sequence[str],
+    env: Optional[Dict[str, Any]] = None,
+    *,
+    return_type: Any = MISSING,
+) -> Callable[..., Any]:
+    locals_: MutableMapping[str, Any] = {}
+    return_annotation = ""
+    if env is None:
+        env = {}
+    if return_type is not MISSING:
+        env["_return_type"] = return_type
+        return_annotation = "->_return_type"
+    args = ", ".join(args)
+    body = "\n".join(f" {line}" for line in body)
+    txt = f"def {name}({args}){return_annotation}:\n{body}"
+    # this is how the dataclasses module makes custom methods so it's good
+    # enough for this package
+    exec(txt, env, locals_)  # pylint: disable=exec-used
+    return cast(Callable[..., Any], locals_[name])
+
+
+def _default_source(field: Any, j: int, env: Dict[str, Any]) -> str:
+    # expression giving the default of the j-th field, empty if it has none
+    if field.default is not dataclasses.MISSING:
+        env[f"_default_{j}"] = field.default
+        return f"_default_{j}"
+    if field.default_factory is not dataclasses.MISSING:
+        env[f"_factory_{j}"] = field.default_factory
+        return f"_factory_{j}()"
+    return ""
+
+
+def _assignment_source(name: str, value: str, frozen: bool) -> str:
+    # frozen dataclasses reject assignment so bypass their __setattr__
+    if frozen:
+        return f"_setattr(_self, {name!r}, {value})"
+    return f"_self.{name} = {value}"
+
+
+def _has_generated_init(dataclass: Any) -> bool:
+    # dataclasses keeps an __init__ defined in the class body, and creates its
+    # own with exec, so only the generated one has no source file
+    init = vars(dataclass).get("__init__")
+    code = getattr(init, "__code__", None)
+    return code is not None and code.co_filename == "<string>"
+
+
+def _trusted_constructor(
+    dataclass: Any, names: Sequence[str]
+) -> Callable[..., Any]:
+    """Create a function that builds a dataclass without calling `__init__`.
+
+    :param dataclass:
+        The :func:`dataclasses.dataclass` to create the constructor for, it is
+        not referenced by the constructor.
+    :param names:
+        Names of the settable fields of the `dataclass`, in order.
+
+    :return:
+        A function taking the `dataclass` followed by a value for each of the
+        `names`, `OPTIONAL` for unset optional fields, and returning an
+        instance of the `dataclass`.
+    """
+    params = getattr(dataclass, "__dataclass_params__", None)
+    initvars = [
+        field
+        for field in getattr(dataclass, "__dataclass_fields__", {}).values()
+        if field._field_type is dataclasses._FIELD_INITVAR  # type: ignore
+    ]
+    if (
+        params is None
+        or not params.init
+        or not _has_generated_init(dataclass)
+        or initvars
+        or dataclass.__new__ is not object.__new__
+    ):
+        # only a generated __init__ is known to just assign fields
+
+        def _build(dataclass: Any, *values: Any) -> Any:
+            return dataclass(
+                **{
+                    name: value
+                    for name, value in zip(names, values)
+                    if value is not OPTIONAL
+                }
+            )
+
+        return _build
+
+    env: Dict[str, Any] = {
+        "OPTIONAL": OPTIONAL,
+        "_new": object.__new__,
+        "_setattr": object.__setattr__,
+    }
+    args = ["_cls"] + [f"_{i}" for i in range(len(names))]
+    body = ["_self = _new(_cls)"]
+    index = {name: i for i, name in enumerate(names)}
+    for j, field in enumerate(dataclasses.fields(dataclass)):
+        default = _default_source(field, j, env)
+        if field.init:
+            value = f"_{index[field.name]}"
+            if default:
+                body += [f"if {value} is OPTIONAL:", f"    {value} = {default}"]
+        elif field.default_factory is not dataclasses.MISSING or (
+            default and field.name in vars(dataclass).get("__slots__", ())
+        ):
+            value = default
+        else:
+            # like __init__, leave the default to the class attribute, if any
+            continue
+        body.append(_assignment_source(field.name, value, params.frozen))
+    if hasattr(dataclass, "__post_init__"):
+        body.append("_self.__post_init__()")
+    body.append("return _self")
+    return _create_fn("_build", args, body, env)
+
+
+def _init_defaults(
+    dataclass: Any, names: Iterable[str]
+) -> Optional[Mapping[str, Any]]:
+    """Get the default arguments of a dataclass's `__init__` method.
+
+    :param dataclass:
+        The :func:`dataclasses.dataclass` to inspect the `__init__` method of.
+    :param names:
+        Names of the parameters to get the default arguments for.
+
+    :return:
+        A mapping from each of the `names` to the default argument of the
+        parameter with the same name, or None if the signature of `__init__`
+        could not be inspected or one of the `names` has no default.
+    """
+    try:
+        parameters = inspect.signature(dataclass.__init__).parameters
+    except (TypeError, ValueError):  # pragma: no cover
+        return None
+    defaults = {}
+    for name in names:
+        parameter = parameters.get(name)
+        if parameter is None or parameter.default is inspect.Parameter.empty:
+            return None
+        defaults[name] = parameter.default
+    return MappingProxyType(defaults)
+
+
+def _init_layout(
+    dataclass: Any, names: Sequence[str]
+) -> Optional[Tuple[Tuple[int, ...], Tuple[int, ...]]]:
+    """Get how the fields of a dataclass are passed to its `__init__` method.
+
+    :param dataclass:
+        The :func:`dataclasses.dataclass` to inspect the `__init__` method of.
+    :param names:
+        Names of the settable fields of the `dataclass`, in order.
+
+    :return:
+        Positions in `names` of the fields taken positionally, in the order
+        they are taken, and of those taken only by keyword.  None if the
+        parameters of `__init__` are not exactly the `names`, or it takes them
+        positionally in a different order.
+    """
+    try:
+        parameters = list(inspect.signature(dataclass.__init__).parameters.values())
+    except (TypeError, ValueError):  # pragma: no cover
+        return None
+    index = {name: i for i, name in enumerate(names)}
+    positional = []
+    keywords = []
+    # the first parameter is self
+    for parameter in parameters[1:]:
+        if parameter.name not in index:
+            return None
+        if parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD:
+            positional.append(index[parameter.name])
+        elif parameter.kind is inspect.Parameter.KEYWORD_ONLY:
+            keywords.append(index[parameter.name])
+        else:
+            return None
+    # fields are taken positionally in the same order as the dataclass, so
+    # without keyword only fields the values can be passed as they are
+    if len(positional) + len(keywords) != len(names) or positional != sorted(
+        positional
+    ):
+        return None
+    return tuple(positional), tuple(keywords)
+
+
+# weakly keyed so that dynamically created dataclasses can still be collected
+_INFO_CACHE: MutableMapping[Any, _DataclassInfo] = weakref.WeakKeyDictionary()
+
+
+def _dataclass_info(dataclass: Any) -> _DataclassInfo:
+    """Retrieve the cached field classification of a dataclass.
+
+    :param dataclass:
+        The :func:`dataclasses.dataclass` (or an instance of one) to get the
+        field classification for.
+
+    :return:
+        The :class:`_DataclassInfo` for the given `dataclass`, this is computed
+        on first use and then cached for as long as the `dataclass` is alive.
+    """
+    if not isinstance(dataclass, type):
+        dataclass = type(dataclass)
+    try:
+        return _INFO_CACHE[dataclass]
+    except KeyError:
+        info = _DataclassInfo(dataclass)
+        _INFO_CACHE[dataclass] = info
+        return info
+
+
+def _resolve_field_type(dataclass: Any, field: "dataclasses.Field[Any]") -> Any:
+    """Resolve the annotation of a single field of a dataclass.
+
+    String annotations, such as those of modules using
+    :code:`from __future__ import annotations`, are evaluated in the module
+    of the class that declares the field, as :func:`typing.get_type_hints`
+    does.
+
+    :param dataclass:
+        The :func:`dataclasses.dataclass` with the `field`.
+    :param field:
+        The field to resolve the type of.
+
+    :return:
+        The resolved type of the `field`, or its annotation as it is if it
+        cannot be resolved.
+    """
+    if not isinstance(field.type, str):
+        return field.type
+    for class_ in dataclass.__mro__:
+        if field.name in vars(class_).get("__annotations__", {}):
+            break
+    else:
+        class_ = dataclass
+    module = sys.modules.get(class_.__module__)
+    globalns = vars(module) if module is not None else {}
+    try:
+        # pylint: disable=eval-used
+        return eval(field.type, globalns, vars(class_))
+    except Exception:  # pylint: disable=broad-except
+        # such as a name that is not visible or an annotation that is not an
+        # expression
+        return field.type
+
+
+class _FieldTypes:
+    """Resolved types of the settable fields of a dataclass.
+
+    .. note::
+
+        Instances are kept by the dataclass itself, not a weakly keyed cache,
+        because the types can reference the dataclass, such as the type of a
+        field holding a parent of a tree.
+    """
+
+    __slots__ = ("types", "nested", "checkers")
+
+    def __init__(self, dataclass: Any) -> None:
+        """
+        :param dataclass:
+            The :func:`dataclasses.dataclass` to resolve the field types of.
+        """
+        settable = _dataclass_info(dataclass).settable
+        try:
+            hints = typing.get_type_hints(dataclass)
+        except Exception:  # pylint: disable=broad-except
+            # such as an import only done when type checking, resolve the
+            # fields one by one so only the failing ones are left unresolved
+            hints = {
+                name: _resolve_field_type(dataclass, field)
+                for name, field in settable.items()
+            }
+        self.types: Mapping[str, Any] = MappingProxyType(
+            {name: hints.get(name, field.type) for name, field in settable.items()}
+        )
+        """Type of each settable field, in the same order as the dataclass."""
+        self.nested: Mapping[str, Any] = MappingProxyType(
+            {
+                name: type_
+                for name, type_ in self.types.items()
+                if isinstance(type_, type) and dataclasses.is_dataclass(type_)
+            }
+        )
+        """Settable fields whose type is a dataclass, and that dataclass."""
+        self.checkers: Optional[Mapping[str, Callable[[Any], bool]]] = None
+        """
+        Function checking the type of a value of each settable field whose
+        type can be checked, compiled on first use by
+        :func:`dataclass_builder._validation._field_checkers`.
+        """
+
+
+_FIELD_TYPES_ATTRIBUTE = "__dataclass_field_types__"
+
+
+def _field_types(dataclass: Any) -> _FieldTypes:
+    """Retrieve the cached resolved field types of a dataclass.
+
+    :param dataclass:
+        The :func:`dataclasses.dataclass` to get the field types of.
+
+    :return:
+        The :class:`_FieldTypes` for the given `dataclass`, this is computed on
+        first use and then stored on the `dataclass`.
+    """
+    try:
+        return vars(dataclass)[_FIELD_TYPES_ATTRIBUTE]  # type: ignore
+    except KeyError:
+        field_types = _FieldTypes(dataclass)
+        setattr(dataclass, _FIELD_TYPES_ATTRIBUTE, field_types)
+        return field_types
+
+
 def _settable_fields(dataclass: Any) -> Mapping[str, "dataclasses.Field[Any]"]:
     """Retrieve all settable fields from a :func:`dataclasses.dataclass`.
 
@@ -135,11 +775,7 @@ def _settable_fields(dataclass: Any) -> Mapping[str, "dataclasses.Field[Any]"]:
         A dictionary of settable fields in the given `dataclass`. The order
         will be the same as the order in the `dataclass`.
     """
-    return {
-        field.name: field
-        for field in dataclasses.fields(dataclass)
-        if _is_settable(field)
-    }
+    return _dataclass_info(dataclass).settable
 
 
 def _required_fields(dataclass: Any) -> Mapping[str, "dataclasses.Field[Any]"]:
@@ -152,11 +788,7 @@ def _required_fields(dataclass: Any) -> Mapping[str, "dataclasses.Field[Any]"]:
         A dictionary of required fields in the given `dataclass`.
         The order will be the same as the order in the `dataclass`.
     """
-    return {
-        field.name: field
-        for field in dataclasses.fields(dataclass)
-        if _is_required(field)
-    }
+    return _dataclass_info(dataclass).required
 
 
 def _optional_fields(dataclass: Any) -> Mapping[str, "dataclasses.Field[Any]"]:
@@ -169,8 +801,4 @@ def _optional_fields(dataclass: Any) -> Mapping[str, "dataclasses.Field[Any]"]:
         A dictionary of optional fields in the given `dataclass`. The order
         will be the same as the order in the `dataclass`.
     """
-    return {
-        field.name: field
-        for field in dataclasses.fields(dataclass)
-        if _is_optional(field)
-    }
+    return _dataclass_info(dataclass).optional
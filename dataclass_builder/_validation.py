@@ -0,0 +1,235 @@
+"""Check the types of the values assigned to fields.
+
+A checker is compiled once for each field of a dataclass, from its resolved
+type, so an assignment only calls :func:`isinstance` or a few closures
+instead of inspecting the type again.
+
+Types that cannot be checked, such as :code:`typing.Any`, type variables and
+annotations that could not be resolved, accept any value.  The items of
+collections, such as lists, tuples and dictionaries, are checked, other
+generic types, such as iterators, only check the type of the value.
+"""
+
+import collections.abc
+import dataclasses
+import types
+import typing
+from inspect import isawaitable
+from typing import Any, Callable, Collection, Dict, Mapping, Optional, Tuple, Type
+
+from ._common import OPTIONAL, REQUIRED, Lazy, _field_types
+from .exceptions import FieldTypeError
+
+__all__ = ["_checker", "_field_checkers", "_check_rejected"]
+
+
+_Checker = Callable[[Any], bool]
+
+# the numeric tower of PEP 484, an int can be given where a float is expected
+_PROMOTIONS: Dict[Any, Tuple[type, ...]] = {
+    float: (float, int),
+    complex: (complex, float, int),
+}
+
+_UNION_TYPE = getattr(types, "UnionType", None)
+_LITERAL = getattr(typing, "Literal", None)
+
+
+def _origin(type_: Any) -> Any:
+    # the unsubscripted type of a generic type, or typing.Union for unions
+    if _UNION_TYPE is not None and isinstance(type_, _UNION_TYPE):
+        return typing.Union
+    origin = getattr(type_, "__origin__", None)
+    # Python 3.6 gives the generic of the typing module instead of the class
+    return getattr(origin, "__extra__", origin)
+
+
+def _classes(type_: Any) -> Optional[Tuple[type, ...]]:
+    # the classes that values of a type that is not generic are instances of
+    if type_ is None or type_ is type(None):
+        return (type(None),)
+    # typing.Any is a class from Python 3.11 but has no instances
+    if isinstance(type_, type) and type_ is not Any and _origin(type_) is None:
+        if _is_static_protocol(type_):
+            return None
+        return _PROMOTIONS.get(type_, (type_,))
+    return None
+
+
+def _is_static_protocol(type_: type) -> bool:
+    # isinstance raises for protocols that are not runtime checkable, classes
+    # implementing a protocol are not protocols themselves
+    attributes = vars(type_)
+    return bool(attributes.get("_is_protocol")) and not attributes.get(
+        "_is_runtime_protocol"
+    )
+
+
+def _checker(type_: Any) -> Optional[_Checker]:
+    """Compile a function that determines if a value is of a type.
+
+    :param type_:
+        The type, a class or a type from the :mod:`typing` module.
+
+    :return:
+        A function taking a value and returning True if it is of the type,
+        or None if the type accepts any value or cannot be checked.
+    """
+    if type_ is Any or type_ is object:
+        return None
+    if isinstance(type_, dataclasses.InitVar):
+        return _checker(getattr(type_, "type", Any))
+    supertype = getattr(type_, "__supertype__", None)
+    if supertype is not None:
+        # NewType
+        return _checker(supertype)
+    classes = _classes(type_)
+    if classes is not None:
+        if len(classes) == 1:
+            class_ = classes[0]
+            return lambda value: isinstance(value, class_)
+        return lambda value: isinstance(value, classes)
+    origin = _origin(type_)
+    args: Tuple[Any, ...] = getattr(type_, "__args__", None) or ()
+    if origin is typing.Union:
+        return _union_checker(args)
+    if _LITERAL is not None and origin is _LITERAL:
+        return lambda value: value in args
+    return _generic_checker(type_, origin, args)
+
+
+def _generic_checker(
+    type_: Any, origin: Any, args: Tuple[Any, ...]
+) -> Optional[_Checker]:
+    # check the unsubscripted type of a generic type and, for collections, its
+    # items
+    if not isinstance(origin, type):
+        return None
+    if getattr(type_, "_special", False) or not hasattr(type_, "__args__"):
+        # unsubscripted, such as typing.List
+        return lambda value: isinstance(value, origin)
+    if origin is tuple:
+        return _tuple_checker(args)
+    if issubclass(origin, collections.abc.Mapping) and len(args) == 2:
+        return _mapping_checker(origin, args[0], args[1])
+    if issubclass(origin, collections.abc.Collection) and len(args) == 1:
+        return _items_checker(origin, _checker(args[0]))
+    return lambda value: isinstance(value, origin)
+
+
+def _union_checker(args: Tuple[Any, ...]) -> Optional[_Checker]:
+    # classes are checked with a single isinstance, other types after
+    union: Tuple[type, ...] = ()
+    checkers = []
+    for arg in args:
+        arg_classes = _classes(arg)
+        if arg_classes is not None:
+            union += arg_classes
+            continue
+        checker = _checker(arg)
+        if checker is None:
+            return None
+        checkers.append(checker)
+    if not checkers:
+        return lambda value: isinstance(value, union)
+    return lambda value: isinstance(value, union) or any(
+        check(value) for check in checkers
+    )
+
+
+def _tuple_checker(args: Tuple[Any, ...]) -> _Checker:
+    # tuples of any length of one type, or of a type for each position
+    if len(args) == 2 and args[1] is Ellipsis:
+        return _items_checker(tuple, _checker(args[0]))
+    if args == ((),):
+        # Tuple[()] before Python 3.11
+        args = ()
+    items = [_checker(arg) or _any for arg in args]
+    return lambda value: (
+        isinstance(value, tuple)
+        and len(value) == len(items)
+        and all(check(item) for check, item in zip(items, value))
+    )
+
+
+def _mapping_checker(
+    origin: Type[Mapping[Any, Any]], key_type: Any, value_type: Any
+) -> _Checker:
+    # check the type of a mapping and each of its keys and values
+    keys = _checker(key_type) or _any
+    values = _checker(value_type) or _any
+    return lambda value: isinstance(value, origin) and all(
+        keys(key) and values(item) for key, item in value.items()
+    )
+
+
+def _any(value: Any) -> bool:
+    # checker of the items of containers whose item type cannot be checked
+    return True
+
+
+def _items_checker(
+    origin: Type[Collection[Any]], item: Optional[_Checker]
+) -> _Checker:
+    # check the type of a container and each of its items
+    if item is None:
+        return lambda value: isinstance(value, origin)
+    return lambda value: isinstance(value, origin) and all(map(item, value))
+
+
+def _field_checkers(dataclass: Any) -> Mapping[str, _Checker]:
+    """Retrieve the cached type checkers of the fields of a dataclass.
+
+    :param dataclass:
+        The :func:`dataclasses.dataclass` to get the checkers of.
+
+    :return:
+        A mapping from the names of the settable fields whose type can be
+        checked to the checker of the field, see :func:`_checker`.  This is
+        compiled on first use and then stored with the resolved field types
+        of the `dataclass`.
+    """
+    field_types = _field_types(dataclass)
+    checkers = field_types.checkers
+    if checkers is None:
+        compiled = {name: _checker(type_) for name, type_ in field_types.types.items()}
+        checkers = {name: check for name, check in compiled.items() if check}
+        field_types.checkers = checkers
+    return checkers
+
+
+def _type_name(type_: Any) -> str:
+    if isinstance(type_, type) and _origin(type_) is None:
+        return type_.__qualname__
+    return repr(type_).replace("typing.", "")
+
+
+def _check_rejected(dataclass: Any, name: str, value: Any) -> None:
+    """Raise an error for a value rejected by the checker of its field.
+
+    Values whose type is only known when the builder is built are accepted,
+    these are the `REQUIRED` and `OPTIONAL` constants, lazy values and
+    awaitables.
+
+    :param dataclass:
+        The :func:`dataclasses.dataclass` of the field.
+    :param name:
+        Name of the field.
+    :param value:
+        The value assigned to the field.
+
+    :raises dataclass_builder.exceptions.FieldTypeError:
+        If the `value` is not of the type of the field.
+    """
+    if value is REQUIRED or value is OPTIONAL or type(value) is Lazy:
+        return
+    if isawaitable(value):
+        return
+    type_ = _field_types(dataclass).types[name]
+    raise FieldTypeError(
+        f"field '{name}' of dataclass '{dataclass.__qualname__}' must be "
+        f"{_type_name(type_)}, not {type(value).__qualname__}",
+        dataclass,
+        name,
+        value,
+    )
@@ -0,0 +1,389 @@
+"""Assemble dataclasses from partial events that arrive in any order.
+
+Examples
+--------
+An assembler keeps a builder for each entity, identified by a key field, and
+builds the entity as soon as all of its required fields have arrived.
+
+.. testcode::
+
+    from dataclasses import dataclass
+    from dataclass_builder import Assembler
+
+    @dataclass
+    class Trade:
+        id: int
+        price: float
+        volume: int
+        venue: str = "XLON"
+
+    assembler = Assembler(Trade, key="id")
+
+.. doctest::
+
+    >>> assembler.add({"id": 7, "volume": 100}) is None
+    True
+    >>> assembler.add({"id": 8, "price": 2.5}) is None
+    True
+    >>> assembler.add({"id": 7, "price": 1.5})
+    Trade(id=7, price=1.5, volume=100, venue='XLON')
+    >>> len(assembler)
+    1
+
+"""
+
+import dataclasses
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Mapping, Optional
+
+from ._common import _dataclass_info
+from .exceptions import UndefinedFieldError
+from .factory import dataclass_builder
+
+__all__ = ["Assembler", "ConcurrentAssembler"]
+
+
+class Assembler:
+    """Route partial events to a builder per key and build complete entities.
+
+    Each event is a mapping of field names to values that includes the `key`
+    field.  The fields of the event are assigned to the builder of its key,
+    which is created on the first event for the key, and once every required
+    field has been assigned the dataclass is built and the builder discarded.
+
+    Builders are created by :func:`dataclass_builder.factory.dataclass_builder`
+    with `slots`, so each open key costs one small object and completeness is
+    checked with a single mask comparison.  Stale builders can be bounded by
+    age, with `ttl`, and by number, with `maxsize`.
+
+    This class is not thread safe.
+    """
+
+    def __init__(
+        self,
+        dataclass: Any,
+        key: str,
+        *,
+        ttl: Optional[float] = None,
+        maxsize: Optional[int] = None,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param dataclass:
+            The :func:`dataclasses.dataclass` to assemble, or a builder class
+            created for it by :func:`dataclass_builder.factory.dataclass_builder`
+            to assemble it with.
+        :param key:
+            Name of the field that identifies the entity an event belongs to,
+            every event must include it.
+        :param ttl:
+            Seconds after the last event for a key that its builder is evicted,
+            or None to keep builders until they are complete.
+        :param maxsize:
+            Maximum number of incomplete builders, the builder that has gone
+            longest without an event is evicted to make room for a new key.
+            None for no limit.
+        :param on_evict:
+            Called with the key and the incomplete builder of every evicted
+            builder.
+        :param clock:
+            Function giving the current time in seconds, used for the `ttl`.
+
+        :raises TypeError:
+            If `dataclass` is not a dataclass or a builder class.
+        :raises ValueError:
+            If `key` is not a settable field of the dataclass, or `ttl` or
+            `maxsize` is not positive.
+        """
+        if isinstance(dataclass, type) and dataclasses.is_dataclass(dataclass):
+            builder = dataclass_builder(dataclass, slots=True)
+        else:
+            builder = dataclass
+            dataclass = getattr(builder, "__dataclass__", None)
+            if not isinstance(dataclass, type) or not dataclasses.is_dataclass(
+                dataclass
+            ):
+                raise TypeError("must be called with a dataclass or builder type")
+        info = _dataclass_info(dataclass)
+        if key not in info.settable:
+            raise ValueError(
+                f"dataclass '{dataclass.__qualname__}' does not define field '{key}'"
+            )
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be at least one")
+        self.__dataclass = dataclass
+        self.__builder = builder
+        self.__settable = info.settable.keys()
+        self.__key = key
+        self.__ttl = ttl
+        self.__maxsize = maxsize
+        self.__on_evict = on_evict
+        self.__clock = clock
+        # ordered from the least to the most recently updated
+        self.__builders: "OrderedDict[Hashable, Any]" = OrderedDict()
+        # time of the last event for each key, only kept with a ttl
+        self.__updated: Dict[Hashable, float] = {}
+
+    def __len__(self) -> int:
+        """Get the number of incomplete builders."""
+        return len(self.__builders)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Determine if there is an incomplete builder for a key."""
+        return key in self.__builders
+
+    def add(self, event: Mapping[str, Any]) -> Optional[Any]:
+        """Assign the fields of an event to the builder of its key.
+
+        Builders older than the `ttl` are evicted first.
+
+        :param event:
+            Mapping of field names to values, including the `key` field.
+
+        :return:
+            The dataclass built by the builder of the key if it is now
+            complete, otherwise None.  The builder is discarded once it has
+            been built, even if building raises an exception.
+
+        :raises KeyError:
+            If the `event` does not have the `key` field.
+        :raises dataclass_builder.exceptions.UndefinedFieldError:
+            If the `event` has a field that is not settable in the dataclass,
+            in which case none of its fields are assigned.
+        """
+        key = event[self.__key]
+        if not event.keys() <= self.__settable:
+            name = next(name for name in event if name not in self.__settable)
+            raise UndefinedFieldError(
+                f"dataclass '{self.__dataclass.__name__}' does not define "
+                f"field '{name}'",
+                self.__dataclass,
+                name,
+            )
+        builders = self.__builders
+        if self.__ttl is not None:
+            now = self.__clock()
+            self.expire(now)
+            self.__updated[key] = now
+        builder = builders.get(key)
+        if builder is None:
+            if self.__maxsize is not None and len(builders) >= self.__maxsize:
+                self.__evict(next(iter(builders)))
+            builder = builders[key] = self.__builder()
+        else:
+            builders.move_to_end(key)
+        for name, value in event.items():
+            setattr(builder, name, value)
+        # pylint: disable=protected-access
+        if builder._is_complete():
+            self.discard(key)
+            return builder._build()
+        return None
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """Evict the builders that have not had an event within the `ttl`.
+
+        This is done by :meth:`add`, and only needs calling to evict builders
+        while there are no events.  It does nothing without a `ttl`.
+
+        :param now:
+            The current time, by default the time given by the `clock`.
+
+        :return:
+            Number of evicted builders.
+        """
+        if self.__ttl is None:
+            return 0
+        if now is None:
+            now = self.__clock()
+        deadline = now - self.__ttl
+        updated = self.__updated
+        count = 0
+        # the least recently updated builders are first, so stop at a fresh one
+        for key in self.__builders:
+            if updated[key] > deadline:
+                break
+            count += 1
+        for _ in range(count):
+            self.__evict(next(iter(self.__builders)))
+        return count
+
+    def discard(self, key: Hashable) -> Optional[Any]:
+        """Remove the builder of a key without evicting it.
+
+        :param key:
+            Key of the builder to remove.
+
+        :return:
+            The removed builder, or None if there was no builder for the `key`.
+        """
+        self.__updated.pop(key, None)
+        return self.__builders.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all builders without evicting them."""
+        self.__builders.clear()
+        self.__updated.clear()
+
+    def __evict(self, key: Hashable) -> None:
+        builder = self.discard(key)
+        if self.__on_evict is not None:
+            self.__on_evict(key, builder)
+
+
+class ConcurrentAssembler:
+    """An :class:`Assembler` that can be fed events by many threads at once.
+
+    Keys are spread over `stripes` assemblers by their hash, each with its own
+    lock, so threads only wait for each other when their keys share a stripe.
+    Assigning an event and building the entity it completes is atomic, so
+    every entity is built exactly once even when the events of a key arrive
+    on different threads.  No state is shared between stripes, which makes
+    this correct without the global interpreter lock as well.
+
+    Callbacks given as `on_evict` are called while the lock of the stripe of
+    the evicted key is held, they must not add events to this assembler.
+    """
+
+    def __init__(
+        self,
+        dataclass: Any,
+        key: str,
+        *,
+        stripes: int = 16,
+        ttl: Optional[float] = None,
+        maxsize: Optional[int] = None,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param dataclass:
+            The :func:`dataclasses.dataclass` to assemble, or a builder class
+            created for it by :func:`dataclass_builder.factory.dataclass_builder`
+            to assemble it with.
+        :param key:
+            Name of the field that identifies the entity an event belongs to,
+            every event must include it.
+        :param stripes:
+            Number of independently locked assemblers to spread keys over.
+        :param ttl:
+            Seconds after the last event for a key that its builder is evicted,
+            or None to keep builders until they are complete.
+        :param maxsize:
+            Maximum number of incomplete builders, at least `stripes`.  Each
+            stripe holds at most :code:`maxsize // stripes` builders and
+            evicts its own, so there are never more than `maxsize` in total,
+            but builders may be evicted before there are `maxsize` of them.
+            None for no limit.
+        :param on_evict:
+            Called with the key and the incomplete builder of every evicted
+            builder.
+        :param clock:
+            Function giving the current time in seconds, used for the `ttl`.
+
+        :raises TypeError:
+            If `dataclass` is not a dataclass or a builder class.
+        :raises ValueError:
+            If `key` is not a settable field of the dataclass, `stripes` or
+            `ttl` is not positive, or `maxsize` is less than `stripes`.
+        """
+        if stripes < 1:
+            raise ValueError("stripes must be at least one")
+        if maxsize is not None:
+            if maxsize < stripes:
+                raise ValueError("maxsize must be at least the number of stripes")
+            # rounded down so the stripes never hold more than maxsize together
+            maxsize //= stripes
+        self.__assemblers: List[Assembler] = [
+            Assembler(
+                dataclass,
+                key,
+                ttl=ttl,
+                maxsize=maxsize,
+                on_evict=on_evict,
+                clock=clock,
+            )
+            for _ in range(stripes)
+        ]
+        self.__locks = [threading.Lock() for _ in range(stripes)]
+        self.__key = key
+
+    def __len__(self) -> int:
+        """Get the number of incomplete builders.
+
+        Stripes are counted one at a time, so while events are being added
+        this may not match the number of builders at any single moment.
+        """
+        count = 0
+        for assembler, lock in zip(self.__assemblers, self.__locks):
+            with lock:
+                count += len(assembler)
+        return count
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Determine if there is an incomplete builder for a key."""
+        stripe = hash(key) % len(self.__locks)
+        with self.__locks[stripe]:
+            return key in self.__assemblers[stripe]
+
+    def add(self, event: Mapping[str, Any]) -> Optional[Any]:
+        """Assign the fields of an event to the builder of its key.
+
+        See :meth:`Assembler.add`, only the builders of the stripe of the key
+        are evicted when they are older than the `ttl`.
+
+        :param event:
+            Mapping of field names to values, including the `key` field.
+
+        :return:
+            The dataclass built by the builder of the key if it is now
+            complete, otherwise None.
+
+        :raises KeyError:
+            If the `event` does not have the `key` field.
+        :raises dataclass_builder.exceptions.UndefinedFieldError:
+            If the `event` has a field that is not settable in the dataclass,
+            in which case none of its fields are assigned.
+        """
+        stripe = hash(event[self.__key]) % len(self.__locks)
+        with self.__locks[stripe]:
+            return self.__assemblers[stripe].add(event)
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """Evict the builders that have not had an event within the `ttl`.
+
+        :param now:
+            The current time, by default the time given by the `clock`.
+
+        :return:
+            Number of evicted builders.
+        """
+        count = 0
+        for assembler, lock in zip(self.__assemblers, self.__locks):
+            with lock:
+                count += assembler.expire(now)
+        return count
+
+    def discard(self, key: Hashable) -> Optional[Any]:
+        """Remove the builder of a key without evicting it.
+
+        :param key:
+            Key of the builder to remove.
+
+        :return:
+            The removed builder, or None if there was no builder for the `key`.
+        """
+        stripe = hash(key) % len(self.__locks)
+        with self.__locks[stripe]:
+            return self.__assemblers[stripe].discard(key)
+
+    def clear(self) -> None:
+        """Remove all builders without evicting them."""
+        for assembler, lock in zip(self.__assemblers, self.__locks):
+            with lock:
+                assembler.clear()
@@ -0,0 +1,357 @@
+"""Build many instances of a :func:`dataclasses.dataclass` from columns.
+
+This module provides a builder that stores each field as a column of values,
+one per instance, and builds all of the instances at once.
+
+Examples
+--------
+A batch builder is created for a dataclass and a number of instances.
+
+.. testcode::
+
+    from dataclasses import dataclass
+    from dataclass_builder import BatchBuilder, build
+
+    @dataclass
+    class Point:
+        x: float
+        y: float
+        w: float = 1.0
+
+Whole columns are assigned at once, these can be any sequence with one value
+per instance, such as lists or NumPy arrays.
+
+.. doctest::
+
+    >>> batch = BatchBuilder(Point, 3)
+    >>> batch.x = [1.0, 2.0, 3.0]
+    >>> batch.y = [4.0, 5.0, 6.0]
+    >>> build(batch)
+    [Point(x=1.0, y=4.0, w=1.0), Point(x=2.0, y=5.0, w=1.0), Point(x=3.0, y=6.0, w=1.0)]
+
+Columns must have a value for every instance.
+
+.. doctest::
+
+    >>> batch.w = [1.0, 2.0]
+    Traceback (most recent call last):
+    ...
+    ValueError: column 'w' has 2 values but the batch has 3 instances
+
+.. note::
+
+    The values of a column are passed to the dataclass as is, iterating a NumPy
+    array gives NumPy scalars so use :code:`array.tolist()` when Python values
+    are desired.
+
+"""
+
+import dataclasses
+import weakref
+from copy import copy, deepcopy
+from itertools import repeat
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    MutableMapping,
+    Tuple,
+)
+
+from ._common import OPTIONAL, REQUIRED, _create_fn, _dataclass_info
+from .exceptions import MissingFieldError, UndefinedFieldError
+
+__all__ = ["BatchBuilder"]
+
+
+# Row constructors do not reference the dataclass, it is passed as the first
+# argument, so this cache does not keep dataclasses alive.
+_ROW_CONSTRUCTORS: MutableMapping[
+    Any, Dict[Tuple[str, ...], Callable[..., Any]]
+] = weakref.WeakKeyDictionary()
+
+
+def _row_constructor(dataclass: Any, names: Tuple[str, ...]) -> Callable[..., Any]:
+    """Get a function that builds a dataclass from positional field values.
+
+    :param dataclass:
+        The :func:`dataclasses.dataclass` that will be built.
+    :param names:
+        Names of the fields that will be given, in the order they will be
+        given.
+
+    :return:
+        A function taking the `dataclass` followed by a value for each of the
+        `names` and returning an instance of the `dataclass`.
+    """
+    constructors = _ROW_CONSTRUCTORS.setdefault(dataclass, {})
+    try:
+        return constructors[names]
+    except KeyError:
+        args = ["_dataclass"] + [f"_{i}" for i in range(len(names))]
+        kwargs = ", ".join(f"{name}=_{i}" for i, name in enumerate(names))
+        constructor = _create_fn("_row", args, [f"return _dataclass({kwargs})"])
+        constructors[names] = constructor
+        return constructor
+
+
+class BatchBuilder:
+    """Build many instances of a dataclass from columns of field values.
+
+    This works like :class:`dataclass_builder.wrapper.DataclassBuilder` except
+    each field is assigned a column, a sequence with one value per instance,
+    and :func:`dataclass_builder.utility.build` returns a list of instances.
+    Required fields are checked once per column instead of once per instance.
+
+    .. warning::
+
+        Because this class overrides attribute assignment when extending
+        it care must be taken to only use private or "dunder" attributes
+        and methods.
+
+    """
+
+    # no fields until __init__ assigns the ones of the dataclass
+    __bits: Mapping[str, int] = {}
+
+    def __init__(self, dataclass: Any, size: int, **kwargs: Any):
+        r"""
+        :param dataclass:
+            The dataclass that should be built by the builder instance.
+        :param size:
+            Number of instances of the `dataclass` to build, each column must
+            have this many values.
+        :param \*\*kwargs:
+            Optionally initialize columns during initialization of the builder.
+            These can be changed later and will raise TypeError if they are not
+            part of the `dataclass`'s `__init__` method.
+
+        :raises TypeError:
+            If `dataclass` is not a dataclass.
+            This is decided via :func:`dataclasses.is_dataclass`.
+        :raises ValueError:
+            If `size` is negative or one of the columns does not have `size`
+            values.
+        :raises dataclass_builder.exceptions.UndefinedFieldError:
+            If you try to assign to a field that is not part of the
+            `dataclass`'s `__init__`.
+        :raises dataclass_builder.exceptions.MissingFieldError:
+            If :func:`build` is called on this builder before all non default
+            fields of the `dataclass` are assigned.
+        """
+        if not dataclasses.is_dataclass(dataclass):
+            raise TypeError("must be called with a dataclass type")
+        if size < 0:
+            raise ValueError("size of a batch cannot be negative")
+        self.__dataclass: Any = dataclass
+        self.__size = size
+        self.__info = _dataclass_info(dataclass)
+        self.__bits = self.__info.bits
+        self.__mask = 0
+        self.__dict__.update(self.__info.sentinels)
+        for key, value in kwargs.items():
+            if key not in self.__info.settable:
+                raise TypeError(
+                    f"__init__() got an unexpected keyword argument '{key}'"
+                )
+            setattr(self, key, value)
+
+    def __setattr__(self, item: str, value: Any) -> None:
+        """Set a field column, or an object attribute if it is private.
+
+        :param item:
+            Name of the dataclass field or private/"dunder" attribute to set.
+        :param value:
+            Column of values for the dataclass field, or value of the
+            private/"dunder" attribute.
+
+        :raises ValueError:
+            If `item` is a field and `value` does not have a value for each
+            instance of the batch.
+        :raises dataclass_builder.exceptions.UndefinedFieldError:
+            If `item` is not initialisable in the underlying dataclass.  If
+            `item` is private (begins with an underscore) or is a "dunder" then
+            this exception will not be raised.
+        """
+        bit = self.__bits.get(item)
+        if bit is not None:
+            dict_ = self.__dict__
+            if value is REQUIRED or value is OPTIONAL:
+                dict_["_BatchBuilder__mask"] &= ~bit
+                order = dict_.get("_BatchBuilder__order", ())
+                if item in order:
+                    dict_["_BatchBuilder__order"] = tuple(
+                        name for name in order if name != item
+                    )
+            elif len(value) != self.__size:
+                raise ValueError(
+                    f"column '{item}' has {len(value)} values but the batch "
+                    f"has {self.__size} instances"
+                )
+            else:
+                mask = dict_["_BatchBuilder__mask"]
+                if mask > bit and not mask & bit:
+                    # assigned before a field after it, so the order is kept
+                    dict_["_BatchBuilder__order"] = self.__info.assigned(
+                        mask, dict_.get("_BatchBuilder__order", ())
+                    ) + (item,)
+                dict_["_BatchBuilder__mask"] = mask | bit
+            dict_[item] = value
+        elif item.startswith("_"):
+            self.__dict__[item] = value
+        else:
+            raise UndefinedFieldError(
+                f"dataclass '{self.__dataclass.__name__}' does not define "
+                f"field '{item}'",
+                self.__dataclass,
+                item,
+            )
+
+    if TYPE_CHECKING:
+        # tells type checking that it should ignore attribute access
+        def __getattr__(self, item: str) -> Any:
+            return self.__getattribute__(item)
+
+    @property
+    def __dataclass__(self) -> Any:
+        """The dataclass this builder builds."""
+        return self.__dataclass
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __repr__(self) -> str:
+        """Print a representation of the builder.
+
+        >>> BatchBuilder(Point, 2, x=[4.0, 5.0])
+        BatchBuilder(Point, 2, x=[4.0, 5.0])
+
+        :return:
+            String representation that can be used to construct this builder
+            instance.
+        """
+        args = [self.__dataclass.__qualname__, str(self.__size)]
+        for name in self.__info.names:
+            value = getattr(self, name)
+            if value is not REQUIRED and value is not OPTIONAL:
+                args.append(f"{name}={repr(value)}")
+        return f'{self.__class__.__qualname__}({", ".join(args)})'
+
+    def _build(self, trusted: bool = False) -> List[Any]:
+        """Build the underlying dataclasses using the columns of this builder.
+
+        :param trusted:
+            Set to True to skip the `__init__` method of the dataclass and
+            assign the fields of the new instances directly, see
+            :func:`dataclass_builder.utility.build`.
+
+        :return list:
+            A list of instances of the dataclass given in :func:`__init__`, one
+            for each position in the columns.
+
+        :raises dataclass_builder.exceptions.MissingFieldError:
+            If not all of the required fields have been assigned to this
+            builder instance.
+        """
+        missing = self.__info.missing(self.__mask)
+        if missing:
+            name, field = next(iter(missing.items()))
+            raise MissingFieldError(
+                f"field '{name}' of dataclass "
+                f"'{self.__dataclass.__qualname__}' "
+                "is not optional",
+                self.__dataclass,
+                field,
+            )
+        if trusted:
+            # unset columns give every instance the default of the field
+            columns_ = [
+                repeat(OPTIONAL, self.__size) if column is OPTIONAL else column
+                for column in (getattr(self, name) for name in self.__info.names)
+            ]
+            build_trusted = self.__info.build_trusted
+            dataclass = self.__dataclass
+            rows = zip(*columns_) if columns_ else repeat((), self.__size)
+            return [build_trusted(dataclass, row) for row in rows]
+        names = tuple(
+            name for name in self.__info.names if getattr(self, name) is not OPTIONAL
+        )
+        columns = [getattr(self, name) for name in names]
+        constructor = _row_constructor(self.__dataclass, names)
+        return list(map(constructor, repeat(self.__dataclass, self.__size), *columns))
+
+    def _reset(self) -> None:
+        """Return all columns to their initial REQUIRED or OPTIONAL state."""
+        self.__dict__.update(self.__info.sentinels)
+        self.__dict__.pop("_BatchBuilder__order", None)
+        self.__mask = 0
+
+    def _changed(self) -> Tuple[str, ...]:
+        """Get the names of the assigned columns, in assignment order."""
+        order = self.__dict__.get("_BatchBuilder__order", ())
+        return self.__info.assigned(self.__mask, order)
+
+    def _clone(self) -> "BatchBuilder":
+        """Copy the builder, columns are shared with the copy until assigned."""
+        return copy(self)
+
+    def __copy__(self) -> "BatchBuilder":
+        """Copy the builder, the copy tracks its assigned columns separately."""
+        builder = self.__class__.__new__(self.__class__)
+        builder.__dict__.update(self.__dict__)
+        return builder
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "BatchBuilder":
+        """Deep copy the columns and other attributes set on the builder."""
+        builder = copy(self)
+        memo[id(self)] = builder
+        for key, value in self.__dict__.items():
+            # the state of the builder is copied, or immutable and shared
+            if not key.startswith("_BatchBuilder__"):
+                builder.__dict__[key] = deepcopy(value, memo)
+        return builder
+
+    def _is_complete(self) -> bool:
+        """Determine if all required fields have been assigned a column.
+
+        :return:
+            True if the builder has a column for every required field of the
+            dataclass, otherwise False.
+        """
+        mask = self.__info.required_mask
+        return self.__mask & mask == mask
+
+    def _missing(self) -> Mapping[str, "dataclasses.Field[Any]"]:
+        """Get a dictionary of the required fields that have not been assigned.
+
+        :return dict:
+            A mapping from field names to actual :class:`dataclasses.Field`'s
+            in the same order as the underlying dataclass.
+        """
+        return self.__info.missing(self.__mask)
+
+    def _fields(
+        self, required: bool = True, optional: bool = True
+    ) -> Mapping[str, "dataclasses.Field[Any]"]:
+        """Get a dictionary of the builder's fields.
+
+        :param required:
+            Set to False to not report required fields.
+        :param optional:
+            Set to False to not report optional fields.
+
+        :return dict:
+            A mapping from field names to actual :class:`dataclasses.Field`'s
+            in the same order as the underlying dataclass.
+
+        """
+        if not required and not optional:
+            return {}
+        if required and not optional:
+            return self.__info.required
+        if not required and optional:
+            return self.__info.optional
+        return self.__info.settable
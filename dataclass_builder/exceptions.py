@@ -5,7 +5,12 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from dataclasses import Field
 
-__all__ = ["DataclassBuilderError", "UndefinedFieldError", "MissingFieldError"]
+__all__ = [
+    "DataclassBuilderError",
+    "UndefinedFieldError",
+    "MissingFieldError",
+    "FieldTypeError",
+]
 
 
 class DataclassBuilderError(Exception):
@@ -53,3 +58,26 @@ class MissingFieldError(DataclassBuilderError):
         The :class:`dataclasses.Field` representing the missing field that
         needs to be assigned.
         """
+
+
+class FieldTypeError(DataclassBuilderError, TypeError):
+    """Thrown when assigning a value of the wrong type to a validated field."""
+
+    def __init__(self, message: str, dataclass: Any, field: str, value: Any) -> None:
+        """
+        :param message:
+            Human readable error message
+        :param dataclass:
+            :func:`dataclasses.dataclass` the :class:`DataclassBuilder` was made for.
+        :param field:
+            Name of the field that the calling code tried to assign to.
+        :param value:
+            The value that was rejected.
+        """
+        super().__init__(message)
+        self.dataclass = dataclass
+        """:func:`dataclasses.dataclass` the :class:`DataclassBuilder` was made for."""
+        self.field = field
+        """Name of the field that the calling code tried to assign to."""
+        self.value = value
+        """The value that was rejected."""
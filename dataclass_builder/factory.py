@@ -136,94 +136,540 @@ or only the optional fields.
 
 """
 
-from typing import (
-    TYPE_CHECKING,
-    Any,
-    Callable,
-    Dict,
-    Mapping,
-    MutableMapping,
-    Optional,
-    Sequence,
-    Type,
-    cast,
-)
-
-from ._common import (
-    MISSING,
-    OPTIONAL,
-    REQUIRED,
-    _is_required,
-    _optional_fields,
-    _required_fields,
-    _settable_fields,
-)
-from .exceptions import MissingFieldError, UndefinedFieldError
-
-if TYPE_CHECKING:
-    from dataclasses import Field, is_dataclass
-else:
-    from dataclasses import is_dataclass
-
-__all__ = ["dataclass_builder"]
-
-
-# copied (and modified) from dataclasses._create_fn to avoid dependency on
-# private functions in dataclasses
-def _create_fn(
-    name: str,
-    args: Sequence[str],
-    body: Sequence[str],
-    env: Optional[Dict[str, Any]] = None,
-    *,
-    return_type: Any = MISSING,
-) -> Callable[..., Any]:
-    locals_: MutableMapping[str, Any] = {}
-    return_annotation = ""
-    if env is None:
-        env = {}
-    if return_type is not MISSING:
-        env["_return_type"] = return_type
-        return_annotation = "->_return_type"
-    args = ", ".join(args)
-    body = "\n".join(f" {line}" for line in body)
-    txt = f"def {name}({args}){return_annotation}:\n{body}"
-    # this is how the dataclasses module makes custom methods so it's good
-    # enough for this package
-    exec(txt, env, locals_)  # pylint: disable=exec-used
-    return cast(Callable[..., Any], locals_[name])
+import importlib
+import inspect
+import threading
+import weakref
+from dataclasses import is_dataclass
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Type, cast
+
+from ._common import _DataclassInfo, _dataclass_info
+
+__all__ = [
+    "dataclass_builder",
+    "generate_builder_source",
+    "builder_cache_info",
+    "clear_builder_cache",
+    "BuilderCacheInfo",
+]
+
+
+def _mangle(class_name: str, name: str) -> str:
+    # mangle a private name the same way Python does within a class body, so
+    # it matches the attribute __slots__ creates
+    stripped = class_name.lstrip("_")
+    return f"_{stripped}{name}" if stripped else name
+
+
+def _docstring(text: str) -> str:
+    # string literal of a docstring that can be placed in generated source,
+    # the caller indents it along with the code around it
+    lines = [line.rstrip() for line in inspect.cleandoc(text).splitlines()]
+    text = "\n".join(lines).rstrip()
+    if "\n" in text:
+        text += "\n"
+    return '"""' + text.replace("\\", "\\\\").replace('"""', '\\"""') + '"""'
+
+
+def _indent(lines: Iterable[str], level: int = 1) -> List[str]:
+    # indents every physical line, including those of multiline docstrings
+    return [
+        ("    " * level + line) if line else ""
+        for line in "\n".join(lines).split("\n")
+    ]
+
+
+def _dataclass_name(dataclass: Any) -> str:
+    dname: str = dataclass.__qualname__
+    try:
+        dname = dataclass.__module__ + "." + dname
+    except AttributeError:
+        pass
+    return dname
+
+
+def _environment_source(info: _DataclassInfo, validate: bool) -> List[str]:
+    # Source defining the globals used by the builder class.  Everything is
+    # derived from `_dataclass`, which must already be defined, so the same
+    # source works for classes made at runtime and for generated modules.
+    lines = [
+        "from copy import deepcopy as _deepcopy",
+        "",
+        "from dataclass_builder._common import OPTIONAL, REQUIRED, _dataclass_info",
+        "from dataclass_builder._common import Lazy as _Lazy",
+        "from dataclass_builder.exceptions import (",
+        "    MissingFieldError as _MissingFieldError,",
+        "    UndefinedFieldError as _UndefinedFieldError,",
+        ")",
+        "from dataclass_builder.instrumentation import _register_builder",
+        "",
+        "_info = _dataclass_info(_dataclass)",
+        "_names = _info.names",
+        "_bits = _info.bits",
+        "_sentinels = _info.sentinels",
+        "_required_mask = _info.required_mask",
+        "_object_setattr = object.__setattr__",
+    ]
+    if validate:
+        # after the imports from dataclass_builder._common
+        lines[4:4] = [
+            "from dataclass_builder._validation import (",
+            "    _check_rejected,",
+            "    _field_checkers,",
+            ")",
+        ]
+        lines.append("_checkers = _field_checkers(_dataclass)")
+    for i, name in enumerate(info.names):
+        lines.append(f"_field_{i} = _info.settable[{name!r}]")
+        lines.append(f"_type_{i} = _field_{i}.type")
+        if name not in info.required and info.defaults is not None:
+            lines.append(f"_default_{i} = _info.defaults[{name!r}]")
+    return lines
+
+
+def _init_method_source(
+    info: _DataclassInfo, mask: str, order: Optional[str]
+) -> List[str]:
+    def is_required(name: str) -> str:
+        return "REQUIRED" if name in info.required else "OPTIONAL"
+
+    if info.names:
+        args = ["self", "*"] + [
+            f"{name}: _type_{i} = {is_required(name)}"
+            for i, name in enumerate(info.names)
+        ]
+    else:
+        args = ["self"]
+    # __setattr__ sets the bit of each assigned field in the mask
+    body = [f"self.{mask} = 0"]
+    if order is not None:
+        body.append(f"self.{order} = ()")
+    body += [f"self.{name}: _type_{i} = {name}" for i, name in enumerate(info.names)]
+    return [f"def __init__({', '.join(args)}) -> None:"] + _indent(body)
 
 
-def _create_init_method(fields: Mapping[str, "Field[Any]"]) -> Callable[..., None]:
-    env: Dict[str, Any] = {
-        f"_{name}_type": field.type for name, field in fields.items()
-    }
-    env["REQUIRED"] = REQUIRED
-    env["OPTIONAL"] = OPTIONAL
+def _setattr_method_source(
+    dname: str, mask: str, order: str, slots: bool, validate: bool
+) -> List[str]:
+    doc = f"""Set a field value, or an object attribute if it is private.
 
-    def is_required(field: "Field[Any]") -> str:
-        return "REQUIRED" if _is_required(field) else "OPTIONAL"
+    .. note::
 
-    if fields:
-        args = ["self", "*"] + [
-            f"{name}: _{name}_type = {is_required(field)}"
-            for name, field in fields.items()
+        This will pass through all attributes beginning with an underscore.
+        If this is a valid field of the dataclass it will still be built
+        correctly but UndefinedFieldError will not be thrown for attributes
+        beginning with an underscore.
+
+        If you need the exception to be thrown then set the field in the
+        constructor.
+
+    :param name:
+        Name of the dataclass field or private/dunder attribute to set.
+    :param value:
+        Value to assign to the dataclass field or private/dunder
+        attribute.
+
+    :raises dataclass_builder.exceptions.UndefinedFieldError:
+        If `name` is not initialisable in the :class:`{dname}` dataclass.
+        If `name` is private (begins with an underscore) or is a "dunder"
+        then this exception will not be raised.
+    """
+    if validate:
+        doc = doc.rstrip() + f"""
+    :raises dataclass_builder.exceptions.FieldTypeError:
+        If `value` is not of the type of the field of :class:`{dname}`,
+        unless it is a :func:`dataclass_builder.lazy` value or awaitable,
+        which are not checked.
+    """
+    # Assigning a field is a single lookup of its bit and then stores, the
+    # private state is written directly so it never goes through __setattr__.
+    # The assignment order is only kept once a field is assigned before an
+    # assigned field that comes after it, until then the mask gives it.
+    if slots:
+        assign = [
+            "    _object_setattr(self, name, value)",
+            f"    mask = self.{mask}",
+            "    if value is REQUIRED or value is OPTIONAL:",
+            "        if mask & bit:",
+            f"            _object_setattr(self, {mask!r}, mask ^ bit)",
+            f"            order = self.{order}",
+            "            if name in order:",
+            "                order = tuple(n for n in order if n != name)",
+            f"                _object_setattr(self, {order!r}, order)",
+            "    else:",
+            "        if mask > bit and not mask & bit:",
+            f"            order = _info.assigned(mask, self.{order}) + (name,)",
+            f"            _object_setattr(self, {order!r}, order)",
+            f"        _object_setattr(self, {mask!r}, mask | bit)",
         ]
     else:
-        args = ["self"]
-    body = [f"self.{name}: _{name}_type = {name}" for name in fields]
-    body = ["self.__initialized = False"] + body + ["self.__initialized = True"]
-    return _create_fn("__init__", args, body, env, return_type=None)
+        assign = [
+            "    dict_ = self.__dict__",
+            "    dict_[name] = value",
+            f"    mask = dict_[{mask!r}]",
+            "    if value is REQUIRED or value is OPTIONAL:",
+            "        if mask & bit:",
+            f"            dict_[{mask!r}] = mask ^ bit",
+            f"            order = dict_.get({order!r}, ())",
+            "            if name in order:",
+            "                order = tuple(n for n in order if n != name)",
+            f"                dict_[{order!r}] = order",
+            "    else:",
+            "        if mask > bit and not mask & bit:",
+            f"            order = dict_.get({order!r}, ())",
+            f"            dict_[{order!r}] = _info.assigned(mask, order) + (name,)",
+            f"        dict_[{mask!r}] = mask | bit",
+        ]
+    if validate:
+        # checked before anything is stored, so rejected values are not kept
+        assign = [
+            "    check = _checkers.get(name)",
+            "    if check is not None and not check(value):",
+            "        _check_rejected(_dataclass, name, value)",
+            *assign,
+        ]
+    return [
+        "def __setattr__(self, name, value):",
+        *_indent([_docstring(doc)]),
+        "    bit = _bits.get(name)",
+        "    if bit is not None:",
+        *_indent(assign),
+        "    elif name.startswith('_') or hasattr(self, name):",
+        "        _object_setattr(self, name, value)",
+        "    else:",
+        "        raise _UndefinedFieldError(",
+        "            f\"dataclass '{_dataclass.__qualname__}' does not define \"",
+        "            f\"field '{name}'\",",
+        "            _dataclass,",
+        "            name,",
+        "        )",
+    ]
+
+
+def _repr_method_source() -> List[str]:
+    doc = """Print a representation of the builder.
+
+    >>> PointBuilder = dataclass_builder(Point)
+    >>> PointBuilder(x=4.0, w=2.0)
+    PointBuilder(x=4.0, w=2.0)
+
+    :return:
+        String representation that can be used to construct this builder
+        instance.
+    """
+    return [
+        "def __repr__(self):",
+        *_indent([_docstring(doc)]),
+        "    args = []",
+        "    for name in _names:",
+        "        value = getattr(self, name)",
+        "        if value not in (REQUIRED, OPTIONAL):",
+        "            args.append(f'{name}={value!r}')",
+        "    return f\"{self.__class__.__qualname__}({', '.join(args)})\"",
+    ]
+
+
+def _interning_source(count: int) -> List[str]:
+    # interned builds are looked up first, see dataclass_builder.interning
+    values = ", ".join(f"_{i}" for i in range(count))
+    row = f"({values},)" if count == 1 else f"({values})"
+    return [
+        "_interner = _info.interner",
+        "if _interner is not None:",
+        "    _interner = _interner()",
+        "if _interner is not None:",
+        f"    _key, _instance = _interner.get({row})",
+        "    if _instance is not None:",
+        "        return _instance",
+        "    if _key is not None:",
+        "        if trusted:",
+        f"            _instance = _info.build_trusted(_dataclass, [{values}])",
+        "        else:",
+        "            _instance = _dataclass(",
+        "                **{",
+        "                    _name: _value",
+        f"                    for _name, _value in zip(_names, {row})",
+        "                    if _value is not OPTIONAL",
+        "                }",
+        "            )",
+        "        return _interner.put(_key, _instance)",
+    ]
+
+
+def _trusted_source(values: str) -> List[str]:
+    # call the trusted constructor directly once build_trusted has created it
+    return [
+        "if trusted:",
+        "    constructor = _info.trusted_constructor",
+        "    if constructor is None:",
+        f"        return _info.build_trusted(_dataclass, [{values}])",
+        f"    return constructor(_dataclass, {values})",
+    ]
+
+
+def _call_source(info: _DataclassInfo) -> List[str]:
+    body = []
+    if info.defaults is not None:
+        for i, name in enumerate(info.names):
+            if name not in info.required:
+                body.append(f"if _{i} is OPTIONAL:")
+                body.append(f"    _{i} = _default_{i}")
+    if info.positional is not None:
+        # passing fields positionally is faster than by keyword
+        args = [f"_{i}" for i in info.positional]
+        args += [f"{info.names[i]}=_{i}" for i in info.keywords]
+        body.append(f"return _dataclass({', '.join(args)})")
+    elif info.defaults is not None:
+        kwargs = ", ".join(f"{name}=_{i}" for i, name in enumerate(info.names))
+        body.append(f"return _dataclass({kwargs})")
+    else:
+        # __init__ does not expose its defaults so unset fields must be omitted
+        body.append("kwargs = {}")
+        for i, name in enumerate(info.names):
+            if name in info.required:
+                body.append(f"kwargs[{name!r}] = _{i}")
+            else:
+                body.append(f"if _{i} is not OPTIONAL:")
+                body.append(f"    kwargs[{name!r}] = _{i}")
+        body.append("return _dataclass(**kwargs)")
+    return body
+
+
+def _build_method_source(
+    dataclass: Any, info: _DataclassInfo, dname: str, proto: Optional[str]
+) -> List[str]:
+    doc = f"""Build a :class:`{dname}` dataclass using the fields from this builder.
+
+    :param trusted:
+        Set to True to skip the `__init__` method of the dataclass and assign
+        the fields of the new instance directly, see
+        :func:`dataclass_builder.utility.build`.
+
+    :return:
+        An instance of the :class:`{dname}` dataclass using the fields set on
+        this builder instance.
+
+    :raises dataclass_builder.exceptions.MissingFieldError:
+        If not all of the required fields have been assigned to this
+        builder instance.
+    """
+    # Each field is read exactly once into a local, named by position so field
+    # names can never shadow the environment, and then passed straight to the
+    # dataclass.  Unset optional fields are given the default argument of the
+    # dataclass's __init__, which is the same as not passing them at all.
+    body = [_docstring(doc)]
+    if proto is not None:
+        # fields of clones that have not been assigned are in the prototype
+        body += [
+            "_values = self.__dict__",
+            f"_proto = _values.get({proto!r})",
+            "if _proto is not None:",
+            "    _values = {**_proto, **_values}",
+        ]
+    for i, name in enumerate(info.names):
+        if proto is not None:
+            body.append(f"_{i} = _values[{name!r}]")
+        else:
+            body.append(f"_{i} = self.{name}")
+        if name in info.required:
+            message = (
+                f"field '{name}' of dataclass '{dataclass.__qualname__}' "
+                "is not optional"
+            )
+            body.append(f"if _{i} is REQUIRED:")
+            body.append(
+                f"    raise _MissingFieldError({message!r}, _dataclass, _field_{i})"
+            )
+    if info.names:
+        # only resolved once the build can no longer fail for a missing field
+        body.append("if _Lazy._used:")
+        for i in range(len(info.names)):
+            body.append(f"    if type(_{i}) is _Lazy:")
+            body.append(f"        _{i} = _{i}.resolve()")
+    values = ", ".join(f"_{i}" for i in range(len(info.names)))
+    body += _interning_source(len(info.names))
+    body += _trusted_source(values)
+    body += _call_source(info)
+    # Fix return type of build, it won't help Mypy as it cannot handle
+    # classes created at runtime but typing.get_type_hints will work properly.
+    #
+    # See: https://github.com/python/mypy/wiki/Unsupported-Python-Features
+    return ["def _build(self, trusted=False) -> _dataclass:"] + _indent(body)
+
+
+def _fields_method_source(dname: str) -> List[str]:
+    doc = f"""Get a dictionary of the builder's fields.
+
+    :param required:
+        Set to False to not report required fields.
+    :param optional:
+        Set to False to not report optional fields.
+
+    :return:
+        A mapping from field names to actual :class:`dataclasses.Field`'s
+        in the same order as in the :class:`{dname}` dataclass.
+    """
+    return [
+        "def _fields(self, required=True, optional=True):",
+        *_indent([_docstring(doc)]),
+        "    if not required and not optional:",
+        "        return {}",
+        "    if required and not optional:",
+        "        return _info.required",
+        "    if not required and optional:",
+        "        return _info.optional",
+        "    return _info.settable",
+    ]
+
+
+def _state_methods_source(
+    dname: str, mask: str, order: str, proto: Optional[str]
+) -> List[str]:
+    reset_doc = "Return all fields to their initial REQUIRED or OPTIONAL state."
+    is_complete_doc = f"""Determine if all required fields have been assigned.
+
+    :return:
+        True if the builder has a value for every required field of the
+        :class:`{dname}` dataclass, otherwise False.
+    """
+    missing_doc = f"""Get a dictionary of the unassigned required fields.
+
+    :return:
+        A mapping from field names to actual :class:`dataclasses.Field`'s
+        in the same order as in the :class:`{dname}` dataclass.
+    """
+    changed_doc = "Get the names of the assigned fields, in assignment order."
+    copy_doc = "Copy the builder, the copy tracks its assigned fields separately."
+    deepcopy_doc = "Deep copy the fields and other attributes set on the builder."
+    setstate_doc = "Restore the attributes of an unpickled builder, as they were."
+    lines = ["def _reset(self):", *_indent([_docstring(reset_doc)])]
+    if proto is None:
+        lines += [
+            "    for name, value in _sentinels.items():",
+            "        object.__setattr__(self, name, value)",
+            f"    object.__setattr__(self, {mask!r}, 0)",
+            f"    object.__setattr__(self, {order!r}, ())",
+            "",
+            "def __copy__(self):",
+            *_indent([_docstring(copy_doc)]),
+            "    cls = self.__class__",
+            "    builder = cls.__new__(cls)",
+            f"    for name in _names + ({mask!r}, {order!r}):",
+            "        object.__setattr__(builder, name, getattr(self, name))",
+            "    # subclasses may add a __dict__",
+            "    if getattr(self, '__dict__', None):",
+            "        builder.__dict__.update(self.__dict__)",
+            "    return builder",
+            "",
+            "def __deepcopy__(self, memo):",
+            *_indent([_docstring(deepcopy_doc)]),
+            "    builder = self.__copy__()",
+            "    memo[id(self)] = builder",
+            "    for name in _names:",
+            "        value = _deepcopy(getattr(self, name), memo)",
+            "        object.__setattr__(builder, name, value)",
+            "    for name, value in getattr(self, '__dict__', {}).items():",
+            "        builder.__dict__[name] = _deepcopy(value, memo)",
+        ]
+    else:
+        lines += [
+            f"    self.__dict__.pop({proto!r}, None)",
+            "    self.__dict__.update(_sentinels)",
+            f"    self.__dict__[{mask!r}] = 0",
+            f"    self.__dict__.pop({order!r}, None)",
+            "",
+            "def __copy__(self):",
+            *_indent([_docstring(copy_doc)]),
+            "    cls = self.__class__",
+            "    builder = cls.__new__(cls)",
+            "    builder.__dict__.update(self.__dict__)",
+            "    return builder",
+            "",
+            "def __deepcopy__(self, memo):",
+            *_indent([_docstring(deepcopy_doc)]),
+            "    builder = self.__copy__()",
+            "    memo[id(self)] = builder",
+            "    # the prototype of clones is copied with the fields",
+            "    for name, value in self.__dict__.items():",
+            "        builder.__dict__[name] = _deepcopy(value, memo)",
+        ]
+    lines += [
+        "    return builder",
+        "",
+        "def __setstate__(self, state):",
+        *_indent([_docstring(setstate_doc)]),
+        "    # the private state may be restored after the fields",
+        "    for attributes in state if isinstance(state, tuple) else (state,):",
+        "        for name, value in (attributes or {}).items():",
+        "            _object_setattr(self, name, value)",
+        "",
+        "def _changed(self):",
+        *_indent([_docstring(changed_doc)]),
+    ]
+    if proto is None:
+        lines.append(f"    return _info.assigned(self.{mask}, self.{order})")
+    else:
+        lines += [
+            f"    order = self.__dict__.get({order!r}, ())",
+            f"    return _info.assigned(self.{mask}, order)",
+        ]
+    lines.append("")
+    if proto is None:
+        # slots builders have no instance dictionary to keep a prototype in
+        lines.append("_clone = __copy__")
+    else:
+        getattr_doc = """Get a field of a clone, not assigned since cloning.
+
+        :raises AttributeError:
+            If `name` is not a field of a cloned builder.
+        """
+        clone_doc = """Copy the builder, sharing its field values with the copy.
+
+        The field values are moved into a prototype, shared by this builder
+        and the clone, so each only stores the fields assigned after cloning.
+
+        :return:
+            A new builder with the same field values.
+        """
+        lines += [
+            "def __getattr__(self, name):",
+            *_indent([_docstring(getattr_doc)]),
+            "    try:",
+            f"        return self.__dict__[{proto!r}][name]",
+            "    except KeyError:",
+            "        raise AttributeError(",
+            "            f\"'{self.__class__.__name__}' object \"",
+            "            f\"has no attribute '{name}'\"",
+            "        ) from None",
+            "",
+            "def _clone(self):",
+            *_indent([_docstring(clone_doc)]),
+            "    dict_ = self.__dict__",
+            f"    proto = dict_.get({proto!r})",
+            "    assigned = [name for name in dict_ if name in _bits]",
+            "    if proto is None or assigned:",
+            "        proto = dict(proto) if proto is not None else {}",
+            "        for name in assigned:",
+            "            proto[name] = dict_.pop(name)",
+            f"        dict_[{proto!r}] = proto",
+            "    return self.__copy__()",
+        ]
+    return lines + [
+        "",
+        "def _is_complete(self):",
+        *_indent([_docstring(is_complete_doc)]),
+        f"    return self.{mask} & _required_mask == _required_mask",
+        "",
+        "def _missing(self):",
+        *_indent([_docstring(missing_doc)]),
+        f"    return _info.missing(self.{mask})",
+    ]
 
 
 def _create_class_docstring(dataclass: Any) -> str:
-    dname = dataclass.__qualname__
-    try:
-        dname = dataclass.__module__ + "." + dname
-    except AttributeError:
-        pass
+    dname = _dataclass_name(dataclass)
     params = []
-    for name in _settable_fields(dataclass).keys():
+    for name in _dataclass_info(dataclass).names:
         params.append(f"    :param {name}: Optionally initialize `{name}` field.\n")
     docstring = rf"""Builder for the :class:`{dname}` dataclass.
 
@@ -254,39 +700,28 @@ def _create_class_docstring(dataclass: Any) -> str:
     return docstring
 
 
-def dataclass_builder(  # noqa: C901
-    dataclass: Type[Any], *, name: Optional[str] = None
-) -> Type[Any]:
-    """Create a new builder class specialized to a given dataclass.
+def _builder_source(
+    dataclass: Any, class_name: str, slots: bool, validate: bool
+) -> List[str]:
+    """Generate the source of a builder class and the globals it uses.
 
     :param dataclass:
         The :func:`dataclasses.dataclass` to create the builder for.
-    :param name:
-        Override the name of the builder, by default it will be
-        '<dataclass>Builder' where <dataclass> is replaced by the name of the
-        dataclass.
+    :param class_name:
+        Name of the builder class, must be an identifier.
+    :param slots:
+        Set to True to give the builder class a `__slots__` layout.
+    :param validate:
+        Set to True to check the type of the values assigned to fields.
 
-    :return object:
-        A new dataclass builder class that is specialized to the given
-        `dataclass`.  If the given :func:`dataclasses.dataclass` does not
-        contain the fields `build` or `fields` these will be exposed as public
-        methods with the same signature as the
-        :func:`dataclass_builder.utility.build` and
-        :func:`dataclass_builder.utility.fields` functions respectively.
-
-    :raises TypeError:
-        If `dataclass` is not a :func:`dataclasses.dataclass`. This is decided
-        via :func:`dataclasses.is_dataclass`.
+    :return:
+        Lines of source code, this expects `_dataclass` to be defined as the
+        given `dataclass` and defines the builder class as `class_name`.
     """
-    if not is_dataclass(dataclass):
-        raise TypeError("must be called with a dataclass type")
-
-    settable_fields = _settable_fields(dataclass)
-    required_fields = _required_fields(dataclass)
-    optional_fields = _optional_fields(dataclass)
+    info = _dataclass_info(dataclass)
 
     # validate identifiers
-    for name_ in _settable_fields(dataclass):
+    for name_ in info.names:
         # there should not be anyway to trigger this branch
         if not name_.isidentifier():  # pragma: no cover
             raise RuntimeError(
@@ -294,145 +729,313 @@ def dataclass_builder(  # noqa: C901
                 f" to construct builder for '{dataclass.__qualname__}'"
             )
 
-    dname = dataclass.__qualname__
-    try:
-        dname = dataclass.__module__ + "." + dname
-    except AttributeError:
-        pass
+    dname = _dataclass_name(dataclass)
+    # set field mask, stored under a private name of the builder class
+    mask = _mangle(class_name, "__mask")
+    # fields in assignment order, once they are not assigned in field order
+    order = _mangle(class_name, "__order")
+    proto = None if slots else _mangle(class_name, "__proto")
+
+    body = [_docstring(_create_class_docstring(dataclass)), ""]
+    body.append("__dataclass__ = _dataclass")
+    if validate:
+        body.append("__validate__ = True")
+    if slots:
+        body.append(f"__slots__ = {info.names + (mask, order)!r}")
+    for method in (
+        _init_method_source(info, mask, order if slots else None),
+        _setattr_method_source(dname, mask, order, slots, validate),
+        _repr_method_source(),
+        _build_method_source(dataclass, info, dname, proto),
+        _fields_method_source(dname),
+        _state_methods_source(dname, mask, order, proto),
+    ):
+        body += [""] + method
+    if "build" not in info.settable:
+        body += ["", "build = _build"]
+    if "fields" not in info.settable:
+        body += ["", "fields = _fields"]
+
+    source = _environment_source(info, validate)
+    source += ["", "", f"class {class_name}:"] + _indent(body)
+    source += ["", "", f"_register_builder({class_name})"]
+    return source
+
+
+# builder classes reference their dataclass, so a weakly keyed dictionary
+# would keep every dataclass alive, instead each dataclass holds its own cache
+# and the cycle is collected with the dataclass
+_CACHE_ATTRIBUTE = "__dataclass_builders__"
+_CACHE_LOCK = threading.Lock()
+_CACHED_DATACLASSES: "weakref.WeakSet[Any]" = weakref.WeakSet()
+_CACHE_HITS = 0
+_CACHE_MISSES = 0
+
+
+class BuilderCacheInfo(NamedTuple):
+    """Statistics of the builder class cache of :func:`dataclass_builder`."""
+
+    hits: int
+    """Number of calls that returned a cached builder class."""
+
+    misses: int
+    """Number of calls that had to create a builder class."""
+
+    size: int
+    """Number of builder classes in the cache."""
+
+
+def builder_cache_info() -> BuilderCacheInfo:
+    """Get statistics of the builder class cache.
 
-    def _setattr_method(self: Any, name: str, value: Any) -> None:
-        # self.__initialized is not protected member access, since this is
-        # a class method
-        if (
-            name.startswith("_") or hasattr(self, name) or not self.__initialized
-        ):  # pylint: disable=protected-access
-            object.__setattr__(self, name, value)
-        else:
-            raise UndefinedFieldError(
-                f"dataclass '{dataclass.__qualname__}' does not define "
-                f"field '{name}'",
-                dataclass,
-                name,
-            )
+    :return:
+        The number of hits and misses since the cache was last cleared and the
+        number of builder classes currently cached.
+    """
+    with _CACHE_LOCK:
+        size = sum(
+            len(vars(dataclass).get(_CACHE_ATTRIBUTE, ()))
+            for dataclass in _CACHED_DATACLASSES
+        )
+        return BuilderCacheInfo(_CACHE_HITS, _CACHE_MISSES, size)
 
-    _setattr_method.__doc__ = f"""\
-    Set a field value, or an object attribute if it is private.
 
-        .. note::
+def clear_builder_cache() -> None:
+    """Remove all builder classes from the cache and reset its statistics.
 
-            This will pass through all attributes beginning with an underscore.
-            If this is a valid field of the dataclass it will still be built
-            correctly but UndefinedFieldError will not be thrown for attributes
-            beginning with an underscore.
+    Builder classes that are still referenced keep working, but later calls
+    to :func:`dataclass_builder` will create new classes.
+    """
+    global _CACHE_HITS, _CACHE_MISSES  # pylint: disable=global-statement
+    with _CACHE_LOCK:
+        for dataclass in _CACHED_DATACLASSES:
+            builders = vars(dataclass).get(_CACHE_ATTRIBUTE)
+            if builders is not None:
+                builders.clear()
+        _CACHE_HITS = 0
+        _CACHE_MISSES = 0
+
+
+def dataclass_builder(
+    dataclass: Type[Any],
+    *,
+    name: Optional[str] = None,
+    slots: bool = False,
+    validate: bool = False,
+) -> Type[Any]:
+    """Create a builder class specialized to a given dataclass.
 
-            If you need the exception to be thrown then set the field in the
-            constructor.
+    Builder classes are cached, so calling this again with the same arguments
+    returns the same class without generating it again.  The cache is stored
+    on the dataclass, as its `__dataclass_builders__` attribute, so it does
+    not keep dataclasses alive.  Use :func:`clear_builder_cache` to empty it
+    and :func:`builder_cache_info` to see how effective it is.
 
-        :param name:
-            Name of the dataclass field or private/dunder attribute to set.
-        :param value:
-            Value to assign to the dataclass field or private/dunder
-            attribute.
+    :param dataclass:
+        The :func:`dataclasses.dataclass` to create the builder for.
+    :param name:
+        Override the name of the builder, by default it will be
+        '<dataclass>Builder' where <dataclass> is replaced by the name of the
+        dataclass.
+    :param slots:
+        Set to True to give the builder class a `__slots__` layout with one
+        slot per settable field, instead of an instance dictionary.  This
+        makes instances considerably smaller, at the cost that private
+        attributes can no longer be assigned to unless a subclass provides a
+        `__dict__`.
+    :param validate:
+        Set to True to check that every value assigned to a field is of the
+        type of the field, raising
+        :class:`dataclass_builder.exceptions.FieldTypeError` if it is not.
+        The check of each field is compiled once, from the resolved type
+        hints of the dataclass, and builder classes without `validate` do
+        not check anything.
 
-        :raises dataclass_builder.exceptions.UndefinedFieldError:
-            If `name` is not initialisable in the :class:`{dname}` dataclass.
-            If `name` is private (begins with an underscore) or is a "dunder"
-            then this exception will not be raised.
-        """
+    :return object:
+        A dataclass builder class that is specialized to the given
+        `dataclass`, which is available as its `__dataclass__` attribute.  If
+        the given :func:`dataclasses.dataclass` does not
+        contain the fields `build` or `fields` these will be exposed as public
+        methods with the same signature as the
+        :func:`dataclass_builder.utility.build` and
+        :func:`dataclass_builder.utility.fields` functions respectively.
 
-    def _repr_method(self: Any) -> str:
-        """Print a representation of the builder.
+    :raises TypeError:
+        If `dataclass` is not a :func:`dataclasses.dataclass`. This is decided
+        via :func:`dataclasses.is_dataclass`.
+    """
+    if not isinstance(dataclass, type):
+        raise TypeError("must be called with a dataclass type")
+    if name is None:
+        name = f"{dataclass.__name__}Builder"
+    key = (name, slots, validate)
+    global _CACHE_HITS, _CACHE_MISSES  # pylint: disable=global-statement
+    with _CACHE_LOCK:
+        # only dataclasses are given a cache, so it's checked on misses only
+        builders: Optional[Dict[Tuple[str, bool, bool], Type[Any]]] = vars(
+            dataclass
+        ).get(_CACHE_ATTRIBUTE)
+        builder = builders.get(key) if builders is not None else None
+        if builder is not None:
+            _CACHE_HITS += 1
+            return builder
+        if not is_dataclass(dataclass):
+            raise TypeError("must be called with a dataclass type")
+        _CACHE_MISSES += 1
+        builder = _create_builder(dataclass, name, slots, validate)
+        if builders is None:
+            builders = {}
+            try:
+                setattr(dataclass, _CACHE_ATTRIBUTE, builders)
+            except (AttributeError, TypeError):  # pragma: no cover
+                # the dataclass does not allow attributes to be set
+                return builder
+            _CACHED_DATACLASSES.add(dataclass)
+        builders[key] = builder
+        return builder
+
+
+def _create_builder(
+    dataclass: Any, name: str, slots: bool, validate: bool
+) -> Type[Any]:
+    # see dataclass_builder, this creates a builder class without caching it
+    class_name = name if name.isidentifier() else "Builder"
 
-        >>> PointBuilder = dataclass_builder(Point)
-        >>> PointBuilder(x=4.0, w=2.0)
-        PointBuilder(x=4.0, w=2.0)
+    source = "\n".join(_builder_source(dataclass, class_name, slots, validate))
+    env: Dict[str, Any] = {"__name__": __name__, "_dataclass": dataclass}
+    # this is how the dataclasses module makes custom methods so it's good
+    # enough for this package
+    exec(source, env)  # pylint: disable=exec-used
+    builder = cast(Type[Any], env[class_name])
+    builder.__name__ = builder.__qualname__ = name
+    # the class can't be imported, so instances are pickled by its dataclass
+    cast(Any, builder).__reduce_ex__ = _reduce_builder
+    return builder
+
+
+def _reduce_builder(self: Any, protocol: int) -> Any:
+    # __reduce_ex__ of builder classes created by _create_builder
+    cls = type(self)
+    if vars(cls).get("__reduce_ex__") is not _reduce_builder:
+        # subclasses are pickled normally, by reference to their class
+        return object.__reduce_ex__(self, protocol)
+    slots = "__slots__" in vars(cls)
+    if slots:
+        state = {name: getattr(self, name) for name in cls.__slots__}
+    else:
+        state = self.__dict__
+    validate = vars(cls).get("__validate__", False)
+    args = (cls.__dataclass__, cls.__name__, slots, state, validate)
+    return _unpickle_builder, args
 
-        :return:
-            String representation that can be used to construct this builder
-            instance.
-        """
-        args = []
-        for name in settable_fields:
-            value = getattr(self, name)
-            if value not in (REQUIRED, OPTIONAL):
-                args.append(f"{name}={repr(value)}")
-        return f'{self.__class__.__qualname__}({", ".join(args)})'
-
-    def _build_method(self: Any) -> Any:
-        # check for missing required fields
-        for name, field in required_fields.items():
-            if getattr(self, name) is REQUIRED:
-                raise MissingFieldError(
-                    f"field '{name}' of dataclass '{dataclass.__qualname__}' "
-                    "is not optional",
-                    dataclass,
-                    field,
-                )
-        # build dataclass
-        kwargs = {
-            name: getattr(self, name)
-            for name in settable_fields
-            if getattr(self, name) is not OPTIONAL
-        }
-        return dataclass(**kwargs)
-
-    _build_method.__doc__ = f"""\
-    Build a :class:`{dname}` dataclass using the fields from this builder.
 
-    :return:
-        An instance of the :class:`{dname}` dataclass using the fields set on
-        this builder instance.
+def _unpickle_builder(
+    dataclass: Any,
+    name: str,
+    slots: bool,
+    state: Dict[str, Any],
+    validate: bool = False,
+) -> Any:
+    """Recreate a pickled instance of a builder class created at runtime.
 
-    :raises dataclass_builder.exceptions.MissingFieldError:
-        If not all of the required fields have been assigned to this
-        builder instance.
-    """
+    The builder class is looked up in the cache of :func:`dataclass_builder`,
+    which acts as a registry keyed by the dataclass, and is created again if
+    it is not there, such as in a new process.
 
-    def _fields_method(
-        _: Any, required: bool = True, optional: bool = True
-    ) -> Mapping[str, "Field[Any]"]:
-        if not required and not optional:
-            return {}
-        if required and not optional:
-            return required_fields
-        if not required and optional:
-            return optional_fields
-        return settable_fields
+    :param dataclass:
+        The :func:`dataclasses.dataclass` of the builder class, this is
+        pickled by reference to its qualified name.
+    :param name:
+        Name of the builder class.
+    :param slots:
+        Whether the builder class has a `__slots__` layout.
+    :param state:
+        Attributes of the builder, including its private state.
+    :param validate:
+        Whether the builder class checks the types of field values.
 
-    _fields_method.__doc__ = f"""Get a dictionary of the builder's fields.
+    :return:
+        A builder, of the class :func:`dataclass_builder` gives for the same
+        arguments, with the given attributes.
+    """
+    cls = dataclass_builder(dataclass, name=name, slots=slots, validate=validate)
+    builder: Any = object.__new__(cls)
+    builder.__setstate__(state)
+    return builder
 
-        :param required:
-            Set to False to not report required fields.
-        :param optional:
-            Set to False to not report optional fields.
 
-        :return:
-            A mapping from field names to actual :class:`dataclasses.Field`'s
-            in the same order as in the :class:`{dname}` dataclass.
-        """
+def generate_builder_source(
+    dataclass: Type[Any],
+    *,
+    name: Optional[str] = None,
+    slots: bool = False,
+    validate: bool = False,
+) -> str:
+    """Generate the source code of a module defining a builder class.
 
-    # Fix return type of build, it won't help Mypy as it cannot handle
-    # classes created at runtime but typing.get_type_hints will work properly.
-    #
-    # See: https://github.com/python/mypy/wiki/Unsupported-Python-Features
-    _build_method.__annotations__["return"] = dataclass
+    The module defines the same class that
+    :func:`dataclass_builder.factory.dataclass_builder` would return when
+    called with the same arguments.  Importing it is equivalent to calling
+    the factory but without executing generated code at runtime, so the
+    module can be written to a file and bytecode cached like any other code.
 
-    # assemble new builder class methods
-    dict_: Dict[str, Any] = dict()
-    dict_["__init__"] = _create_init_method(settable_fields)
-    dict_["__setattr__"] = _setattr_method
-    dict_["__repr__"] = _repr_method
-    dict_["_build"] = _build_method
-    dict_["_fields"] = _fields_method
-    dict_["__doc__"] = _create_class_docstring(dataclass)
+    The module imports `dataclass` so the generated code must be regenerated
+    whenever the fields of `dataclass` change.
 
-    if "build" not in settable_fields:
-        dict_["build"] = _build_method
+    :param dataclass:
+        The :func:`dataclasses.dataclass` to create the builder for, this
+        must be importable from its module by its qualified name.
+    :param name:
+        Override the name of the builder, by default it will be
+        '<dataclass>Builder' where <dataclass> is replaced by the name of the
+        dataclass.  This must be a valid identifier.
+    :param slots:
+        Set to True to give the builder class a `__slots__` layout, see
+        :func:`dataclass_builder.factory.dataclass_builder`.
+    :param validate:
+        Set to True to check the types of the values assigned to fields, see
+        :func:`dataclass_builder.factory.dataclass_builder`.
 
-    if "fields" not in settable_fields:
-        dict_["fields"] = _fields_method
+    :return:
+        Source code of the module.
 
+    :raises TypeError:
+        If `dataclass` is not a :func:`dataclasses.dataclass`. This is decided
+        via :func:`dataclasses.is_dataclass`.
+    :raises ValueError:
+        If `dataclass` cannot be imported by its qualified name or `name` is
+        not an identifier.
+    """
+    if not is_dataclass(dataclass) or not isinstance(dataclass, type):
+        raise TypeError("must be called with a dataclass type")
     if name is None:
         name = f"{dataclass.__name__}Builder"
-
-    return type(name, (object,), dict_)
+    if not name.isidentifier():
+        raise ValueError(f"builder name '{name}' is not an identifier")
+    module = dataclass.__module__
+    qualname = dataclass.__qualname__
+    try:
+        imported: Any = importlib.import_module(module)
+        for attribute in qualname.split("."):
+            imported = getattr(imported, attribute)
+    except (ImportError, AttributeError):
+        imported = None
+    if imported is not dataclass:
+        raise ValueError(
+            f"dataclass '{qualname}' cannot be imported from module '{module}'"
+        )
+    header = [
+        _docstring(
+            f"Builder for the :class:`{_dataclass_name(dataclass)}` dataclass.\n\n"
+            "Generated by dataclass-builder, regenerate instead of editing.\n"
+        ),
+        "",
+        f"import {module} as _module",
+        "",
+        f"_dataclass = _module.{qualname}",
+        "",
+        f"__all__ = [{name!r}]",
+        "",
+    ]
+    source = _builder_source(dataclass, name, slots, validate)
+    return "\n".join(header + source) + "\n"
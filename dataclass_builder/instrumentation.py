@@ -0,0 +1,360 @@
+"""Opt-in instrumentation of builders.
+
+Metrics sinks can be attached to receive an event for every build, failed
+build, field assignment and :func:`dataclass_builder.utility.update`.  While
+no sink is attached builders run their original, uninstrumented, methods so
+instrumentation costs nothing unless it is used.
+
+Examples
+--------
+The :class:`AggregatingSink` keeps counts and latency histograms in memory.
+
+.. testcode::
+
+    from dataclasses import dataclass
+    from dataclass_builder import AggregatingSink, DataclassBuilder, build
+    from dataclass_builder import attach_sink, detach_sink
+
+    @dataclass
+    class Point:
+        x: float
+        y: float
+        w: float = 1.0
+
+    sink = AggregatingSink()
+    attach_sink(sink)
+    builder = DataclassBuilder(Point, x=5.8, y=8.1)
+    point = build(builder)
+    detach_sink(sink)
+
+.. doctest::
+
+    >>> sink.dump()["builds"]
+    {'Point': 1}
+    >>> sink.dump()["setattr"]
+    {'Point': 2}
+
+"""
+
+import threading
+import weakref
+from bisect import bisect_left
+from collections import Counter
+from functools import wraps
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ._common import OPTIONAL, REQUIRED, _dataclass_info
+from .exceptions import MissingFieldError, UndefinedFieldError
+from .wrapper import DataclassBuilder
+
+__all__ = ["MetricsSink", "AggregatingSink", "attach_sink", "detach_sink"]
+
+
+# replaced, never mutated, so it can be iterated without holding the lock
+_SINKS: Tuple["MetricsSink", ...] = ()
+_LOCK = threading.Lock()
+# builder classes whose methods are instrumented while a sink is attached
+_BUILDERS: "weakref.WeakSet[type]" = weakref.WeakSet([DataclassBuilder])
+# original methods of instrumented builder classes
+_ORIGINALS: MutableMapping[type, Dict[str, Any]] = weakref.WeakKeyDictionary()
+
+
+class MetricsSink:
+    """Receiver of instrumentation events, the methods do nothing by default.
+
+    Subclass this and override the events of interest, then attach it with
+    :func:`attach_sink`.  Events are delivered on the thread that caused them
+    so sinks shared between threads must synchronize themselves.
+    """
+
+    def on_build(self, dataclass: Any, seconds: float) -> None:
+        """Receive the time taken by a builder to build a dataclass.
+
+        :param dataclass:
+            The :func:`dataclasses.dataclass` that was built.
+        :param seconds:
+            Time taken by the build.
+        """
+
+    def on_error(self, dataclass: Any, field: str, error: Exception) -> None:
+        """Handle a missing or undefined field error raised by a builder.
+
+        :param dataclass:
+            The :func:`dataclasses.dataclass` of the builder.
+        :param field:
+            Name of the missing or undefined field.
+        :param error:
+            The :class:`dataclass_builder.exceptions.MissingFieldError` or
+            :class:`dataclass_builder.exceptions.UndefinedFieldError`.
+        """
+
+    def on_setattr(self, dataclass: Any, field: str) -> None:
+        """Handle the assignment of a value to a field of a builder.
+
+        Assigning `REQUIRED` or `OPTIONAL`, which unsets a field, is not
+        reported.
+
+        :param dataclass:
+            The :func:`dataclasses.dataclass` of the builder.
+        :param field:
+            Name of the assigned field.
+        """
+
+    def on_update(self, dataclass: Any, seconds: float) -> None:
+        """Receive the time taken by :func:`dataclass_builder.utility.update`.
+
+        :param dataclass:
+            The :func:`dataclasses.dataclass` of the builder used to update.
+        :param seconds:
+            Time taken by the update.
+        """
+
+
+def _name(dataclass: Any) -> str:
+    # sinks keep names instead of dataclasses so they don't keep them alive
+    return str(dataclass.__qualname__)
+
+
+class AggregatingSink(MetricsSink):
+    """Metrics sink that aggregates events in memory until dumped.
+
+    Counts builds, assignments and updates per dataclass, errors per field
+    and error type, and keeps a histogram of build latencies per dataclass.
+    Dataclasses are identified by their qualified name.  This sink can be
+    shared between threads.
+    """
+
+    BOUNDS: Sequence[float] = (
+        1e-6,
+        2e-6,
+        5e-6,
+        1e-5,
+        2e-5,
+        5e-5,
+        1e-4,
+        2e-4,
+        5e-4,
+        1e-3,
+        1e-2,
+        1e-1,
+        1.0,
+    )
+    """Upper bounds, in seconds, of the build latency histogram buckets.
+
+    There is one more bucket for builds slower than the last bound.
+    """
+
+    def __init__(self) -> None:  # noqa: D107
+        self.__lock = threading.Lock()
+        self.__builds: "Counter[str]" = Counter()
+        self.__latency: Dict[str, List[int]] = {}
+        self.__errors: "Counter[Tuple[str, str, str]]" = Counter()
+        self.__setattr: "Counter[str]" = Counter()
+        self.__updates: "Counter[str]" = Counter()
+
+    def on_build(self, dataclass: Any, seconds: float) -> None:
+        """Count the build and add its latency to the histogram."""
+        name = _name(dataclass)
+        bucket = bisect_left(self.BOUNDS, seconds)
+        with self.__lock:
+            self.__builds[name] += 1
+            try:
+                self.__latency[name][bucket] += 1
+            except KeyError:
+                self.__latency[name] = [0] * (len(self.BOUNDS) + 1)
+                self.__latency[name][bucket] += 1
+
+    def on_error(self, dataclass: Any, field: str, error: Exception) -> None:
+        """Count the error by field and type."""
+        key = (_name(dataclass), field, type(error).__name__)
+        with self.__lock:
+            self.__errors[key] += 1
+
+    def on_setattr(self, dataclass: Any, field: str) -> None:
+        """Count the assignment."""
+        name = _name(dataclass)
+        with self.__lock:
+            self.__setattr[name] += 1
+
+    def on_update(self, dataclass: Any, seconds: float) -> None:
+        """Count the update."""
+        name = _name(dataclass)
+        with self.__lock:
+            self.__updates[name] += 1
+
+    def dump(self) -> Dict[str, Any]:
+        """Get the aggregated metrics.
+
+        :return:
+            A dictionary, which can be serialized as JSON, with the keys:
+
+            * `builds`: number of builds by dataclass.
+            * `build_latency`: the `bounds` of the histogram buckets and the
+              `counts` of builds in each bucket by dataclass.
+            * `errors`: number of errors by dataclass, field and error type.
+            * `setattr`: number of field assignments by dataclass.
+            * `updates`: number of updates by dataclass.
+        """
+        with self.__lock:
+            errors: Dict[str, Dict[str, Dict[str, int]]] = {}
+            for (name, field, error), count in self.__errors.items():
+                errors.setdefault(name, {}).setdefault(field, {})[error] = count
+            return {
+                "builds": dict(self.__builds),
+                "build_latency": {
+                    "bounds": list(self.BOUNDS),
+                    "counts": {
+                        name: list(counts) for name, counts in self.__latency.items()
+                    },
+                },
+                "errors": errors,
+                "setattr": dict(self.__setattr),
+                "updates": dict(self.__updates),
+            }
+
+    def reset(self) -> None:
+        """Discard all aggregated metrics."""
+        with self.__lock:
+            self.__builds.clear()
+            self.__latency.clear()
+            self.__errors.clear()
+            self.__setattr.clear()
+            self.__updates.clear()
+
+
+def _instrument_build(build_method: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(build_method)
+    def _build(self: Any, *args: Any, **kwargs: Any) -> Any:
+        start = perf_counter()
+        try:
+            result = build_method(self, *args, **kwargs)
+        except MissingFieldError as error:
+            for sink in _SINKS:
+                sink.on_error(error.dataclass, error.field.name, error)
+            raise
+        seconds = perf_counter() - start
+        for sink in _SINKS:
+            sink.on_build(self.__dataclass__, seconds)
+        return result
+
+    return _build
+
+
+def _instrument_setattr(
+    setattr_method: Callable[[Any, str, Any], None]
+) -> Callable[[Any, str, Any], None]:
+    @wraps(setattr_method)
+    def __setattr__(self: Any, name: str, value: Any) -> None:
+        try:
+            setattr_method(self, name, value)
+        except UndefinedFieldError as error:
+            for sink in _SINKS:
+                sink.on_error(error.dataclass, error.field, error)
+            raise
+        if value is REQUIRED or value is OPTIONAL:
+            # unset fields, such as those not given to a builder's __init__
+            return
+        try:
+            dataclass = self.__dataclass__
+        except AttributeError:
+            # private attributes assigned before the builder is initialized
+            return
+        if name in _dataclass_info(dataclass).bits:
+            for sink in _SINKS:
+                sink.on_setattr(dataclass, name)
+
+    return __setattr__
+
+
+_INSTRUMENTERS: Dict[str, Callable[[Any], Any]] = {
+    "_build": _instrument_build,
+    "build": _instrument_build,
+    "__setattr__": _instrument_setattr,
+}
+
+
+def _instrument(builder: type) -> None:
+    originals = {}
+    for name, instrument in _INSTRUMENTERS.items():
+        method = vars(builder).get(name)
+        # a build field in a slots builder is a member descriptor, not a method
+        if callable(method):
+            originals[name] = method
+            setattr(builder, name, instrument(method))
+    _ORIGINALS[builder] = originals
+
+
+def _uninstrument(builder: type) -> None:
+    for name, method in _ORIGINALS.pop(builder, {}).items():
+        setattr(builder, name, method)
+
+
+def _register_builder(builder: type) -> None:
+    """Register a builder class to be instrumented while sinks are attached.
+
+    :param builder:
+        Builder class defining `_build` and `__setattr__` methods, and
+        optionally a `build` alias, that can be replaced by instrumented
+        versions.
+    """
+    with _LOCK:
+        _BUILDERS.add(builder)
+        if _SINKS:
+            _instrument(builder)
+
+
+def _updated(builder: Any, seconds: float) -> None:
+    # called by dataclass_builder.utility.update while sinks are attached
+    dataclass = builder.__dataclass__
+    for sink in _SINKS:
+        sink.on_update(dataclass, seconds)
+
+
+def attach_sink(sink: MetricsSink) -> None:
+    """Start sending instrumentation events to a metrics sink.
+
+    Attaching the first sink replaces the methods of all builder classes with
+    instrumented versions.
+
+    :param sink:
+        The sink to attach, attaching it again has no effect.
+    """
+    global _SINKS  # pylint: disable=global-statement
+    with _LOCK:
+        if sink in _SINKS:
+            return
+        if not _SINKS:
+            for builder in list(_BUILDERS):
+                _instrument(builder)
+        _SINKS = _SINKS + (sink,)
+
+
+def detach_sink(sink: Optional[MetricsSink] = None) -> None:
+    """Stop sending instrumentation events to a metrics sink.
+
+    Detaching the last sink restores the original methods of all builder
+    classes.
+
+    :param sink:
+        The sink to detach, or None to detach all sinks.  Sinks that are not
+        attached are ignored.
+    """
+    global _SINKS  # pylint: disable=global-statement
+    with _LOCK:
+        if sink is None:
+            _SINKS = ()
+        else:
+            _SINKS = tuple(s for s in _SINKS if s is not sink)
+        if not _SINKS:
+            for builder in list(_ORIGINALS.keys()):
+                _uninstrument(builder)
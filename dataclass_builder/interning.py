@@ -0,0 +1,249 @@
+"""Intern the instances built of frozen dataclasses.
+
+Builds of a dataclass whose builds are interned return a cached instance when
+the same field values have been built before, instead of allocating another
+equal instance.  This applies to :class:`dataclass_builder.wrapper.DataclassBuilder`
+and the builder classes created by
+:func:`dataclass_builder.factory.dataclass_builder`, including trusted builds.
+
+Examples
+--------
+Only builds of frozen dataclasses can be interned.
+
+.. testcode::
+
+    from dataclasses import dataclass
+    from dataclass_builder import DataclassBuilder, build
+    from dataclass_builder import intern_builds, intern_cache_info
+
+    @dataclass(frozen=True)
+    class CurrencyPair:
+        base: str
+        quote: str
+
+    intern_builds(CurrencyPair, maxsize=128)
+
+.. doctest::
+
+    >>> first = build(DataclassBuilder(CurrencyPair, base="EUR", quote="USD"))
+    >>> second = build(DataclassBuilder(CurrencyPair, base="EUR", quote="USD"))
+    >>> first is second
+    True
+    >>> intern_cache_info(CurrencyPair)
+    InternCacheInfo(hits=1, misses=1, size=1, maxsize=128)
+
+.. note::
+
+    Field values are compared by equality and type, so :code:`1` and
+    :code:`1.0` are built separately, but values inside containers are only
+    compared by equality.  Builds with an unhashable field value, or that
+    leave a field with a `default_factory` unset, are never interned.
+
+"""
+
+import dataclasses
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Hashable, MutableMapping, NamedTuple, Optional, Sequence, Tuple
+
+from ._common import OPTIONAL, _dataclass_info
+
+__all__ = ["InternCacheInfo", "intern_builds", "stop_interning", "intern_cache_info"]
+
+
+# the interner is an attribute of the dataclass because it holds instances of
+# it, so it must not be kept by the weakly keyed cache of dataclass info
+_INTERNER_ATTRIBUTE = "__dataclass_interner__"
+
+
+class InternCacheInfo(NamedTuple):
+    """Statistics of the interned instances of a dataclass."""
+
+    hits: int
+    """Number of builds that returned an interned instance."""
+
+    misses: int
+    """Number of builds that had to create an instance."""
+
+    size: int
+    """Number of interned instances."""
+
+    maxsize: Optional[int]
+    """Maximum number of interned instances, or None if they are weak."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of interned builds that returned an interned instance."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _Interner:
+    """Cache of built instances keyed by the values of their fields.
+
+    Without a `maxsize` the instances are held weakly, and are dropped once
+    nothing else references them, otherwise the least recently used instance
+    is dropped when there are more than `maxsize`.
+    """
+
+    __slots__ = (
+        "maxsize",
+        "hits",
+        "misses",
+        "_instances",
+        "_factories",
+        "_lock",
+        "__weakref__",
+    )
+
+    def __init__(self, factories: Sequence[int], maxsize: Optional[int]) -> None:
+        """
+        :param factories:
+            Positions of the fields with a `default_factory`, which are not
+            interned while unset.
+        :param maxsize:
+            Maximum number of instances to keep, or None to hold them weakly.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._instances: MutableMapping[Hashable, Any] = (
+            weakref.WeakValueDictionary() if maxsize is None else OrderedDict()
+        )
+        self._factories = tuple(factories)
+        self._lock = threading.Lock()
+
+    def get(self, values: Sequence[Any]) -> Tuple[Optional[Hashable], Any]:
+        """Look up the instance built from the values of the fields.
+
+        :param values:
+            A value for each of the settable fields, in order, which may be
+            `OPTIONAL` for unset optional fields.
+
+        :return:
+            The key to :meth:`put` the instance with, or None if it cannot be
+            interned, and the interned instance, or None if there is none.
+        """
+        for i in self._factories:
+            if values[i] is OPTIONAL:
+                return None, None
+        # the types keep values that are equal but not the same apart
+        key = (*values, *map(type, values))
+        # lookups are single operations on the mapping so don't need the lock,
+        # only the statistics may miss an increment when threads race
+        try:
+            instance = self._instances.get(key)
+        except TypeError:
+            return None, None
+        if instance is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            if self.maxsize is not None:
+                try:
+                    self._instances.move_to_end(key)  # type: ignore
+                except KeyError:
+                    # evicted by another thread since it was looked up
+                    pass
+        return key, instance
+
+    def put(self, key: Hashable, instance: Any) -> Any:
+        """Intern an instance unless another thread interned one first.
+
+        :param key:
+            The key returned by :meth:`get`.
+        :param instance:
+            The instance built from the values given to :meth:`get`.
+
+        :return:
+            The interned instance.
+        """
+        with self._lock:
+            instance = self._instances.setdefault(key, instance)
+            if self.maxsize is not None and len(self._instances) > self.maxsize:
+                self._instances.popitem(last=False)  # type: ignore
+        return instance
+
+    def info(self) -> InternCacheInfo:
+        """Get the statistics of the interned instances."""
+        with self._lock:
+            return InternCacheInfo(
+                self.hits, self.misses, len(self._instances), self.maxsize
+            )
+
+
+def intern_builds(dataclass: Any, *, maxsize: Optional[int] = 1024) -> None:
+    """Start interning the instances built of a frozen dataclass.
+
+    Calling this again for the same dataclass discards the interned instances
+    and statistics.
+
+    :param dataclass:
+        The frozen :func:`dataclasses.dataclass` to intern the builds of.
+    :param maxsize:
+        Maximum number of instances to intern, the least recently built is
+        discarded to make room for another.  Set to None to instead intern
+        instances only for as long as they are referenced elsewhere, which
+        requires the instances to support weak references.
+
+    :raises TypeError:
+        If `dataclass` is not a frozen dataclass, or `maxsize` is None and its
+        instances don't support weak references.
+    :raises ValueError:
+        If `maxsize` is less than one.
+    """
+    if not (isinstance(dataclass, type) and dataclasses.is_dataclass(dataclass)):
+        raise TypeError("must be called with a dataclass type")
+    if not dataclass.__dataclass_params__.frozen:  # type: ignore
+        raise TypeError(f"dataclass '{dataclass.__qualname__}' is not frozen")
+    if maxsize is None:
+        if not dataclass.__weakrefoffset__:
+            raise TypeError(
+                f"instances of dataclass '{dataclass.__qualname__}' do not "
+                "support weak references, set a maxsize"
+            )
+    elif maxsize < 1:
+        raise ValueError("maxsize must be at least one")
+    info = _dataclass_info(dataclass)
+    factories = [
+        i
+        for i, field in enumerate(info.settable.values())
+        if field.default_factory is not dataclasses.MISSING
+    ]
+    interner = _Interner(factories, maxsize)
+    setattr(dataclass, _INTERNER_ATTRIBUTE, interner)
+    info.interner = weakref.ref(interner)
+
+
+def stop_interning(dataclass: Any) -> None:
+    """Stop interning the instances built of a dataclass and discard them.
+
+    :param dataclass:
+        The :func:`dataclasses.dataclass` to stop interning the builds of, if
+        they are not interned this does nothing.
+    """
+    _dataclass_info(dataclass).interner = None
+    if _INTERNER_ATTRIBUTE in vars(dataclass):
+        delattr(dataclass, _INTERNER_ATTRIBUTE)
+
+
+def intern_cache_info(dataclass: Any) -> InternCacheInfo:
+    """Get statistics of the interned instances of a dataclass.
+
+    :param dataclass:
+        The :func:`dataclasses.dataclass` given to :func:`intern_builds`.
+
+    :return:
+        The number of hits and misses since interning started, the number of
+        interned instances and the maximum number of interned instances.
+
+    :raises ValueError:
+        If the builds of `dataclass` are not interned.
+    """
+    interner: Optional[_Interner] = vars(dataclass).get(_INTERNER_ATTRIBUTE)
+    if interner is None:
+        raise ValueError(
+            f"builds of dataclass '{dataclass.__qualname__}' are not interned"
+        )
+    return interner.info()
@@ -0,0 +1,139 @@
+"""Reuse dataclass builders instead of creating one for every dataclass.
+
+Examples
+--------
+A pool hands out builders for a single dataclass and takes them back once
+they have been built, resetting them so they can be handed out again.
+
+.. testcode::
+
+    from dataclasses import dataclass
+    from dataclass_builder import BuilderPool, build
+
+    @dataclass
+    class Point:
+        x: float
+        y: float
+        w: float = 1.0
+
+    pool = BuilderPool(Point)
+
+.. doctest::
+
+    >>> builder = pool.acquire(x=5.8)
+    >>> builder.y = 8.1
+    >>> build(builder)
+    Point(x=5.8, y=8.1, w=1.0)
+    >>> pool.release(builder)
+    >>> pool.acquire() is builder
+    True
+
+"""
+
+import dataclasses
+from functools import partial
+from typing import Any, Callable, List, Type
+
+from ._common import _dataclass_info
+from .utility import fields, reset
+from .wrapper import DataclassBuilder
+
+__all__ = ["BuilderPool"]
+
+
+class BuilderPool:
+    """A bounded pool of reusable builders for a single dataclass.
+
+    Builders are created on demand by :meth:`acquire` and given back with
+    :meth:`release`, which resets them with
+    :func:`dataclass_builder.utility.reset` and keeps up to `max_size` of them
+    for future calls to :meth:`acquire`.  This avoids allocating, and later
+    garbage collecting, a builder for every dataclass that is built.
+
+    The pool can be shared between threads.
+    """
+
+    def __init__(self, dataclass: Any, *, max_size: int = 64):
+        """
+        :param dataclass:
+            The :func:`dataclasses.dataclass` to pool
+            :class:`dataclass_builder.wrapper.DataclassBuilder`'s for, or a
+            builder class from :func:`dataclass_builder.factory.dataclass_builder`
+            to pool instances of.
+        :param max_size:
+            Maximum number of idle builders kept by the pool.
+
+        :raises TypeError:
+            If `dataclass` is not a dataclass or a builder class.
+        :raises ValueError:
+            If `max_size` is negative.
+        """
+        if max_size < 0:
+            raise ValueError("maximum size of a pool cannot be negative")
+        if dataclasses.is_dataclass(dataclass):
+            self.__type: Type[Any] = DataclassBuilder
+            self.__create: Callable[..., Any] = partial(DataclassBuilder, dataclass)
+        else:
+            dataclass_ = getattr(dataclass, "__dataclass__", None)
+            if not dataclasses.is_dataclass(dataclass_):
+                raise TypeError("must be called with a dataclass or builder type")
+            self.__type = dataclass
+            self.__create = dataclass
+            dataclass = dataclass_
+        self.__fields = _dataclass_info(dataclass).settable
+        self.__max_size = max_size
+        self.__idle: List[Any] = []
+
+    def __len__(self) -> int:
+        """Get the number of idle builders in the pool."""
+        return len(self.__idle)
+
+    def acquire(self, **kwargs: Any) -> Any:
+        r"""Get a builder with no fields set, other than those given.
+
+        :param \*\*kwargs:
+            Optionally initialize fields of the builder, the same as the
+            keyword arguments of the builder's constructor.
+
+        :return:
+            An idle builder from the pool or a new builder if there are none.
+
+        :raises TypeError:
+            If one of the `kwargs` is not a settable field of the dataclass.
+        """
+        # checked before any field is assigned, so idle builders stay unset
+        for key in kwargs:
+            if key not in self.__fields:
+                raise TypeError(f"acquire() got an unexpected keyword argument '{key}'")
+        try:
+            builder = self.__idle.pop()
+        except IndexError:
+            return self.__create(**kwargs)
+        try:
+            for key, value in kwargs.items():
+                setattr(builder, key, value)
+        except BaseException:
+            # such as a value rejected by a builder that validates its fields
+            reset(builder)
+            self.__idle.append(builder)
+            raise
+        return builder
+
+    def release(self, builder: Any) -> None:
+        """Give a builder back to the pool.
+
+        The builder is reset and, unless the pool already holds `max_size`
+        idle builders, kept for reuse.  It must not be used after this.
+
+        :param builder:
+            A builder from :meth:`acquire`, or any builder of the same type for
+            the same dataclass.
+
+        :raises ValueError:
+            If `builder` is not of the type or for the dataclass of this pool.
+        """
+        if type(builder) is not self.__type or fields(builder) is not self.__fields:
+            raise ValueError(f"{builder!r} does not belong to this pool")
+        if len(self.__idle) < self.__max_size:
+            reset(builder)
+            self.__idle.append(builder)
@@ -1,23 +1,100 @@
 """Utility functions for the package."""
 
-from typing import TYPE_CHECKING, Any
+import dataclasses
+import os
+from copy import copy
+from functools import partial
+from inspect import isawaitable
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
-from ._common import MISSING
-from .wrapper import DataclassBuilder
+from . import instrumentation as _instrumentation
+from ._common import Lazy, _dataclass_info
+from .exceptions import MissingFieldError, UndefinedFieldError
+from .wrapper import DataclassBuilder, _nested_fields
 
 if TYPE_CHECKING:
-    from typing import Mapping
+    from concurrent.futures import Executor
     from dataclasses import Field
+    from typing import Protocol
 
-__all__ = ["build", "fields", "update"]
+    class _Builder(Protocol):
+        # the private methods of builders used by the functions of this module,
+        # implemented by DataclassBuilder, BatchBuilder and the builder classes
+        # created by dataclass_builder
+        @property
+        def __dataclass__(self) -> Any:
+            ...
 
+        def _build(self, trusted: bool = False) -> Any:
+            ...
 
-def build(builder: DataclassBuilder) -> Any:
+        def _fields(
+            self, required: bool = True, optional: bool = True
+        ) -> "Mapping[str, Field[Any]]":
+            ...
+
+        def _changed(self) -> Tuple[str, ...]:
+            ...
+
+        def _clone(self) -> Any:
+            ...
+
+        def _is_complete(self) -> bool:
+            ...
+
+        def _missing(self) -> "Mapping[str, Field[Any]]":
+            ...
+
+        def _reset(self) -> None:
+            ...
+
+
+_BuilderT = TypeVar("_BuilderT", bound="_Builder")
+
+__all__ = [
+    "build",
+    "fields",
+    "update",
+    "changed_fields",
+    "clone",
+    "is_complete",
+    "missing",
+    "reset",
+    "abuild",
+    "build_parallel",
+    "build_many",
+    "RowError",
+]
+
+
+def build(builder: "_Builder", *, trusted: bool = False) -> Any:
     """Use the given :class:`DataclassBuilder` to initialize a `dataclass`.
 
     This will use the values assigned to the given `builder` to construct a
     :func:`dataclasses.dataclass` of the type the `builder` was created for.
 
+    Values that have already been validated can be built faster with
+    `trusted`, this creates the instance with :code:`object.__new__` and
+    assigns its fields directly instead of calling the `__init__` method of
+    the dataclass.  Unset fields are still given their default or
+    `default_factory` value, `__post_init__` is still called, and frozen
+    dataclasses are supported.  Dataclasses that don't use the `__init__`
+    method generated by :func:`dataclasses.dataclass`, or that have init-only
+    variables, are always built by calling them.
+
     .. note::
 
         This is not a method of :class:`DataclassBuilder` in order to not
@@ -27,6 +104,8 @@ def build(builder: DataclassBuilder) -> Any:
 
     :param builder:
         The dataclass builder to build from.
+    :param trusted:
+        Set to True to skip the `__init__` method of the dataclass.
 
     :raises dataclass_builder.exceptions.MissingFieldError:
         If not all of the required fields have been assigned to this
@@ -34,11 +113,112 @@ def build(builder: DataclassBuilder) -> Any:
 
     """
     # pylint: disable=protected-access
+    if trusted:
+        return builder._build(trusted=True)
     return builder._build()
 
 
+async def abuild(builder: "_Builder") -> Any:
+    """Build a dataclass from a builder whose fields may be awaitable.
+
+    This is the same as :func:`build` except that fields can be assigned
+    awaitables, such as coroutines, tasks or futures, and these are all awaited
+    concurrently with :func:`asyncio.gather` to get the value of their field.
+    Required fields are checked before anything is awaited.
+
+    The `builder` itself is not modified, its awaitables are resolved into a
+    copy of it that is then built.
+
+    :param builder:
+        The dataclass builder to build from.
+
+    :return:
+        An instance of the dataclass of the `builder`.
+
+    :raises dataclass_builder.exceptions.MissingFieldError:
+        If not all of the required fields have been assigned to this
+        builder.
+    """
+    missing_fields = missing(builder)
+    if missing_fields:
+        name, field = next(iter(missing_fields.items()))
+        dataclass = builder.__dataclass__
+        raise MissingFieldError(
+            f"field '{name}' of dataclass '{dataclass.__qualname__}' is not optional",
+            dataclass,
+            field,
+        )
+    pending = {}
+    # unset fields are REQUIRED or OPTIONAL, so are never awaitable
+    for name in changed_fields(builder):
+        value = getattr(builder, name)
+        if isawaitable(value):
+            pending[name] = value
+    if pending:
+        # asyncio is slow to import, so only pay for it when awaiting
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        values = await asyncio.gather(*pending.values())
+        builder = copy(builder)
+        for name, value in zip(pending, values):
+            setattr(builder, name, value)
+    return build(builder)
+
+
+def build_parallel(
+    builders: Iterable["_Builder"],
+    *,
+    executor: Optional["Executor"] = None,
+    chunksize: Optional[int] = None,
+    trusted: bool = False,
+) -> List[Any]:
+    """Build many dataclasses in other processes.
+
+    This is worthwhile when building is expensive, such as dataclasses with a
+    CPU heavy `__post_init__`, as the builders and the built dataclasses are
+    pickled to send them between processes.  Builders are sent in chunks to
+    reduce the number of messages.  The dataclasses must be importable by
+    their qualified names, builder classes created by
+    :func:`dataclass_builder.factory.dataclass_builder` are created again in
+    the processes that need them.
+
+    :param builders:
+        The dataclass builders to build from.
+    :param executor:
+        A :class:`concurrent.futures.Executor` to build with, such as a
+        :class:`concurrent.futures.ProcessPoolExecutor`.  By default a process
+        pool is created for the call, with one process per CPU.
+    :param chunksize:
+        Number of builders sent to a process at a time, by default the
+        builders are split into four chunks per CPU.  Executors other than
+        process pools ignore this.
+    :param trusted:
+        Set to True to skip the `__init__` method of the dataclasses, see
+        :func:`build`.
+
+    :return:
+        A list of the built dataclasses, in the same order as the `builders`.
+
+    :raises dataclass_builder.exceptions.MissingFieldError:
+        If not all of the required fields have been assigned to one of the
+        `builders`.
+    """
+    builders = list(builders)
+    if chunksize is None:
+        chunksize = max(1, -(-len(builders) // (4 * (os.cpu_count() or 1))))
+    build_ = partial(build, trusted=True) if trusted else build
+    if executor is not None:
+        return list(executor.map(build_, builders, chunksize=chunksize))
+    # only pay for importing concurrent.futures when it is used
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(build_, builders, chunksize=chunksize))
+
+
 def fields(
-    builder: DataclassBuilder, *, required: bool = True, optional: bool = True
+    builder: "_Builder", *, required: bool = True, optional: bool = True
 ) -> "Mapping[str, Field[Any]]":
     """Get a dictionary of the given :class:`DataclassBuilder`'s fields.
 
@@ -66,7 +246,7 @@ def fields(
     return builder._fields(required=required, optional=optional)
 
 
-def update(dataclass: Any, builder: DataclassBuilder) -> None:
+def update(dataclass: Any, builder: "_Builder") -> None:
     """Update a dataclass or dataclass builder from a partial dataclass builder.
 
     :param dataclass:
@@ -79,9 +259,247 @@ def update(dataclass: Any, builder: DataclassBuilder) -> None:
     :param builder:
         The datalcass builder to update `dataclass` with.  All fields that are
         not missing in the `builder` will be set (overridden) on the given
-        `dataclass`.
+        `dataclass`, in the order they were assigned to the `builder`.  Fields
+        assigned :func:`dataclass_builder.lazy` values are resolved first,
+        and nested fields assigned builders are built, unless `dataclass` is
+        a builder.
     """
-    for field in fields(builder):
+    # only time updates when they are instrumented
+    start = perf_counter() if _instrumentation._SINKS else None
+    # lazy values and nested builders are kept when updating builders, but not
+    # dataclasses
+    is_dataclass = dataclasses.is_dataclass(dataclass)
+    resolve = Lazy._used and is_dataclass
+    # only builders with the nested option create builders of nested fields
+    nested = _nested_fields(builder) if is_dataclass else {}
+    # only assigned fields are visited, no matter how many fields there are
+    for field in changed_fields(builder):
         value = getattr(builder, field)
-        if value != MISSING:
-            setattr(dataclass, field, value)
+        if isinstance(value, DataclassBuilder) and field in nested:
+            value = build(value)
+        elif resolve and type(value) is Lazy:
+            value = value.resolve()
+        setattr(dataclass, field, value)
+    if start is not None:
+        # pylint: disable=protected-access
+        _instrumentation._updated(builder, perf_counter() - start)
+
+
+def changed_fields(builder: "_Builder") -> Tuple[str, ...]:
+    """Get the names of the fields that have been assigned to a builder.
+
+    Fields are given in the order they were first assigned, and are removed
+    if they are assigned `REQUIRED` or `OPTIONAL` or the builder is reset.
+
+    .. note::
+
+        This is not a method of :class:`DataclassBuilder` in order to not
+        interfere with possible field names.  This function will use special
+        private methods of :class:`DataclassBuilder` which are excepted from
+        field assignment.
+
+    :param builder:
+        The dataclass builder to get the assigned fields of.
+
+    :return:
+        Names of the assigned fields of the `builder`, in assignment order.
+    """
+    # pylint: disable=protected-access
+    return builder._changed()
+
+
+def clone(builder: _BuilderT) -> _BuilderT:
+    """Create a builder that starts with the field values of another builder.
+
+    The values of the fields are moved into a prototype that is shared by the
+    `builder` and the clone, instead of being copied, and each builder then
+    only stores the fields assigned to it after cloning.  Assigning a field
+    of one does not change the other.  Cloning a clone merges the prototype
+    with the fields assigned since, so fields are never looked up through a
+    chain of prototypes.
+
+    Builders created by :func:`dataclass_builder.factory.dataclass_builder`
+    with `slots` have no instance dictionary to share, so they are copied.
+
+    .. note::
+
+        This is not a method of :class:`DataclassBuilder` in order to not
+        interfere with possible field names.  This function will use special
+        private methods of :class:`DataclassBuilder` which are excepted from
+        field assignment.
+
+    :param builder:
+        The dataclass builder to clone.
+
+    :return:
+        A new builder of the same type with the same field values.
+    """
+    # pylint: disable=protected-access
+    clone_: _BuilderT = builder._clone()
+    return clone_
+
+
+def is_complete(builder: "_Builder") -> bool:
+    """Determine if a :class:`DataclassBuilder` can be built.
+
+    Builders keep track of which fields have been assigned as they are set,
+    so this takes constant time regardless of the number of fields.
+
+    .. note::
+
+        This is not a method of :class:`DataclassBuilder` in order to not
+        interfere with possible field names.  This function will use special
+        private methods of :class:`DataclassBuilder` which are excepted from
+        field assignment.
+
+    :param builder:
+        The dataclass builder to check.
+
+    :return:
+        True if every required field of the `builder` has been assigned,
+        otherwise False.
+    """
+    # pylint: disable=protected-access
+    return builder._is_complete()
+
+
+def missing(builder: "_Builder") -> "Mapping[str, Field[Any]]":
+    """Get a dictionary of the required fields a builder is missing.
+
+    Unlike :func:`build`, which stops at the first missing field, this reports
+    every required field that has not been assigned.
+
+    .. note::
+
+        This is not a method of :class:`DataclassBuilder` in order to not
+        interfere with possible field names.  This function will use special
+        private methods of :class:`DataclassBuilder` which are excepted from
+        field assignment.
+
+    :param builder:
+        The dataclass builder to get the missing fields of.
+
+    :return:
+        A mapping from field names to actual :class:`dataclasses.Field`'s
+        of the required fields that have not been assigned, in the same order
+        as the `builder`'s underlying :func:`dataclasses.dataclass`.  This is
+        empty if the `builder` is complete.
+    """
+    # pylint: disable=protected-access
+    return builder._missing()
+
+
+def reset(builder: "_Builder") -> None:
+    """Return a builder to the state it was in when created without fields.
+
+    Every field is set back to `REQUIRED` or `OPTIONAL`, this is cheaper than
+    creating a new builder and allows builders to be reused, see
+    :class:`dataclass_builder.pool.BuilderPool`.
+
+    .. note::
+
+        This is not a method of :class:`DataclassBuilder` in order to not
+        interfere with possible field names.  This function will use special
+        private methods of :class:`DataclassBuilder` which are excepted from
+        field assignment.
+
+    :param builder:
+        The dataclass builder to reset.
+    """
+    # pylint: disable=protected-access
+    builder._reset()
+
+
+class RowError(NamedTuple):
+    """A row that could not be built by :func:`build_many`."""
+
+    position: int
+    """Position of the row in the iterable of rows."""
+    row: Mapping[str, Any]
+    """The row that could not be built."""
+    error: Union[MissingFieldError, UndefinedFieldError]
+    """Reason the row could not be built."""
+
+
+def build_many(
+    dataclass: Any, rows: Iterable[Mapping[str, Any]], *, errors: str = "raise"
+) -> Iterator[Any]:
+    """Lazily build a dataclass from each mapping of field values in `rows`.
+
+    This is equivalent to initializing a builder with each row and building it
+    but the fields are checked against sets computed once for the dataclass,
+    so no builder is created for each row.  Only one row is held at a time.
+
+    :param dataclass:
+        The :func:`dataclasses.dataclass` to build, or a builder class created
+        for it by :func:`dataclass_builder.factory.dataclass_builder`.
+    :param rows:
+        Iterable of mappings from field names to values.
+    :param errors:
+        What to do with a row that has a field not settable in `dataclass` or
+        is missing a required field.
+
+        * "raise" - raise the :class:`UndefinedFieldError` or
+          :class:`MissingFieldError` (default).
+        * "skip" - skip the row.
+        * "yield" - yield a :class:`RowError` in place of the dataclass.
+
+    :return:
+        An iterator of `dataclass` instances, one per row in `rows` (except
+        for skipped rows).
+
+    :raises TypeError:
+        If `dataclass` is not a dataclass or a builder class.
+    :raises ValueError:
+        If `errors` is not one of the values listed above.
+    :raises dataclass_builder.exceptions.UndefinedFieldError:
+        While iterating if `errors` is "raise" and a row has a field that is
+        not settable in the `dataclass`.
+    :raises dataclass_builder.exceptions.MissingFieldError:
+        While iterating if `errors` is "raise" and a row is missing a required
+        field of the `dataclass`.
+    """
+    if errors not in ("raise", "skip", "yield"):
+        raise ValueError(f"errors must be 'raise', 'skip' or 'yield', not {errors!r}")
+    if not dataclasses.is_dataclass(dataclass):
+        dataclass = getattr(dataclass, "__dataclass__", None)
+        if not dataclasses.is_dataclass(dataclass):
+            raise TypeError("must be called with a dataclass or builder type")
+    return _build_many(dataclass, rows, errors)
+
+
+def _build_many(
+    dataclass: Any, rows: Iterable[Mapping[str, Any]], errors: str
+) -> Iterator[Any]:
+    info = _dataclass_info(dataclass)
+    settable = info.settable.keys()
+    required = info.required.keys()
+    for position, row in enumerate(rows):
+        keys = row.keys()
+        if keys <= settable and keys >= required:
+            yield dataclass(**row)
+        elif errors == "raise":
+            raise _row_error(dataclass, row)
+        elif errors == "yield":
+            yield RowError(position, row, _row_error(dataclass, row))
+
+
+def _row_error(
+    dataclass: Any, row: Mapping[str, Any]
+) -> Union[MissingFieldError, UndefinedFieldError]:
+    info = _dataclass_info(dataclass)
+    for name in row:
+        if name not in info.settable:
+            return UndefinedFieldError(
+                f"dataclass '{dataclass.__name__}' does not define field '{name}'",
+                dataclass,
+                name,
+            )
+    name, field = next(
+        (name, field) for name, field in info.required.items() if name not in row
+    )
+    return MissingFieldError(
+        f"field '{name}' of dataclass '{dataclass.__qualname__}' is not optional",
+        dataclass,
+        field,
+    )
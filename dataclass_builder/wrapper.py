@@ -117,20 +117,35 @@ or only the optional fields.
     >>> list(fields(builder, required=False).keys())
     ['w']
 
+Builders created with `nested` create a builder for each field whose type is a
+dataclass when it is first read, and build those builders with their parent.
+
+.. testcode::
+
+    @dataclass
+    class Line:
+        start: Point
+        end: Point
+
+.. doctest::
+
+    >>> builder = DataclassBuilder(Line, nested=True)
+    >>> builder.start.x = 1.0
+    >>> builder.start.y = 2.0
+    >>> builder.end = Point(3.0, 4.0)
+    >>> build(builder)
+    Line(start=Point(x=1.0, y=2.0, w=1.0), end=Point(x=3.0, y=4.0, w=1.0))
+
 """
 
 import dataclasses
-from typing import TYPE_CHECKING, Any, Mapping
-
-from ._common import (
-    OPTIONAL,
-    REQUIRED,
-    _is_required,
-    _optional_fields,
-    _required_fields,
-    _settable_fields,
-)
+from copy import copy, deepcopy
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from ._common import OPTIONAL, REQUIRED, Lazy, _dataclass_info, _field_types
+from ._validation import _check_rejected, _field_checkers
 from .exceptions import MissingFieldError, UndefinedFieldError
+from .interning import _Interner
 
 __all__ = ["DataclassBuilder"]
 
@@ -152,6 +167,11 @@ class DataclassBuilder:
 
     """
 
+    # bits of the fields assigned without checking their values, there are
+    # none until __init__ assigns the ones of the dataclass and none for
+    # builders that validate, so only those go through checks
+    __unchecked: Mapping[str, int] = {}
+
     def __init__(self, dataclass: Any, **kwargs: Any):
         r"""
         :param dataclass:
@@ -162,26 +182,54 @@ class DataclassBuilder:
             These can be changed later and will raise UndefinedFieldError if
             they are not part of the `dataclass`'s `__init__` method.
 
+            Unless the `dataclass` has a field named `nested`, setting
+            `nested` to True makes reading an unset field whose type is a
+            dataclass assign it a new builder for that dataclass, which also
+            has `nested` set.  Builders assigned to these fields are built
+            when this builder is built, so only the builders that were used
+            are created and built.
+
+            Likewise, unless the `dataclass` has a field named `validate`,
+            setting `validate` to True checks that every value assigned to a
+            field is of the type of the field.  The check of each field is
+            compiled once per dataclass, from the resolved type hints.
+            Nested builders also have `validate` set.
+
         :raises TypeError:
             If `dataclass` is not a dataclass.
             This is decided via :func:`dataclasses.is_dataclass`.
         :raises dataclass_builder.exceptions.UndefinedFieldError:
             If you try to assign to a field that is not part of the
             `dataclass`'s `__init__`.
+        :raises dataclass_builder.exceptions.FieldTypeError:
+            If `validate` is set and a value is not of the type of its field.
         :raises dataclass_builder.exceptions.MissingFieldError:
             If :func:`build` is called on this builder before all non default
             fields of the `dataclass` are assigned.
         """
         if not dataclasses.is_dataclass(dataclass):
             raise TypeError("must be called with a dataclass type")
-        self.__dataclass = dataclass
-        # store this primarily for efficiency
-        self.__settable_fields = _settable_fields(dataclass)
-        for name, field in self.__settable_fields.items():
-            if _is_required(field):
-                setattr(self, name, REQUIRED)
-            else:
-                setattr(self, name, OPTIONAL)
+        self.__dataclass: Any = dataclass
+        # shared by all builders of the dataclass, so this is only computed once
+        self.__info = _dataclass_info(dataclass)
+        self.__settable_fields = self.__info.settable
+        self.__mask = 0
+        # options are only taken from keyword arguments that are not fields
+        nested = "nested" not in self.__settable_fields and kwargs.pop(
+            "nested", False
+        )
+        self.__nested: Mapping[str, Any] = (
+            _field_types(dataclass).nested if nested else {}
+        )
+        validate = "validate" not in self.__settable_fields and kwargs.pop(
+            "validate", False
+        )
+        self.__checkers: Optional[Mapping[str, Callable[[Any], bool]]] = (
+            _field_checkers(dataclass) if validate else None
+        )
+        if not validate:
+            self.__unchecked = self.__info.bits
+        # unset fields are not stored, __getattr__ gives their sentinels
         for key, value in kwargs.items():
             if key not in self.__settable_fields:
                 raise TypeError(
@@ -212,22 +260,116 @@ class DataclassBuilder:
             If `item` is not initialisable in the underlying dataclass.  If
             `item` is private (begins with an underscore) or is a "dunder" then
             this exception will not be raised.
+        :raises dataclass_builder.exceptions.FieldTypeError:
+            If the builder validates fields and `value` is not of the type of
+            the field, unless it is a :func:`dataclass_builder.lazy` value or
+            awaitable, which are not checked.
 
         """
-        if item.startswith("_") or item in self.__settable_fields:
-            self.__dict__[item] = value
+        bit = self.__unchecked.get(item)
+        if bit is None:
+            bit = self.__checked_bit(item, value)
+            if bit is None:
+                return
+        dict_ = self.__dict__
+        # write the mask directly, it is private so would pass through
+        if value is REQUIRED or value is OPTIONAL:
+            dict_["_DataclassBuilder__mask"] &= ~bit
+            order = dict_.get("_DataclassBuilder__order", ())
+            if item in order:
+                dict_["_DataclassBuilder__order"] = tuple(
+                    name for name in order if name != item
+                )
+            if "_DataclassBuilder__proto" in dict_:
+                # hides the value of the field in the prototype
+                dict_[item] = value
+            else:
+                dict_.pop(item, None)
         else:
+            dict_[item] = value
+            mask = dict_["_DataclassBuilder__mask"]
+            if mask > bit and not mask & bit:
+                # assigned before a field after it, so the order is kept
+                dict_["_DataclassBuilder__order"] = self.__info.assigned(
+                    mask, dict_.get("_DataclassBuilder__order", ())
+                ) + (item,)
+            dict_["_DataclassBuilder__mask"] = mask | bit
+
+    def __checked_bit(self, item: str, value: Any) -> Optional[int]:
+        # the bit of a field of a builder that validates, once its value is
+        # checked, otherwise sets the attribute if it is private
+        checkers = self.__dict__.get("_DataclassBuilder__checkers")
+        if checkers is not None:
+            bit = self.__info.bits.get(item)
+            if bit is not None:
+                if value is not REQUIRED and value is not OPTIONAL:
+                    self.__check(checkers, item, value)
+                return bit
+        if not item.startswith("_"):
             raise UndefinedFieldError(
                 f"dataclass '{self.__dataclass.__name__}' does not define "
                 f"field '{item}'",
                 self.__dataclass,
                 item,
             )
+        self.__dict__[item] = value
+        return None
+
+    def __check(
+        self, checkers: Mapping[str, Callable[[Any], bool]], item: str, value: Any
+    ) -> None:
+        # validate the value of a field, builders of nested fields are checked
+        # when they are built
+        check = checkers.get(item)
+        if check is None or check(value):
+            return
+        nested = self.__nested.get(item)
+        if isinstance(value, DataclassBuilder) and nested is not None:
+            if issubclass(value.__dataclass__, nested):
+                return
+        _check_rejected(self.__dataclass, item, value)
+
+    def __getattr__(self, item: str) -> Any:
+        """Get a field that is not stored by the builder.
+
+        Only called for attributes that are not in the instance dictionary,
+        which only stores the assigned fields, so the builder of a dataclass
+        with many fields stays small when few are assigned.  Unset fields are
+        REQUIRED or OPTIONAL, as given by the shared information about the
+        dataclass, or a new builder for unset dataclass fields of builders
+        with `nested` set.  The values of the fields of cloned builders are
+        kept in a prototype shared between the clones, until they are
+        assigned.
 
-    if TYPE_CHECKING:
-        # tells type checking that it should ignore attribute access
-        def __getattr__(self, item: str) -> Any:
-            return self.__getattribute__(item)
+        :param item:
+            Name of the dataclass field.
+
+        :raises AttributeError:
+            If `item` is not a field of the dataclass.
+        """
+        dict_ = self.__dict__
+        try:
+            return dict_["_DataclassBuilder__proto"][item]
+        except KeyError:
+            pass
+        try:
+            sentinel = dict_["_DataclassBuilder__info"].sentinels[item]
+        except KeyError:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{item}'"
+            ) from None
+        nested = dict_["_DataclassBuilder__nested"].get(item)
+        if nested is None:
+            return sentinel
+        validate = dict_["_DataclassBuilder__checkers"] is not None
+        builder = _configure(DataclassBuilder(nested), True, validate)
+        setattr(self, item, builder)
+        return builder
+
+    @property
+    def __dataclass__(self) -> Any:
+        """The dataclass this builder builds."""
+        return self.__dataclass
 
     def __repr__(self) -> str:
         """Print a representation of the builder.
@@ -251,15 +393,19 @@ class DataclassBuilder:
             instance.
         """
         args = [self.__dataclass.__qualname__]
-        for name in self.__settable_fields:
-            value = getattr(self, name)
-            if value not in (REQUIRED, OPTIONAL):
-                args.append(f"{name}={repr(value)}")
+        # unset fields are not read, they may create nested builders
+        for name in self.__info.assigned(self.__mask):
+            args.append(f"{name}={repr(getattr(self, name))}")
         return f'{self.__class__.__qualname__}({", ".join(args)})'
 
-    def _build(self) -> Any:
+    def _build(self, trusted: bool = False) -> Any:
         """Build the underlying dataclass using the fields from this builder.
 
+        :param trusted:
+            Set to True to skip the `__init__` method of the dataclass and
+            assign the fields of the new instance directly, see
+            :func:`dataclass_builder.utility.build`.
+
         :return dataclass:
             An instance of the dataclass given in :func:`__init__` using the
             fields set on this builder instance.
@@ -270,22 +416,226 @@ class DataclassBuilder:
 
         """
         # check for missing required fields
-        for name, field in _required_fields(self.__dataclass).items():
-            if getattr(self, name) is REQUIRED:
-                raise MissingFieldError(
-                    f"field '{name}' of dataclass "
-                    f"'{self.__dataclass.__qualname__}' "
-                    "is not optional",
-                    self.__dataclass,
-                    field,
-                )
+        missing = self.__info.missing(self.__mask)
+        if missing:
+            name, field = next(iter(missing.items()))
+            raise MissingFieldError(
+                f"field '{name}' of dataclass "
+                f"'{self.__dataclass.__qualname__}' "
+                "is not optional",
+                self.__dataclass,
+                field,
+            )
         # build dataclass
-        kwargs = {
-            name: getattr(self, name)
-            for name in self.__settable_fields
-            if getattr(self, name) is not OPTIONAL
+        values = self.__dict__
+        proto = values.get("_DataclassBuilder__proto")
+        if proto is not None:
+            values = {**proto, **values}
+        names = self.__info.names
+        if self.__mask == (1 << len(names)) - 1:
+            positions = None
+            args = [values[name] for name in names]
+        else:
+            positions, args = self.__read_assigned(values)
+        if self.__nested:
+            self.__build_nested(args, trusted)
+        if Lazy._used:  # pylint: disable=protected-access
+            # only resolved once the build can no longer fail for a missing field
+            self.__resolve_lazy(args, positions)
+        interner = self.__interner()
+        if interner is None:
+            return self.__construct(args, positions, trusted)
+        key, instance = interner.get(args)
+        if instance is None:
+            instance = self.__construct(args, positions, trusted)
+            if key is not None:
+                return interner.put(key, instance)
+        return instance
+
+    def __read_assigned(
+        self, values: Mapping[str, Any]
+    ) -> Tuple[List[int], List[Any]]:
+        # only the assigned fields are read, so this scales with their number,
+        # unset fields are OPTIONAL as the build already checked the required
+        names = self.__info.names
+        positions = self.__info.positions(self.__mask)
+        args: List[Any] = [OPTIONAL] * len(names)
+        for i in positions:
+            args[i] = values[names[i]]
+        return positions, args
+
+    def __build_nested(self, args: List[Any], trusted: bool) -> None:
+        # builders of nested fields are built before any lazy values are
+        # resolved, so a missing field of a child fails the build first
+        index = self.__info.index
+        for name in self.__nested:
+            arg = args[index[name]]
+            if isinstance(arg, DataclassBuilder):
+                args[index[name]] = arg._build(trusted)
+
+    @staticmethod
+    def __resolve_lazy(args: List[Any], positions: Optional[List[int]]) -> None:
+        # only the assigned fields, at positions if given, can be lazy
+        for i in range(len(args)) if positions is None else positions:
+            if type(args[i]) is Lazy:
+                args[i] = args[i].resolve()
+
+    def __interner(self) -> Optional[_Interner]:
+        # a weak reference, the interner is owned by the dataclass
+        reference = self.__info.interner
+        return reference() if reference is not None else None
+
+    def __construct(
+        self, args: List[Any], positions: Optional[List[int]], trusted: bool
+    ) -> Any:
+        # call the dataclass with the values of its fields, or only those at
+        # positions if given as the others are unset
+        if trusted:
+            return self.__info.build_trusted(self.__dataclass, args)
+        names = self.__info.names
+        positional = self.__info.positional
+        if positional is None:
+            kwargs = {
+                name: arg for name, arg in zip(names, args) if arg is not OPTIONAL
+            }
+            return self.__dataclass(**kwargs)
+        # unset fields are optional, their defaults are passed instead
+        if positions is not None:
+            assigned = args
+            args = list(self.__info.arguments)  # type: ignore
+            for i in positions:
+                args[i] = assigned[i]
+        keywords = self.__info.keywords
+        if keywords:
+            return self.__dataclass(
+                *[args[i] for i in positional],
+                **{names[i]: args[i] for i in keywords},
+            )
+        return self.__dataclass(*args)
+
+    def _reset(self) -> None:
+        """Return all fields to their initial REQUIRED or OPTIONAL state."""
+        dict_ = self.__dict__
+        dict_.pop("_DataclassBuilder__proto", None)
+        dict_.pop("_DataclassBuilder__order", None)
+        for name in [name for name in dict_ if name in self.__info.bits]:
+            del dict_[name]
+        self.__mask = 0
+
+    def _clone(self) -> "DataclassBuilder":
+        """Copy the builder, sharing the values of its fields with the copy.
+
+        The field values are moved into a prototype, shared by this builder
+        and the clone, so each only stores the fields assigned after cloning.
+        Cloning a clone merges its assigned fields into a new prototype, so
+        there is never more than one prototype to look fields up in.
+
+        :return:
+            A new builder with the same field values.
+        """
+        dict_ = self.__dict__
+        proto = dict_.get("_DataclassBuilder__proto")
+        # after the first clone only fields assigned since are in the dict
+        assigned = [name for name in dict_ if name in self.__info.bits]
+        if proto is None or assigned:
+            proto = dict(proto) if proto is not None else {}
+            for name in assigned:
+                proto[name] = dict_.pop(name)
+            dict_["_DataclassBuilder__proto"] = proto
+        builder = copy(self)
+        for name in self.__nested:
+            # nested builders are cloned so the clones can assign their fields
+            value = proto.get(name)
+            if isinstance(value, DataclassBuilder):
+                builder.__dict__[name] = value._clone()
+        return builder
+
+    def _changed(self) -> Tuple[str, ...]:
+        """Get the names of the assigned fields, in assignment order."""
+        order = self.__dict__.get("_DataclassBuilder__order", ())
+        return self.__info.assigned(self.__mask, order)
+
+    def __copy__(self) -> "DataclassBuilder":
+        """Copy the builder, the copy tracks its assigned fields separately."""
+        builder = self.__class__.__new__(self.__class__)
+        builder.__dict__.update(self.__dict__)
+        return builder
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "DataclassBuilder":
+        """Deep copy the fields and other attributes set on the builder."""
+        builder = copy(self)
+        memo[id(self)] = builder
+        for key, value in self.__dict__.items():
+            # the state of the builder is copied, or immutable and shared
+            if not key.startswith("_DataclassBuilder__"):
+                builder.__dict__[key] = deepcopy(value, memo)
+        proto = self.__dict__.get("_DataclassBuilder__proto")
+        if proto is not None:
+            builder.__dict__["_DataclassBuilder__proto"] = deepcopy(proto, memo)
+        return builder
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle only the dataclass and the assigned fields of the builder.
+
+        The state shared by all builders of the dataclass is recomputed when
+        unpickling, instead of being pickled with every builder.
+        """
+        # assigned again in the same order when unpickling
+        values = {name: getattr(self, name) for name in self._changed()}
+        # other attributes, such as those of subclasses, are pickled as is
+        state = {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in self.__info.bits and not key.startswith("_DataclassBuilder__")
+        }
+        nested = bool(self.__nested)
+        validate = self.__checkers is not None
+        args = (self.__class__, self.__dataclass, values, nested, validate)
+        return _unpickle, args, state or None
+
+    def _is_complete(self) -> bool:
+        """Determine if all required fields have been assigned.
+
+        :return:
+            True if the builder has a value for every required field of the
+            dataclass, otherwise False.
+        """
+        mask = self.__info.required_mask
+        if self.__mask & mask != mask:
+            return False
+        return not self.__nested or not self.__incomplete()
+
+    def _missing(self) -> Mapping[str, "dataclasses.Field[Any]"]:
+        """Get a dictionary of the required fields that have not been assigned.
+
+        Fields of builders with `nested` set are also missing if they are
+        builders that are missing fields themselves.
+
+        :return dict:
+            A mapping from field names to actual :class:`dataclasses.Field`'s
+            in the same order as the underlying dataclass.
+        """
+        missing = self.__info.missing(self.__mask)
+        incomplete = self.__incomplete() if self.__nested else ()
+        if not incomplete:
+            return missing
+        return {
+            name: field
+            for name, field in self.__settable_fields.items()
+            if name in missing or name in incomplete
         }
-        return self.__dataclass(**kwargs)
+
+    def __incomplete(self) -> List[str]:
+        # nested fields that are assigned builders which cannot be built yet,
+        # such as those created by reading the field
+        dict_ = self.__dict__
+        proto = dict_.get("_DataclassBuilder__proto") or {}
+        incomplete = []
+        for name in self.__nested:
+            value = dict_.get(name, proto.get(name))
+            if isinstance(value, DataclassBuilder) and not value._is_complete():
+                incomplete.append(name)
+        return incomplete
 
     def _fields(
         self, required: bool = True, optional: bool = True
@@ -305,7 +655,44 @@ class DataclassBuilder:
         if not required and not optional:
             return {}
         if required and not optional:
-            return _required_fields(self.__dataclass)
+            return self.__info.required
         if not required and optional:
-            return _optional_fields(self.__dataclass)
-        return _settable_fields(self.__dataclass)
+            return self.__info.optional
+        return self.__info.settable
+
+
+def _configure(
+    builder: DataclassBuilder, nested: bool, validate: bool
+) -> DataclassBuilder:
+    # set directly as the dataclass may have fields named like the options
+    dataclass = builder.__dataclass__
+    if nested:
+        builder._DataclassBuilder__nested = _field_types(dataclass).nested
+    if validate:
+        builder._DataclassBuilder__checkers = _field_checkers(dataclass)
+        builder.__dict__.pop("_DataclassBuilder__unchecked", None)
+    return builder
+
+
+def _nested_fields(builder: Any) -> Mapping[str, Any]:
+    # the nested fields of a builder, none unless it has the nested option
+    if isinstance(builder, DataclassBuilder):
+        nested: Mapping[str, Any] = builder._DataclassBuilder__nested
+        return nested
+    return {}
+
+
+def _unpickle(
+    cls: Any,
+    dataclass: Any,
+    values: Dict[str, Any],
+    nested: bool = False,
+    validate: bool = False,
+) -> DataclassBuilder:
+    # see DataclassBuilder.__reduce__, subclasses may have another __init__
+    builder: DataclassBuilder = cls.__new__(cls)
+    DataclassBuilder.__init__(builder, dataclass)
+    _configure(builder, nested, validate)
+    for name, value in values.items():
+        setattr(builder, name, value)
+    return builder
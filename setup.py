@@ -37,7 +37,7 @@ setup(
     long_description_content_type="text/x-rst",
     license="MIT",
     url="https://github.com/mrshannon/dataclass-builder",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     package_data={"dataclass_builder": ["py.typed"]},
     setup_requires=["pytest-runner"],
     install_requires=['dataclasses;python_version=="3.6"'],
@@ -16,7 +16,7 @@ def check_typing(c):
 @task
 def check_style(c):
     """check code style"""
-    c.run(f"flake8 setup.py tasks.py {PACKAGE} tests")
+    c.run(f"flake8 setup.py tasks.py {PACKAGE} tests benchmarks")
 
 
 @task
@@ -104,6 +104,22 @@ def test(c, verbose=0, coverage=False, html=False):
         c.run("coverage html")
 
 
+@task(
+    help={
+        "output": "write JSON results to this file",
+        "baseline": "compare against JSON results, fail on regressions",
+        "threshold": "slowdown that is a regression, default is 0.2 (20%)",
+        "quick": "time each benchmark only once",
+    }
+)
+def benchmark(c, output=None, baseline=None, threshold=0.2, quick=False):
+    """run performance benchmarks"""
+    output_ = f"--output {output}" if output else ""
+    baseline_ = f"--baseline {baseline} --threshold {threshold}" if baseline else ""
+    quick_ = "--quick" if quick else ""
+    c.run(f"python -m benchmarks.suite {output_} {baseline_} {quick_}")
+
+
 @task(doc_clean, dist_clean)
 def clean(c):
     """cleanup everything"""
@@ -112,7 +128,7 @@ def clean(c):
     c.run("rm -rf .pytest_cache")
     c.run("rm -rf .mypy_cache")
     c.run("rm -rf *.egg-info")
-    for top_dir in [PACKAGE, "tests"]:
+    for top_dir in [PACKAGE, "tests", "benchmarks"]:
         for root, dirs, _ in os.walk(top_dir):
             for dir in dirs:
                 if dir == "__pycache__":
@@ -139,6 +155,7 @@ format.add_task(format_isort, "isort")
 format.add_task(format_black, "black")
 
 ns = Collection()
+ns.add_task(benchmark)
 ns.add_task(clean)
 ns.add_task(develop)
 ns.add_task(test)
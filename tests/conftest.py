@@ -1,8 +1,11 @@
 import math
 from dataclasses import dataclass, field
-from typing import Mapping, Sequence
+from typing import TYPE_CHECKING, List, Mapping, Optional, Sequence
 
-from dataclass_builder import DataclassBuilder
+from dataclass_builder import DataclassBuilder, dataclass_builder
+
+if TYPE_CHECKING:
+    from decimal import Decimal
 
 
 @dataclass
@@ -68,3 +71,48 @@ class Fields:
 class Typing:
     sequence: Sequence[int]
     mapping: Mapping[str, float]
+
+
+@dataclass
+class DefaultFactory:
+    values: List[int] = field(default_factory=list)
+
+
+@dataclass(init=False)
+class CustomInit:
+    x: int
+    y: int = 2
+
+    def __init__(self, x, **kwargs):
+        self.x = x
+        self.y = kwargs.get("y", 5)
+
+
+@dataclass
+class Line:
+    start: Point
+    end: Point
+    label: str = ""
+
+
+@dataclass
+class Drawing:
+    line: Line
+    parent: Optional["Drawing"] = None
+
+
+@dataclass
+class Invoice:
+    # Decimal is only imported when type checking
+    total: "Decimal"
+    line: "Line"
+    count: "Optional[int]" = None
+
+
+def make_builders(dataclass, validate=False, **kwargs):
+    # a builder of each kind, with the same options and fields assigned
+    return [
+        DataclassBuilder(dataclass, validate=validate, **kwargs),
+        dataclass_builder(dataclass, validate=validate)(**kwargs),
+        dataclass_builder(dataclass, slots=True, validate=validate)(**kwargs),
+    ]
@@ -0,0 +1,192 @@
+import dataclasses
+import threading
+
+import pytest  # type: ignore
+
+from dataclass_builder import (
+    Assembler,
+    ConcurrentAssembler,
+    DataclassBuilder,
+    UndefinedFieldError,
+    dataclass_builder,
+)
+from tests.conftest import NotADataclass, Point
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_add():
+    assembler = Assembler(Point, key="x")
+    assert assembler.add({"x": 1.0}) is None
+    assert assembler.add({"x": 2.0, "w": 3.0}) is None
+    assert 2 == len(assembler)
+    assert 1.0 in assembler
+    assert Point(1.0, 4.0) == assembler.add({"x": 1.0, "y": 4.0})
+    assert 1.0 not in assembler
+    assert Point(2.0, 5.0, 3.0) == assembler.add({"y": 5.0, "x": 2.0})
+    assert 0 == len(assembler)
+    # a complete event is built straight away
+    assert Point(3.0, 6.0) == assembler.add({"x": 3.0, "y": 6.0})
+
+
+def test_add_builder_class():
+    assembler = Assembler(dataclass_builder(Point), key="y")
+    assert assembler.add({"y": 1.0, "w": 2.0}) is None
+    assert Point(3.0, 1.0, 2.0) == assembler.add({"y": 1.0, "x": 3.0})
+
+
+def test_add_errors():
+    assembler = Assembler(Point, key="x")
+    with pytest.raises(KeyError):
+        assembler.add({"y": 1.0})
+    assembler.add({"x": 1.0})
+    with pytest.raises(UndefinedFieldError):
+        assembler.add({"x": 1.0, "y": 2.0, "z": 3.0})
+    # none of the fields of the event are assigned
+    assert Point(1.0, 3.0) == assembler.add({"x": 1.0, "y": 3.0})
+
+
+def test_ttl():
+    clock = Clock()
+    evicted = []
+    assembler = Assembler(
+        Point,
+        key="x",
+        ttl=10.0,
+        clock=clock,
+        on_evict=lambda key, builder: evicted.append((key, builder)),
+    )
+    assembler.add({"x": 1.0})
+    clock.now = 5.0
+    assembler.add({"x": 2.0})
+    clock.now = 9.0
+    assembler.add({"x": 1.0, "w": 2.0})
+    clock.now = 16.0
+    assert 1 == assembler.expire()
+    assert [2.0] == [key for key, _ in evicted]
+    assert 2.0 == evicted[0][1].x
+    clock.now = 30.0
+    assert assembler.add({"x": 3.0}) is None
+    assert [2.0, 1.0] == [key for key, _ in evicted]
+    assert 2.0 == evicted[1][1].w
+    assert 1 == len(assembler)
+    assert 0 == assembler.expire(35.0)
+    assert 1 == assembler.expire(40.0)
+
+
+def test_maxsize():
+    evicted = []
+    assembler = Assembler(
+        Point, key="x", maxsize=2, on_evict=lambda key, _: evicted.append(key)
+    )
+    assembler.add({"x": 1.0})
+    assembler.add({"x": 2.0})
+    assembler.add({"x": 1.0, "w": 2.0})
+    assembler.add({"x": 3.0})
+    assert [2.0] == evicted
+    assert 2 == len(assembler)
+    # completing a builder makes room without evicting
+    assembler.add({"x": 1.0, "y": 2.0})
+    assembler.add({"x": 4.0})
+    assert [2.0] == evicted
+
+
+def test_discard_and_clear():
+    evicted = []
+    assembler = Assembler(Point, key="x", on_evict=lambda *args: evicted.append(args))
+    assembler.add({"x": 1.0})
+    assembler.add({"x": 2.0})
+    assert 1.0 == assembler.discard(1.0).x
+    assert assembler.discard(1.0) is None
+    assembler.clear()
+    assert 0 == len(assembler)
+    assert [] == evicted
+
+
+def test_init_errors():
+    with pytest.raises(TypeError):
+        Assembler(NotADataclass, key="x")
+    with pytest.raises(TypeError):
+        Assembler(DataclassBuilder, key="x")
+    with pytest.raises(ValueError):
+        Assembler(Point, key="z")
+    with pytest.raises(ValueError):
+        Assembler(Point, key="x", ttl=0)
+    with pytest.raises(ValueError):
+        Assembler(Point, key="x", maxsize=0)
+
+
+@dataclasses.dataclass
+class Entity:
+    id: int
+    a: int
+    b: int
+
+
+def test_concurrent_add():
+    assembler = ConcurrentAssembler(Entity, key="id", stripes=4)
+    built = []
+    lock = threading.Lock()
+
+    def feed(field):
+        for i in range(2000):
+            entity = assembler.add({"id": i, field: i})
+            if entity is not None:
+                with lock:
+                    built.append(entity)
+
+    threads = [threading.Thread(target=feed, args=(field,)) for field in "ab"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # each entity is built once, by whichever thread sent its last field
+    assert [Entity(i, i, i) for i in range(2000)] == sorted(
+        built, key=lambda entity: entity.id
+    )
+    assert 0 == len(assembler)
+
+
+def test_concurrent_eviction():
+    clock = Clock()
+    evicted = []
+    assembler = ConcurrentAssembler(
+        Point,
+        key="x",
+        stripes=2,
+        ttl=10.0,
+        maxsize=4,
+        clock=clock,
+        on_evict=lambda key, _: evicted.append(key),
+    )
+    for i in range(4):
+        assembler.add({"x": float(i)})
+    assert 4 == len(assembler)
+    assert 0.0 in assembler
+    assert 0.0 == assembler.discard(0.0).x
+    assert 0.0 not in assembler
+    clock.now = 20.0
+    assert 3 == assembler.expire()
+    assert [1.0, 2.0, 3.0] == sorted(evicted)
+    assembler.add({"x": 5.0})
+    assembler.clear()
+    assert 0 == len(assembler)
+    with pytest.raises(ValueError):
+        ConcurrentAssembler(Point, key="x", stripes=0)
+    with pytest.raises(ValueError):
+        ConcurrentAssembler(Point, key="x", maxsize=0)
+    with pytest.raises(ValueError):
+        ConcurrentAssembler(Point, key="x", maxsize=3, stripes=4)
+
+
+def test_concurrent_maxsize_is_total():
+    assembler = ConcurrentAssembler(Point, key="x", stripes=2, maxsize=5)
+    for i in range(100):
+        assembler.add({"x": float(i)})
+        assert len(assembler) <= 5
@@ -0,0 +1,138 @@
+import dataclasses
+
+import pytest  # type: ignore
+
+from dataclass_builder import (
+    OPTIONAL,
+    REQUIRED,
+    BatchBuilder,
+    MissingFieldError,
+    UndefinedFieldError,
+    build,
+    changed_fields,
+    fields,
+    is_complete,
+    missing,
+)
+from tests.conftest import (
+    Circle,
+    DefaultFactory,
+    NoFields,
+    NotADataclass,
+    PixelCoord,
+    Point,
+)
+
+
+def test_all_fields_set():
+    # columns passed in constructor
+    batch = BatchBuilder(PixelCoord, 2, x=[1, 2], y=[3, 4])
+    assert [PixelCoord(1, 3), PixelCoord(2, 4)] == build(batch)
+    # columns set by assignment
+    batch = BatchBuilder(PixelCoord, 2)
+    batch.x = [1, 2]
+    batch.y = (3, 4)
+    assert [PixelCoord(1, 3), PixelCoord(2, 4)] == build(batch)
+
+
+def test_optional_column():
+    batch = BatchBuilder(Point, 2, x=[1.0, 2.0], y=[3.0, 4.0])
+    assert [Point(1.0, 3.0), Point(2.0, 4.0)] == build(batch)
+    batch.w = [5.0, 6.0]
+    assert [Point(1.0, 3.0, 5.0), Point(2.0, 4.0, 6.0)] == build(batch)
+
+
+def test_default_factory():
+    values = build(BatchBuilder(DefaultFactory, 2))
+    assert [DefaultFactory(), DefaultFactory()] == values
+    assert values[0].values is not values[1].values
+
+
+def test_init_false_field():
+    batch = BatchBuilder(Circle, 2, radius=[1.0, 2.0])
+    assert [Circle(1.0), Circle(2.0)] == build(batch)
+    with pytest.raises(UndefinedFieldError):
+        batch.area = [1.0, 2.0]
+
+
+def test_empty_batch():
+    assert [] == build(BatchBuilder(PixelCoord, 0, x=[], y=[]))
+    assert [NoFields(), NoFields()] == build(BatchBuilder(NoFields, 2))
+    with pytest.raises(ValueError):
+        BatchBuilder(PixelCoord, -1)
+
+
+def test_column_length():
+    batch = BatchBuilder(PixelCoord, 3)
+    with pytest.raises(ValueError):
+        batch.x = [1, 2]
+    with pytest.raises(ValueError):
+        BatchBuilder(PixelCoord, 3, y=[1, 2, 3, 4])
+    assert len(batch) == 3
+
+
+def test_missing_field():
+    batch = BatchBuilder(PixelCoord, 2, y=[3, 4])
+    assert not is_complete(batch)
+    assert ["x"] == list(missing(batch))
+    with pytest.raises(MissingFieldError) as err:
+        build(batch)
+    assert err.value.dataclass == PixelCoord
+    assert err.value.field == dataclasses.fields(PixelCoord)[0]
+    batch.x = [1, 2]
+    assert is_complete(batch)
+    batch.x = REQUIRED
+    assert not is_complete(batch)
+
+
+def test_undefined_field():
+    with pytest.raises(TypeError):
+        BatchBuilder(PixelCoord, 1, z=[1])
+    batch = BatchBuilder(PixelCoord, 1)
+    with pytest.raises(UndefinedFieldError):
+        batch.z = [1]
+
+
+def test_must_be_dataclass():
+    with pytest.raises(TypeError):
+        BatchBuilder(NotADataclass, 1)
+
+
+def test_access_unset_field():
+    batch = BatchBuilder(Point, 1)
+    assert batch.x is REQUIRED
+    assert batch.w is OPTIONAL
+
+
+def test_repr():
+    assert "BatchBuilder(Point, 2, x=[1, 2], w=(3, 4))" == repr(
+        BatchBuilder(Point, 2, w=(3, 4), x=[1, 2])
+    )
+
+
+def test_fields():
+    batch = BatchBuilder(Point, 1)
+    assert ["x", "y", "w"] == list(fields(batch))
+    assert ["x", "y"] == list(fields(batch, optional=False))
+    assert ["w"] == list(fields(batch, required=False))
+    assert [] == list(fields(batch, required=False, optional=False))
+
+
+def test_trusted():
+    batch = BatchBuilder(Point, 2, x=[1.0, 2.0], y=[3.0, 4.0])
+    assert [Point(1.0, 3.0), Point(2.0, 4.0)] == build(batch, trusted=True)
+    values = build(BatchBuilder(DefaultFactory, 2), trusted=True)
+    assert [DefaultFactory(), DefaultFactory()] == values
+    assert values[0].values is not values[1].values
+    assert [Circle(1.0)] == build(BatchBuilder(Circle, 1, radius=[1.0]), trusted=True)
+    assert [NoFields(), NoFields()] == build(BatchBuilder(NoFields, 2), trusted=True)
+    with pytest.raises(MissingFieldError):
+        build(BatchBuilder(Point, 1, x=[1.0]), trusted=True)
+
+
+def test_changed_fields():
+    batch = BatchBuilder(Point, 1, y=[2.0])
+    batch.x = [1.0]
+    assert ("y", "x") == changed_fields(batch)
+    batch.y = REQUIRED
+    assert ("x",) == changed_fields(batch)
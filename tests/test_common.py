@@ -1,18 +1,25 @@
+import gc
+import pickle
 from copy import copy, deepcopy
-from dataclasses import fields
+from dataclasses import fields, make_dataclass
+from typing import Optional
 
 from dataclass_builder._common import (
     MISSING,
     OPTIONAL,
     REQUIRED,
+    Lazy,
     _is_optional,
     _is_required,
+    _dataclass_info,
+    _field_types,
+    _INFO_CACHE,
     _is_settable,
     _optional_fields,
     _required_fields,
     _settable_fields,
 )
-from tests.conftest import Circle, PixelCoord, Point, Types
+from tests.conftest import Circle, Drawing, Invoice, Line, PixelCoord, Point, Types
 
 
 def test_constants():
@@ -57,6 +64,24 @@ def test_constants_after_deepcopy():
     assert deepcopy(MISSING) is not OPTIONAL
 
 
+def test_constants_after_pickle():
+    for constant in (REQUIRED, OPTIONAL, MISSING):
+        assert pickle.loads(pickle.dumps(constant)) is constant
+
+
+def test_lazy():
+    value = Lazy(lambda: [1])
+    assert not value.resolved
+    assert repr(value).startswith("lazy(<function")
+    other = deepcopy(value)
+    assert [1] == value.resolve()
+    assert value.resolved
+    assert value.resolve() is value.resolve()
+    assert "lazy(resolved=[1])" == repr(value)
+    assert not other.resolved
+    assert other.resolve() is not value.resolve()
+
+
 def test_required_and_optional_are_missing():
     assert REQUIRED == MISSING
     assert MISSING == REQUIRED
@@ -165,3 +190,60 @@ def test_optional_fields():
     assert ["str_"] == list(fields_.keys())
     assert ["str_"] == [f.name for f in fields_.values()]
     assert [str] == [f.type for f in fields_.values()]
+
+
+def test_dataclass_info():
+    info = _dataclass_info(Types)
+    assert ["int_", "float_", "str_"] == list(info.settable.keys())
+    assert ["int_", "float_"] == list(info.required.keys())
+    assert ["str_"] == list(info.optional.keys())
+    assert ("int_", "float_", "str_") == info.names
+    assert {"int_": 0, "float_": 1, "str_": 2} == dict(info.index)
+
+
+def test_dataclass_info_is_cached():
+    assert _dataclass_info(Point) is _dataclass_info(Point)
+    assert _dataclass_info(Point(1.0, 2.0)) is _dataclass_info(Point)
+    assert _settable_fields(Point) is _dataclass_info(Point).settable
+
+
+def test_field_types():
+    field_types = _field_types(Drawing)
+    assert field_types is _field_types(Drawing)
+    # string annotations are resolved
+    assert {"line": Line, "parent": Optional[Drawing]} == dict(field_types.types)
+    assert {"line": Line} == dict(field_types.nested)
+    assert {"start": Point, "end": Point} == dict(_field_types(Line).nested)
+    assert {} == dict(_field_types(Circle).nested)
+    assert ["radius"] == list(_field_types(Circle).types)
+
+
+def test_field_types_unresolved():
+    Unresolved = make_dataclass("Unresolved", [("a", "Missing"), ("b", int)])
+    assert {"a": "Missing", "b": int} == dict(_field_types(Unresolved).types)
+
+
+def test_field_types_not_an_expression():
+    Unparsable = make_dataclass("Unparsable", [("a", "not valid"), ("b", "int")])
+    assert {"a": "not valid", "b": int} == dict(_field_types(Unparsable).types)
+
+
+def test_field_types_partially_resolved():
+    # only the field naming a type that is not visible is left unresolved
+    field_types = _field_types(Invoice)
+    assert {"total": "Decimal", "line": Line, "count": Optional[int]} == dict(
+        field_types.types
+    )
+    assert {"line": Line} == dict(field_types.nested)
+
+
+def test_dataclass_info_is_weakly_keyed():
+    Dynamic = make_dataclass("Dynamic", ["a", "b"])
+    assert ("a", "b") == _dataclass_info(Dynamic).names
+    assert Dynamic in _INFO_CACHE
+    # collect dataclasses left by other tests first
+    gc.collect()
+    size = len(_INFO_CACHE)
+    del Dynamic
+    gc.collect()
+    assert len(_INFO_CACHE) == size - 1
@@ -1,4 +1,10 @@
+import copy
 import dataclasses
+import gc
+import importlib.util
+import pickle
+import threading
+import weakref
 from typing import Any, get_type_hints
 
 import pytest  # type: ignore
@@ -9,13 +15,19 @@ from dataclass_builder import (
     MissingFieldError,
     UndefinedFieldError,
     build,
+    builder_cache_info,
+    clear_builder_cache,
     dataclass_builder,
     fields,
+    generate_builder_source,
 )
-from dataclass_builder.factory import _create_fn
+from dataclass_builder.__main__ import main
+from dataclass_builder._common import _create_fn
 from tests.conftest import (
     Build,
     Circle,
+    CustomInit,
+    DefaultFactory,
     Fields,
     NoFields,
     NoInitFields,
@@ -228,6 +240,27 @@ def test_init_false_field_not_required():
     assert Circle(9.0) == builder.build()
 
 
+def test_default_factory_field():
+    DefaultFactoryBuilder = dataclass_builder(DefaultFactory)
+    builder = DefaultFactoryBuilder()
+    first = builder.build()
+    second = builder.build()
+    assert DefaultFactory([]) == first
+    assert first.values is not second.values
+    builder.values = [1, 2]
+    assert DefaultFactory([1, 2]) == builder.build()
+
+
+def test_custom_init_without_defaults():
+    CustomInitBuilder = dataclass_builder(CustomInit)
+    builder = CustomInitBuilder(x=1)
+    custom = builder.build()
+    assert (custom.x, custom.y) == (1, 5)
+    builder.y = 3
+    custom = builder.build()
+    assert (custom.x, custom.y) == (1, 3)
+
+
 def test_init_false_field_cannot_be_set():
     CircleBuilder = dataclass_builder(Circle)
     # fields passed in constructor
@@ -456,3 +489,213 @@ def test_typing_module():
     builder = TypingBuilder()
     builder.sequence = [1, 2, 3]
     builder.mapping = {"one": 1.0, "two": 2.0, "pi": 3.14}
+
+
+def test_slots():
+    PointBuilder = dataclass_builder(Point, slots=True)
+    assert ("x", "y", "w") == PointBuilder.__slots__[:3]
+    builder = PointBuilder(y=4.0)
+    assert not hasattr(builder, "__dict__")
+    assert "PointBuilder(y=4.0)" == repr(builder)
+    assert builder.x == REQUIRED
+    assert builder.w == OPTIONAL
+    with pytest.raises(MissingFieldError):
+        builder.build()
+    builder.x = 3.0
+    assert Point(3.0, 4.0, 1.0) == builder.build()
+    assert Point(3.0, 4.0, 1.0) == build(builder)
+    assert ["x", "y", "w"] == list(fields(builder).keys())
+
+
+def test_slots_undefined_field():
+    CircleBuilder = dataclass_builder(Circle, slots=True)
+    builder = CircleBuilder()
+    with pytest.raises(UndefinedFieldError):
+        builder.area = 1
+    with pytest.raises(AttributeError):
+        builder._private = 1
+
+
+def test_slots_without_fields():
+    NoFieldsBuilder = dataclass_builder(NoFields, slots=True)
+    assert NoFields() == NoFieldsBuilder().build()
+    with pytest.raises(TypeError):
+        NoFieldsBuilder(3)
+
+
+def test_slots_class_inheritance():
+    class ExtendedPixelCoordBuilder(dataclass_builder(PixelCoord, slots=True)):
+        pass
+
+    builder = ExtendedPixelCoordBuilder(x=1)
+    builder._private = 1
+    builder.y = 2
+    assert PixelCoord(1, 2) == builder.build()
+
+
+def import_source(path, source):
+    path.write_text(source)
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_generate_builder_source(tmp_path, slots):
+    source = generate_builder_source(Point, slots=slots)
+    PointBuilder = import_source(tmp_path / "point_builder.py", source).PointBuilder
+    dynamic = dataclass_builder(Point, slots=slots)
+    assert PointBuilder.__dataclass__ is Point
+    assert PointBuilder.__doc__ == dynamic.__doc__
+    assert getattr(PointBuilder, "__slots__", None) == getattr(
+        dynamic, "__slots__", None
+    )
+    builder = PointBuilder(y=4.0)
+    assert "PointBuilder(y=4.0)" == repr(builder)
+    with pytest.raises(MissingFieldError):
+        builder.build()
+    with pytest.raises(UndefinedFieldError):
+        builder.z = 1.0
+    builder.x = 3.0
+    assert Point(3.0, 4.0, 1.0) == build(builder)
+    assert ["x", "y", "w"] == list(fields(builder).keys())
+    assert get_type_hints(PointBuilder._build) == get_type_hints(dynamic._build)
+
+
+def test_generate_builder_source_custom_name(tmp_path):
+    source = generate_builder_source(Types, name="MyBuilder")
+    module = import_source(tmp_path / "my_builder.py", source)
+    assert ["MyBuilder"] == module.__all__
+    assert Types(1, 2.0) == module.MyBuilder(int_=1, float_=2.0).build()
+
+
+def test_generate_builder_source_errors():
+    @dataclasses.dataclass
+    class Local:
+        x: int
+
+    with pytest.raises(TypeError):
+        generate_builder_source(NotADataclass)
+    with pytest.raises(TypeError):
+        generate_builder_source(Point(1.0, 2.0))
+    with pytest.raises(ValueError):
+        generate_builder_source(Local)
+    with pytest.raises(ValueError):
+        generate_builder_source(Point, name="Point Builder")
+
+
+def test_generate_builder_source_main(tmp_path, capsys):
+    output = tmp_path / "output.py"
+    assert 0 == main(["tests.conftest:Point", "--slots", "-o", str(output)])
+    assert generate_builder_source(Point, slots=True) == output.read_text()
+    assert 0 == main(["tests.conftest:Point", "--name", "Builder"])
+    assert generate_builder_source(Point, name="Builder") == capsys.readouterr().out
+    assert 0 == main(["tests.conftest:Point", "--validate"])
+    assert generate_builder_source(Point, validate=True) == capsys.readouterr().out
+    with pytest.raises(SystemExit):
+        main(["tests.conftest.Point"])
+    with pytest.raises(SystemExit):
+        main(["tests.conftest:Missing"])
+
+
+def test_builder_cache():
+    clear_builder_cache()
+    PointBuilder = dataclass_builder(Point)
+    assert PointBuilder is dataclass_builder(Point)
+    assert PointBuilder is dataclass_builder(Point, name="PointBuilder")
+    assert PointBuilder is not dataclass_builder(Point, name="Builder")
+    assert PointBuilder is not dataclass_builder(Point, slots=True)
+    assert (2, 3, 3) == builder_cache_info()
+    clear_builder_cache()
+    assert (0, 0, 0) == builder_cache_info()
+    assert PointBuilder is not dataclass_builder(Point)
+    assert Point(1.0, 2.0) == PointBuilder(x=1.0, y=2.0).build()
+
+
+def test_builder_cache_does_not_keep_dataclass_alive():
+    @dataclasses.dataclass
+    class Temporary:
+        x: int
+
+    assert dataclass_builder(Temporary) is dataclass_builder(Temporary)
+    reference = weakref.ref(Temporary)
+    del Temporary
+    gc.collect()
+    assert reference() is None
+
+
+def test_builder_cache_threads():
+    @dataclasses.dataclass
+    class Shared:
+        x: int
+
+    builders = []
+    barrier = threading.Barrier(8)
+
+    def create():
+        barrier.wait()
+        builders.append(dataclass_builder(Shared))
+
+    threads = [threading.Thread(target=create) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert 8 == len(builders)
+    assert all(builder is builders[0] for builder in builders)
+
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_pickle(slots):
+    PointBuilder = dataclass_builder(Point, slots=slots)
+    builder = PointBuilder(w=3.0)
+    builder.x = 1.0
+    other = pickle.loads(pickle.dumps(builder))
+    assert type(other) is PointBuilder
+    assert repr(builder) == repr(other)
+    other.y = 2.0
+    assert Point(1.0, 2.0, 3.0) == other.build()
+    assert REQUIRED == builder.y
+
+
+def test_pickle_recreates_class():
+    data = pickle.dumps(dataclass_builder(Point, name="Pickled")(x=1.0, y=2.0))
+    clear_builder_cache()
+    # as in another process, where the builder class has not been created
+    builder = pickle.loads(data)
+    assert type(builder) is dataclass_builder(Point, name="Pickled")
+    assert Point(1.0, 2.0) == builder.build()
+
+
+@pytest.mark.parametrize("slots", [False, True])
+def test_deepcopy_keeps_class(slots):
+    builder = dataclass_builder(DefaultFactory, slots=slots)(values=[1])
+    clear_builder_cache()
+    other = copy.deepcopy(builder)
+    assert type(other) is type(builder)
+    assert [1] == other.values
+    assert other.values is not builder.values
+    other.values = [2]
+    assert DefaultFactory([1]) == builder.build()
+    other = copy.deepcopy(builder._clone())
+    assert type(other) is type(builder)
+    assert DefaultFactory([1]) == other.build()
+
+
+@pytest.mark.parametrize("subclass", ["PickledSubclass", "PickledSlotsSubclass"])
+def test_pickle_subclass(subclass):
+    builder = globals()[subclass](x=1.0)
+    for other in (pickle.loads(pickle.dumps(builder)), copy.deepcopy(builder)):
+        assert type(other) is type(builder)
+        assert 1.0 == other.x
+        other.y = 2.0
+        assert Point(1.0, 2.0) == other.build()
+
+
+PickledSubclass = type("PickledSubclass", (dataclass_builder(Point),), {})
+PickledSlotsSubclass = type(
+    "PickledSlotsSubclass",
+    (dataclass_builder(Point, slots=True),),
+    {"__slots__": ()},
+)
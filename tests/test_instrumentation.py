@@ -0,0 +1,126 @@
+import dataclasses
+
+import pytest  # type: ignore
+
+from dataclass_builder import (
+    AggregatingSink,
+    DataclassBuilder,
+    MetricsSink,
+    MissingFieldError,
+    UndefinedFieldError,
+    attach_sink,
+    build,
+    dataclass_builder,
+    detach_sink,
+    update,
+)
+from tests.conftest import Circle, Point, make_builders
+
+
+@pytest.fixture
+def sink():
+    sink = AggregatingSink()
+    attach_sink(sink)
+    yield sink
+    detach_sink()
+
+
+def test_builds(sink):
+    for builder in make_builders(Point, x=1.0, y=2.0):
+        assert Point(1.0, 2.0) == build(builder)
+    metrics = sink.dump()
+    assert {"Point": 3} == metrics["builds"]
+    assert 3 == sum(metrics["build_latency"]["counts"]["Point"])
+    assert len(AggregatingSink.BOUNDS) + 1 == len(
+        metrics["build_latency"]["counts"]["Point"]
+    )
+    assert {"Point": 6} == metrics["setattr"]
+
+
+def test_build_method(sink):
+    PointBuilder = dataclass_builder(Point)
+    assert Point(1.0, 2.0) == PointBuilder(x=1.0, y=2.0).build()
+    assert {"Point": 1} == sink.dump()["builds"]
+
+
+def test_errors(sink):
+    for builder in make_builders(Circle):
+        with pytest.raises(MissingFieldError):
+            build(builder)
+        with pytest.raises(UndefinedFieldError):
+            builder.area = 2.0
+    assert {
+        "Circle": {
+            "radius": {"MissingFieldError": 3},
+            "area": {"UndefinedFieldError": 3},
+        }
+    } == sink.dump()["errors"]
+    assert {} == sink.dump()["builds"]
+
+
+def test_update(sink):
+    point = Point(1.0, 2.0)
+    update(point, DataclassBuilder(Point, w=3.0))
+    assert Point(1.0, 2.0, 3.0) == point
+    assert {"Point": 1} == sink.dump()["updates"]
+
+
+def test_reset(sink):
+    build(DataclassBuilder(Point, x=1.0, y=2.0))
+    sink.reset()
+    assert {
+        "builds": {},
+        "build_latency": {"bounds": list(AggregatingSink.BOUNDS), "counts": {}},
+        "errors": {},
+        "setattr": {},
+        "updates": {},
+    } == sink.dump()
+
+
+def test_multiple_sinks(sink):
+    other = AggregatingSink()
+    attach_sink(other)
+    attach_sink(other)
+    build(DataclassBuilder(Point, x=1.0, y=2.0))
+    detach_sink(other)
+    build(DataclassBuilder(Point, x=1.0, y=2.0))
+    assert {"Point": 2} == sink.dump()["builds"]
+    assert {"Point": 1} == other.dump()["builds"]
+
+
+def test_custom_sink():
+    events = []
+
+    class Sink(MetricsSink):
+        def on_build(self, dataclass, seconds):
+            events.append(dataclass)
+
+    attach_sink(Sink())
+    try:
+        build(DataclassBuilder(Point, x=1.0, y=2.0))
+    finally:
+        detach_sink()
+    assert [Point] == events
+
+
+def test_detached_builders_are_not_instrumented():
+    PointBuilder = dataclass_builder(Point)
+    build_method = PointBuilder._build
+    setattr_method = DataclassBuilder.__setattr__
+    attach_sink(AggregatingSink())
+    assert build_method is not PointBuilder._build
+    assert setattr_method is not DataclassBuilder.__setattr__
+    detach_sink()
+    assert build_method is PointBuilder._build
+    assert build_method is PointBuilder.build
+    assert setattr_method is DataclassBuilder.__setattr__
+
+
+def test_builder_created_while_attached(sink):
+    @dataclasses.dataclass
+    class Late:
+        x: int
+
+    LateBuilder = dataclass_builder(Late, slots=True)
+    assert Late(1) == LateBuilder(x=1).build()
+    assert {Late.__qualname__: 1} == sink.dump()["builds"]
@@ -0,0 +1,114 @@
+import dataclasses
+import gc
+from typing import List
+
+import pytest  # type: ignore
+
+from dataclass_builder import (
+    DataclassBuilder,
+    InternCacheInfo,
+    build,
+    intern_builds,
+    intern_cache_info,
+    stop_interning,
+)
+from tests.conftest import Point, make_builders
+
+
+@dataclasses.dataclass(frozen=True)
+class Pair:
+    base: str
+    quote: str = "USD"
+
+
+@dataclasses.dataclass(frozen=True)
+class Tagged:
+    name: str
+    tags: List[str] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass(frozen=True)
+class Slotted:
+    __slots__ = ("x",)
+    x: int
+
+
+@pytest.fixture(autouse=True)
+def interned():
+    for dataclass in (Pair, Tagged):
+        intern_builds(dataclass, maxsize=2)
+    yield
+    for dataclass in (Pair, Tagged):
+        stop_interning(dataclass)
+
+
+def test_intern():
+    for builder in make_builders(Pair, base="EUR"):
+        first = build(builder)
+        assert first is build(builder)
+        assert first is build(builder, trusted=True)
+        builder.quote = "GBP"
+        assert first is not build(builder)
+        assert Pair("EUR", "GBP") == build(builder)
+    # each kind of builder shares the interned instances
+    assert InternCacheInfo(13, 2, 2, 2) == intern_cache_info(Pair)
+    assert pytest.approx(13 / 15) == intern_cache_info(Pair).hit_rate
+
+
+def test_intern_types():
+    first = build(DataclassBuilder(Pair, base=1))
+    second = build(DataclassBuilder(Pair, base=1.0))
+    assert first is not second
+    assert isinstance(second.base, float)
+
+
+def test_intern_lru():
+    eur = build(DataclassBuilder(Pair, base="EUR"))
+    gbp = build(DataclassBuilder(Pair, base="GBP"))
+    assert eur is build(DataclassBuilder(Pair, base="EUR"))
+    build(DataclassBuilder(Pair, base="JPY"))
+    # GBP was least recently used
+    assert eur is build(DataclassBuilder(Pair, base="EUR"))
+    assert gbp is not build(DataclassBuilder(Pair, base="GBP"))
+    assert 2 == intern_cache_info(Pair).size
+
+
+def test_intern_weak():
+    intern_builds(Pair, maxsize=None)
+    pair = build(DataclassBuilder(Pair, base="EUR"))
+    assert pair is build(DataclassBuilder(Pair, base="EUR"))
+    assert 1 == intern_cache_info(Pair).size
+    del pair
+    gc.collect()
+    assert 0 == intern_cache_info(Pair).size
+
+
+def test_intern_not_internable():
+    for builder in make_builders(Tagged, name="a"):
+        # an unset default factory could give a different value every build
+        assert build(builder) is not build(builder)
+        builder.tags = ["b"]
+        assert build(builder) is not build(builder)
+        assert Tagged("a", ["b"]) == build(builder)
+    assert InternCacheInfo(0, 0, 0, 2) == intern_cache_info(Tagged)
+
+
+def test_intern_stop():
+    stop_interning(Pair)
+    assert build(DataclassBuilder(Pair, base="EUR")) is not build(
+        DataclassBuilder(Pair, base="EUR")
+    )
+    with pytest.raises(ValueError):
+        intern_cache_info(Pair)
+    stop_interning(Pair)
+
+
+def test_intern_errors():
+    with pytest.raises(TypeError):
+        intern_builds(Point)
+    with pytest.raises(TypeError):
+        intern_builds(Pair(1))
+    with pytest.raises(TypeError):
+        intern_builds(Slotted, maxsize=None)
+    with pytest.raises(ValueError):
+        intern_builds(Pair, maxsize=0)
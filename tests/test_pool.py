@@ -0,0 +1,96 @@
+import pytest  # type: ignore
+
+from dataclass_builder import (
+    OPTIONAL,
+    REQUIRED,
+    BuilderPool,
+    DataclassBuilder,
+    FieldTypeError,
+    build,
+    changed_fields,
+    dataclass_builder,
+    is_complete,
+)
+from tests.conftest import NotADataclass, PixelCoord, Point
+
+PointBuilder = dataclass_builder(Point)
+
+
+@pytest.mark.parametrize("dataclass", [Point, PointBuilder])
+def test_acquire_and_release(dataclass):
+    pool = BuilderPool(dataclass)
+    builder = pool.acquire(x=1.0)
+    assert isinstance(builder, DataclassBuilder if dataclass is Point else dataclass)
+    builder.y = 2.0
+    assert Point(1.0, 2.0) == build(builder)
+    assert len(pool) == 0
+    pool.release(builder)
+    assert len(pool) == 1
+    assert builder is pool.acquire(y=3.0)
+    assert len(pool) == 0
+    assert builder.x is REQUIRED
+    assert builder.y == 3.0
+    assert builder.w is OPTIONAL
+    assert not is_complete(builder)
+
+
+def test_max_size():
+    pool = BuilderPool(Point, max_size=1)
+    first = pool.acquire()
+    second = pool.acquire()
+    pool.release(first)
+    pool.release(second)
+    assert len(pool) == 1
+    assert first is pool.acquire()
+    assert BuilderPool(Point, max_size=0).acquire() is not None
+    with pytest.raises(ValueError):
+        BuilderPool(Point, max_size=-1)
+
+
+def test_acquire_undefined_field():
+    pool = BuilderPool(Point)
+    with pytest.raises(TypeError):
+        pool.acquire(z=1.0)
+    pool.release(pool.acquire())
+    with pytest.raises(TypeError):
+        pool.acquire(z=1.0)
+    assert len(pool) == 1
+
+
+@pytest.mark.parametrize("dataclass", [Point, PointBuilder])
+def test_acquire_error_leaves_builder_unset(dataclass):
+    pool = BuilderPool(dataclass)
+    pool.release(pool.acquire())
+    # the valid field given before the invalid one is not assigned
+    with pytest.raises(TypeError):
+        pool.acquire(x=1.0, z=2.0)
+    assert len(pool) == 1
+    builder = pool.acquire()
+    assert REQUIRED == builder.x
+    assert not changed_fields(builder)
+
+
+def test_acquire_rejected_value_leaves_builder_unset():
+    pool = BuilderPool(dataclass_builder(Point, validate=True))
+    pool.release(pool.acquire())
+    with pytest.raises(FieldTypeError):
+        pool.acquire(x=1.0, y="2.0")
+    assert len(pool) == 1
+    assert REQUIRED == pool.acquire().x
+
+
+def test_release_foreign_builder():
+    pool = BuilderPool(Point)
+    with pytest.raises(ValueError):
+        pool.release(DataclassBuilder(PixelCoord))
+    with pytest.raises(ValueError):
+        pool.release(PointBuilder())
+    with pytest.raises(ValueError):
+        BuilderPool(PointBuilder).release(DataclassBuilder(Point))
+
+
+def test_must_be_dataclass_or_builder():
+    with pytest.raises(TypeError):
+        BuilderPool(NotADataclass)
+    with pytest.raises(TypeError):
+        BuilderPool(DataclassBuilder)
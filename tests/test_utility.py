@@ -1,6 +1,49 @@
-from dataclass_builder.utility import update
+import asyncio
+import concurrent.futures
+import copy
+import dataclasses
+import pickle
+import sys
+from typing import List
+
+import pytest  # type: ignore
+
+from dataclass_builder import (
+    OPTIONAL,
+    REQUIRED,
+    Lazy,
+    MissingFieldError,
+    UndefinedFieldError,
+    dataclass_builder,
+    lazy,
+)
+from dataclass_builder._common import _dataclass_info
+from dataclass_builder.utility import (
+    RowError,
+    abuild,
+    build,
+    build_many,
+    build_parallel,
+    changed_fields,
+    clone,
+    is_complete,
+    missing,
+    reset,
+    update,
+)
 from dataclass_builder.wrapper import DataclassBuilder
-from tests.conftest import PixelCoord, Point
+from tests.conftest import (
+    Circle,
+    CustomInit,
+    DefaultFactory,
+    Line,
+    NoFields,
+    NotADataclass,
+    PixelCoord,
+    Point,
+    Types,
+    make_builders,
+)
 
 
 def test_update():
@@ -11,6 +54,34 @@ def test_update():
     assert pixel == PixelCoord(2, 4)
 
 
+def test_update_builds_nested_builders():
+    line = Line(Point(0.0, 0.0), Point(0.0, 0.0))
+    builder = DataclassBuilder(Line, nested=True)
+    builder.start.x = 1.0
+    builder.start.y = 2.0
+    update(line, builder)
+    assert Line(Point(1.0, 2.0), Point(0.0, 0.0)) == line
+    # builders are updated with the nested builder itself
+    other = DataclassBuilder(Line, nested=True)
+    update(other, builder)
+    assert builder.start is other.start
+    builder.end.x = 3.0
+    with pytest.raises(MissingFieldError):
+        update(line, builder)
+
+
+def test_update_does_not_resolve_types():
+    Unparsable = dataclasses.make_dataclass("Unparsable", [("a", "not valid")])
+    target = Unparsable(1)
+    update(target, DataclassBuilder(Unparsable, a=2))
+    assert 2 == target.a
+    assert "__dataclass_field_types__" not in vars(Unparsable)
+    # builders are only built for nested fields of builders with the option
+    builder = DataclassBuilder(Unparsable, a=DataclassBuilder(Point))
+    update(target, builder)
+    assert isinstance(target.a, DataclassBuilder)
+
+
 def test_update_with_defaults():
     point = Point(1.5, 2.3, 3.3)
     builder = DataclassBuilder(Point)
@@ -20,3 +91,471 @@ def test_update_with_defaults():
     builder.w = 5.0
     update(point, builder)
     assert point == Point(1.5, 1.1, 5.0)
+
+
+@pytest.mark.parametrize("builder", make_builders(Point))
+def test_is_complete(builder):
+    assert not is_complete(builder)
+    builder.x = 1.0
+    assert not is_complete(builder)
+    builder.w = 2.0
+    assert not is_complete(builder)
+    builder.y = 3.0
+    assert is_complete(builder)
+    builder.x = REQUIRED
+    assert not is_complete(builder)
+
+
+@pytest.mark.parametrize("builder", make_builders(Point, y=2.0))
+def test_is_complete_from_constructor(builder):
+    assert not is_complete(builder)
+    builder.x = 1.0
+    assert is_complete(builder)
+
+
+@pytest.mark.parametrize("builder", make_builders(NoFields))
+def test_is_complete_without_fields(builder):
+    assert is_complete(builder)
+    assert {} == missing(builder)
+
+
+@pytest.mark.parametrize("builder", make_builders(Point))
+def test_missing(builder):
+    point_fields = dataclasses.fields(Point)
+    assert {"x": point_fields[0], "y": point_fields[1]} == missing(builder)
+    builder.y = 3.0
+    assert {"x": point_fields[0]} == missing(builder)
+    builder.w = OPTIONAL
+    builder.x = 1.0
+    assert {} == missing(builder)
+    builder.y = REQUIRED
+    assert {"y": point_fields[1]} == missing(builder)
+
+
+def test_build_many():
+    rows = [{"x": 1, "y": 2}, {"y": 4, "x": 3}]
+    assert [PixelCoord(1, 2), PixelCoord(3, 4)] == list(build_many(PixelCoord, rows))
+    PixelCoordBuilder = dataclass_builder(PixelCoord)
+    assert [PixelCoord(1, 2), PixelCoord(3, 4)] == list(
+        build_many(PixelCoordBuilder, rows)
+    )
+
+
+def test_build_many_is_lazy():
+    def rows():
+        yield {"x": 1.0, "y": 2.0}
+        raise RuntimeError("should not be reached")
+
+    points = build_many(Point, rows())
+    assert Point(1.0, 2.0) == next(points)
+    with pytest.raises(RuntimeError):
+        next(points)
+
+
+def test_build_many_optional_fields():
+    rows = [{"x": 1.0, "y": 2.0}, {"x": 1.0, "y": 2.0, "w": 3.0}]
+    assert [Point(1.0, 2.0), Point(1.0, 2.0, 3.0)] == list(build_many(Point, rows))
+
+
+def test_build_many_raise():
+    with pytest.raises(MissingFieldError) as missing_err:
+        list(build_many(PixelCoord, [{"x": 1, "y": 2}, {"x": 3}]))
+    assert missing_err.value.dataclass is PixelCoord
+    assert missing_err.value.field == dataclasses.fields(PixelCoord)[1]
+    with pytest.raises(UndefinedFieldError) as undefined_err:
+        list(build_many(PixelCoord, [{"x": 1, "y": 2, "z": 3}]))
+    assert undefined_err.value.dataclass is PixelCoord
+    assert undefined_err.value.field == "z"
+
+
+def test_build_many_skip():
+    rows = [{"x": 1}, {"x": 1, "y": 2}, {"x": 1, "y": 2, "z": 3}]
+    assert [PixelCoord(1, 2)] == list(build_many(PixelCoord, rows, errors="skip"))
+
+
+def test_build_many_yield():
+    rows = [{"x": 1}, {"x": 1, "y": 2}, {"x": 1, "y": 2, "z": 3}]
+    first, second, third = build_many(PixelCoord, rows, errors="yield")
+    assert isinstance(first, RowError)
+    assert (0, rows[0]) == (first.position, first.row)
+    assert isinstance(first.error, MissingFieldError)
+    assert PixelCoord(1, 2) == second
+    assert isinstance(third, RowError)
+    assert (2, rows[2]) == (third.position, third.row)
+    assert isinstance(third.error, UndefinedFieldError)
+
+
+def test_build_many_invalid_arguments():
+    with pytest.raises(ValueError):
+        build_many(PixelCoord, [], errors="ignore")
+    with pytest.raises(TypeError):
+        build_many(NotADataclass, [])
+    with pytest.raises(TypeError):
+        build_many(DataclassBuilder, [])
+
+
+@pytest.mark.parametrize("builder", make_builders(Point, x=1.0, w=2.0))
+def test_reset(builder):
+    builder.y = 3.0
+    reset(builder)
+    assert builder.x is REQUIRED
+    assert builder.y is REQUIRED
+    assert builder.w is OPTIONAL
+    assert not is_complete(builder)
+    assert ["x", "y"] == list(missing(builder))
+    builder.x = 4.0
+    builder.y = 5.0
+    assert Point(4.0, 5.0) == build(builder)
+
+
+def test_abuild():
+    async def value(result, delay):
+        await asyncio.sleep(delay)
+        return result
+
+    async def main(builder):
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(3.0)
+        builder.x = value(1.0, 0.02)
+        builder.y = value(2.0, 0.01)
+        builder.w = future
+        return await abuild(builder)
+
+    for builder in make_builders(Point):
+        assert Point(1.0, 2.0, 3.0) == asyncio.run(main(builder))
+        assert asyncio.iscoroutine(builder.x)
+        builder.x.close()
+        builder.y.close()
+
+
+def test_abuild_without_awaitables():
+    for builder in make_builders(Point, x=1.0, y=2.0):
+        assert Point(1.0, 2.0) == asyncio.run(abuild(builder))
+
+
+def test_abuild_is_concurrent():
+    async def main():
+        event = asyncio.Event()
+
+        async def wait():
+            await event.wait()
+            return 1
+
+        async def release():
+            event.set()
+            return 2
+
+        return await abuild(DataclassBuilder(PixelCoord, x=wait(), y=release()))
+
+    assert PixelCoord(1, 2) == asyncio.run(main())
+
+
+def test_abuild_checks_required_fields_first():
+    awaited = []
+
+    async def value():
+        awaited.append(True)
+        return 1.0
+
+    for builder in make_builders(Point):
+        builder.w = value()
+        with pytest.raises(MissingFieldError) as err:
+            asyncio.run(abuild(builder))
+        assert err.value.dataclass is Point
+        assert err.value.field == dataclasses.fields(Point)[0]
+        builder.w.close()
+    assert not awaited
+
+
+@dataclasses.dataclass(frozen=True)
+class Frozen:
+    x: int
+    values: List[int] = dataclasses.field(default_factory=list)
+    count: int = dataclasses.field(default=0, init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "count", self.x + len(self.values))
+
+
+@dataclasses.dataclass
+class WithInitVar:
+    x: int
+    scale: dataclasses.InitVar[int] = 2
+
+    def __post_init__(self, scale):
+        self.x *= scale
+
+
+@dataclasses.dataclass
+class DefinedInit:
+    x: int
+
+    # kept by dataclasses, as init=True only generates a missing __init__
+    def __init__(self, x):
+        self.x = x * 10
+
+
+@pytest.mark.parametrize(
+    "dataclass, kwargs",
+    [
+        (Point, {"x": 1.0, "y": 2.0}),
+        (Point, {"x": 1.0, "y": 2.0, "w": 3.0}),
+        (Circle, {"radius": 2.0}),
+        (Types, {"int_": 1, "float_": 2.0}),
+        (DefaultFactory, {}),
+        (Frozen, {"x": 1}),
+        (Frozen, {"x": 1, "values": [1, 2]}),
+        (CustomInit, {"x": 1}),
+        (WithInitVar, {"x": 1}),
+        (DefinedInit, {"x": 1}),
+        (NoFields, {}),
+    ],
+)
+def test_build_trusted(dataclass, kwargs):
+    for builder in make_builders(dataclass, **kwargs):
+        expected = build(builder)
+        result = build(builder, trusted=True)
+        assert type(expected) is type(result)
+        assert vars(expected) == vars(result)
+
+
+def test_build_trusted_default_factory_is_called():
+    for builder in make_builders(DefaultFactory):
+        assert build(builder, trusted=True).values is not build(
+            builder, trusted=True
+        ).values
+
+
+def test_build_trusted_missing_field():
+    for builder in make_builders(Point, x=1.0):
+        with pytest.raises(MissingFieldError):
+            build(builder, trusted=True)
+
+
+def test_build_trusted_method():
+    PointBuilder = dataclass_builder(Point)
+    assert Point(1.0, 2.0) == PointBuilder(x=1.0, y=2.0).build(trusted=True)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires slots dataclasses")
+def test_build_trusted_slots_dataclass():
+    Slots = dataclasses.make_dataclass(
+        "Slots",
+        [
+            ("x", int),
+            ("y", int, dataclasses.field(default=2)),
+            ("z", int, dataclasses.field(default=3, init=False)),
+        ],
+        slots=True,
+        frozen=True,
+    )
+    for builder in make_builders(Slots, x=1):
+        result = build(builder, trusted=True)
+        assert Slots(1, 2) == result
+        assert 3 == result.z
+
+
+def test_changed_fields():
+    for builder in make_builders(Point, y=2.0):
+        assert ("y",) == changed_fields(builder)
+        builder.w = 3.0
+        builder.x = 1.0
+        builder.y = 4.0
+        assert ("y", "w", "x") == changed_fields(builder)
+        builder.w = OPTIONAL
+        assert ("y", "x") == changed_fields(builder)
+        reset(builder)
+        assert () == changed_fields(builder)
+
+
+def test_changed_fields_reassigned():
+    for builder in make_builders(Point):
+        builder.y = 2.0
+        builder.x = 1.0
+        builder.w = 3.0
+        builder.y = 4.0
+        assert ("y", "x", "w") == changed_fields(builder)
+        builder.y = REQUIRED
+        builder.y = 2.0
+        assert ("x", "w", "y") == changed_fields(builder)
+        assert ("x", "w", "y") == changed_fields(copy.copy(builder))
+        assert ("x", "w", "y") == changed_fields(clone(builder))
+        other = pickle.loads(pickle.dumps(builder))
+        assert ("x", "w", "y") == changed_fields(other)
+
+
+def test_changed_fields_copy():
+    for builder in make_builders(Point, x=1.0):
+        other = copy.copy(builder)
+        other.y = 2.0
+        assert ("x",) == changed_fields(builder)
+        assert ("x", "y") == changed_fields(other)
+        assert REQUIRED == builder.y
+        assert Point(1.0, 2.0) == build(other)
+        other = copy.deepcopy(other)
+        assert ("x", "y") == changed_fields(other)
+        assert Point(1.0, 2.0) == build(other)
+
+
+def test_clone():
+    for builder in make_builders(Point, x=1.0, y=2.0):
+        other = clone(builder)
+        assert type(builder) is type(other)
+        other.y = 3.0
+        builder.w = 4.0
+        assert Point(1.0, 2.0, 4.0) == build(builder)
+        assert Point(1.0, 3.0) == build(other)
+        assert Point(1.0, 3.0) == build(other, trusted=True)
+        assert ("x", "y", "w") == changed_fields(builder)
+        assert ("x", "y") == changed_fields(other)
+        assert repr(other).endswith("x=1.0, y=3.0)")
+        point = Point(0.0, 0.0)
+        update(point, other)
+        assert Point(1.0, 3.0) == point
+
+
+def test_clone_chain():
+    for builder in make_builders(Point, x=1.0):
+        clones = [builder]
+        for i in range(5):
+            clones.append(clone(clones[-1]))
+            clones[-1].y = float(i)
+        for i, other in enumerate(clones[1:]):
+            assert Point(1.0, float(i)) == build(other)
+        assert REQUIRED == builder.y
+
+    # one prototype holds the fields assigned along the whole chain
+    builder = clone(clone(DataclassBuilder(Point, x=1.0)))
+    builder.y = 2.0
+    other = clone(builder)
+    proto = vars(other)["_DataclassBuilder__proto"]
+    assert {"x": 1.0, "y": 2.0} == proto
+
+
+def test_clone_reset_and_copy():
+    for builder in make_builders(Point, x=1.0, y=2.0):
+        other = clone(builder)
+        reset(other)
+        assert REQUIRED == other.x
+        assert () == changed_fields(other)
+        assert Point(1.0, 2.0) == build(builder)
+        other = clone(builder)
+        other.w = 3.0
+        assert Point(1.0, 2.0, 3.0) == build(copy.copy(other))
+        assert Point(1.0, 2.0, 3.0) == build(copy.deepcopy(other))
+        with pytest.raises(AttributeError):
+            other.z  # pylint: disable=pointless-statement
+
+
+def test_update_assignment_order():
+    class Recorder:
+        def __init__(self):
+            self.names = []
+
+        def __setattr__(self, name, value):
+            if name != "names":
+                self.names.append(name)
+            super().__setattr__(name, value)
+
+    for builder in make_builders(Point):
+        builder.w = 3.0
+        builder.x = 1.0
+        recorder = Recorder()
+        update(recorder, builder)
+        assert ["w", "x"] == recorder.names
+
+
+def test_build_parallel():
+    builders = [
+        builder
+        for i in range(10)
+        for builder in make_builders(Point, x=float(i), y=float(i))
+    ]
+    points = [Point(float(i // 3), float(i // 3)) for i in range(30)]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        assert points == build_parallel(builders, executor=executor, chunksize=4)
+        assert points == build_parallel(builders, executor=executor, trusted=True)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        assert points == build_parallel(iter(builders), executor=executor)
+        builders[5].y = REQUIRED
+        with pytest.raises(MissingFieldError):
+            build_parallel(builders, executor=executor)
+    assert [] == build_parallel([])
+
+
+class Counter:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def test_lazy():
+    for builder in make_builders(Point, x=1.0):
+        counter = Counter(2.0)
+        builder.y = lazy(counter)
+        assert repr(builder).endswith(f"x=1.0, y=lazy({counter!r}))")
+        assert Point(1.0, 2.0) == build(builder)
+        assert Point(1.0, 2.0) == build(builder, trusted=True)
+        assert Point(1.0, 2.0) == build(clone(builder))
+        assert 1 == counter.calls
+        assert repr(builder).endswith("x=1.0, y=lazy(resolved=2.0))")
+
+
+def test_lazy_not_resolved_when_missing():
+    for builder in make_builders(Point):
+        counter = Counter(2.0)
+        builder.w = lazy(counter)
+        with pytest.raises(MissingFieldError):
+            build(builder)
+        assert 0 == counter.calls
+        assert isinstance(builder.w, Lazy)
+
+
+def test_lazy_update():
+    builder = DataclassBuilder(Point)
+    counter = Counter(2.0)
+    builder.y = lazy(counter)
+    other = DataclassBuilder(Point, x=1.0)
+    update(other, builder)
+    assert 0 == counter.calls
+    assert builder.y is other.y
+    point = Point(1.0, 1.0)
+    update(point, builder)
+    assert Point(1.0, 2.0) == point
+    assert 1 == counter.calls
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires kw_only fields")
+def test_build_keyword_only():
+    @dataclasses.dataclass
+    class Order:
+        id: int
+        price: float = dataclasses.field(kw_only=True)  # type: ignore
+        volume: int = 1
+        venue: str = dataclasses.field(default="XLON", kw_only=True)  # type: ignore
+
+    info = _dataclass_info(Order)
+    assert (0, 2) == info.positional
+    assert (1, 3) == info.keywords
+    for builder in make_builders(Order, id=1, price=2.0):
+        assert Order(1, 1, price=2.0) == build(builder)
+        builder.venue = "XPAR"
+        builder.volume = 5
+        assert Order(1, 5, price=2.0, venue="XPAR") == build(builder)
+
+
+def test_build_positional_layout():
+    assert (0, 1, 2) == _dataclass_info(Point).positional
+    assert () == _dataclass_info(Point).keywords
+    # a custom __init__ does not take the fields positionally
+    assert _dataclass_info(CustomInit).positional is None
+    for builder in make_builders(Point, x=1.0, y=2.0):
+        assert Point(1.0, 2.0) == build(builder)
+        builder.w = OPTIONAL
+        assert Point(1.0, 2.0) == build(builder)
+        builder.w = 3.0
+        assert Point(1.0, 2.0, 3.0) == build(builder)
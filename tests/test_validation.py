@@ -0,0 +1,233 @@
+import asyncio
+import dataclasses
+import importlib.util
+import io
+import pickle
+import sys
+from typing import Any, Dict, List, NewType, Optional, Sequence, Tuple, TypeVar, Union
+
+import pytest  # type: ignore
+
+from dataclass_builder import (
+    OPTIONAL,
+    REQUIRED,
+    DataclassBuilder,
+    FieldTypeError,
+    UndefinedFieldError,
+    abuild,
+    build,
+    dataclass_builder,
+    generate_builder_source,
+    lazy,
+)
+from dataclass_builder._validation import _checker, _field_checkers
+from tests.conftest import Invoice, Line, Point, make_builders
+
+UserId = NewType("UserId", int)
+
+
+@dataclasses.dataclass
+class Order:
+    id: UserId
+    lines: List[Line]
+    tags: Dict[str, int] = dataclasses.field(default_factory=dict)
+    note: Optional[str] = None
+    extra: Any = None
+
+
+@pytest.mark.parametrize(
+    "type_,valid,invalid",
+    [
+        (int, [1, True], [1.0, "1", None]),
+        (float, [1, 1.0], ["1.0", None]),
+        (Optional[str], ["a", None], [1]),
+        (Union[int, List[str]], [1, ["a"], []], [["a", 1], 1.5]),
+        (List[int], [[], [1, 2]], [[1, "2"], (1, 2)]),
+        (Dict[str, int], [{}, {"a": 1}], [{"a": "1"}, {1: 1}, [("a", 1)]]),
+        (Tuple[int, str], [(1, "a")], [(1,), ("a", 1), [1, "a"]]),
+        (Tuple[int, ...], [(), (1, 2)], [(1, "2")]),
+        (Sequence[int], [[1], (1,)], [{1}, ["1"]]),
+        (List[Optional[Point]], [[Point(1.0, 2.0), None]], [[Line]]),
+        (UserId, [1], ["1"]),
+    ],
+)
+def test_checker(type_, valid, invalid):
+    check = _checker(type_)
+    for value in valid:
+        assert check(value)
+    for value in invalid:
+        assert not check(value)
+
+
+@pytest.mark.parametrize(
+    "type_", [Any, object, TypeVar("T"), "Unresolved", Optional[Any], List]
+)
+def test_checker_accepts_anything(type_):
+    check = _checker(type_)
+    if check is not None:
+        assert check([object()])
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="requires typing.Protocol")
+def test_validate_protocol():
+    from typing import Protocol, runtime_checkable
+
+    class Closeable(Protocol):
+        def close(self) -> None:
+            ...
+
+    @runtime_checkable
+    class Checked(Closeable, Protocol):
+        pass
+
+    @dataclasses.dataclass
+    class Resource:
+        handle: Closeable
+        checked: Checked
+        optional: Optional[Closeable] = None
+
+    # only runtime checkable protocols can be checked
+    assert _checker(Closeable) is None
+    assert ["checked"] == list(_field_checkers(Resource))
+    for builder in make_builders(Resource, validate=True):
+        builder.handle = 1
+        builder.optional = 1
+        builder.checked = io.StringIO()
+        with pytest.raises(FieldTypeError):
+            builder.checked = 1
+
+
+def test_field_checkers():
+    checkers = _field_checkers(Order)
+    assert checkers is _field_checkers(Order)
+    # fields of any type are not checked
+    assert ["id", "lines", "tags", "note"] == list(checkers)
+
+
+def test_validate():
+    for builder in make_builders(Point, validate=True, x=1):
+        with pytest.raises(FieldTypeError) as excinfo:
+            builder.y = "2.0"
+        assert "field 'y' of dataclass 'Point' must be float, not str" == str(
+            excinfo.value
+        )
+        assert Point is excinfo.value.dataclass
+        assert "y" == excinfo.value.field
+        assert "2.0" == excinfo.value.value
+        assert isinstance(excinfo.value, TypeError)
+        assert REQUIRED == builder.y
+        builder.y = 2.0
+        assert Point(1, 2.0) == build(builder)
+
+
+def test_validate_constructor():
+    for make in (
+        lambda: DataclassBuilder(Point, validate=True, x="1"),
+        lambda: dataclass_builder(Point, validate=True)(x="1"),
+    ):
+        with pytest.raises(FieldTypeError):
+            make()
+
+
+def test_validate_generic_fields():
+    for builder in make_builders(Order, validate=True, id=UserId(1)):
+        with pytest.raises(FieldTypeError) as excinfo:
+            builder.lines = [Point(1.0, 2.0)]
+        assert "must be List[tests.conftest.Line], not list" in str(excinfo.value)
+        with pytest.raises(FieldTypeError):
+            builder.note = 1
+        with pytest.raises(FieldTypeError):
+            builder.tags = {"a": "b"}
+        builder.lines = [Line(Point(1.0, 2.0), Point(3.0, 4.0))]
+        builder.extra = object()
+        builder.note = None
+        builder.note = OPTIONAL
+        assert 1 == build(builder).id
+
+
+def test_validate_deferred_values():
+    async def note():
+        return "note"
+
+    for builder in make_builders(Order, validate=True, id=1, lines=[]):
+        # only checked when they are built, so by the dataclass
+        builder.note = lazy(lambda: 1)
+        assert 1 == build(builder).note
+        builder.note = note()
+        assert "note" == asyncio.run(abuild(builder)).note
+
+
+def test_validate_nested():
+    builder = DataclassBuilder(Line, nested=True, validate=True)
+    builder.start.x = 1.0
+    with pytest.raises(FieldTypeError):
+        builder.start.y = "2.0"
+    builder.start.y = 2.0
+    builder.end = DataclassBuilder(Point, x=3.0, y=4.0)
+    assert Line(Point(1.0, 2.0), Point(3.0, 4.0)) == build(builder)
+    with pytest.raises(FieldTypeError):
+        builder.end = DataclassBuilder(Line)
+    # builders are only built by nested builders, so are rejected otherwise
+    with pytest.raises(FieldTypeError):
+        DataclassBuilder(Line, validate=True).end = DataclassBuilder(Point)
+
+
+def test_validate_partially_resolved():
+    for builder in make_builders(Invoice, validate=True):
+        # the unresolved annotation accepts anything, the others are checked
+        builder.total = "1.50"
+        with pytest.raises(FieldTypeError):
+            builder.count = "2"
+        with pytest.raises(FieldTypeError):
+            builder.line = Point(0.0, 0.0)
+        builder.count = 2
+
+
+def test_validate_off():
+    builder = DataclassBuilder(Point, x="1", validate=False)
+    builder.y = "2"
+    assert Point("1", "2") == build(builder)
+    assert dataclass_builder(Point) is not dataclass_builder(Point, validate=True)
+    assert dataclass_builder(Point)(x="1", y="2").build() == build(builder)
+
+
+def test_validate_attributes():
+    builder = DataclassBuilder(Point, validate=True)
+    builder._private = "1"
+    assert "1" == builder._private
+    with pytest.raises(UndefinedFieldError):
+        builder.z = 1.0
+    builder.x = 1.0
+    builder.x = REQUIRED
+    assert REQUIRED == builder.x
+
+
+def test_validate_option_is_a_field():
+    @dataclasses.dataclass
+    class Options:
+        x: int
+        validate: bool = False
+
+    builder = DataclassBuilder(Options, validate=True)
+    assert builder.validate is True
+    builder.x = "1"
+
+
+@pytest.mark.parametrize("index", [0, 1, 2])
+def test_validate_pickle(index):
+    builder = make_builders(Point, validate=True, x=1.0)[index]
+    other = pickle.loads(pickle.dumps(builder))
+    with pytest.raises(FieldTypeError):
+        other.y = "2.0"
+
+
+def test_validate_generate_builder_source(tmp_path):
+    source = generate_builder_source(Point, validate=True)
+    path = tmp_path / "point_builder.py"
+    path.write_text(source)
+    spec = importlib.util.spec_from_file_location("point_builder", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    with pytest.raises(FieldTypeError):
+        module.PointBuilder(x="1")
+    assert "_checkers" not in generate_builder_source(Point)
@@ -1,4 +1,5 @@
 import dataclasses
+import pickle
 
 import pytest  # type: ignore
 
@@ -9,11 +10,18 @@ from dataclass_builder import (
     MissingFieldError,
     UndefinedFieldError,
     build,
+    changed_fields,
+    clone,
     fields,
+    is_complete,
+    lazy,
+    missing,
 )
 from tests.conftest import (
     Circle,
+    Drawing,
     ExtendedBuilder,
+    Line,
     NoFields,
     NoInitFields,
     NotADataclass,
@@ -184,6 +192,104 @@ def test_access_unset_field():
     assert builder.w == OPTIONAL
 
 
+def test_only_assigned_fields_are_stored():
+    builder = DataclassBuilder(Point, x=1.0)
+    assert {"x"} == {name for name in vars(builder) if not name.startswith("_")}
+    builder.x = REQUIRED
+    builder.w = OPTIONAL
+    assert not [name for name in vars(builder) if not name.startswith("_")]
+    assert REQUIRED == builder.x
+    assert OPTIONAL == builder.w
+    assert "DataclassBuilder(Point)" == repr(builder)
+    # a wide dataclass only stores the fields that are set
+    Wide = dataclasses.make_dataclass(
+        "Wide", [(f"f{i}", int, dataclasses.field(default=i)) for i in range(400)]
+    )
+    builder = DataclassBuilder(Wide, f3=-3, f7=-7)
+    assert 2 == len([name for name in vars(builder) if not name.startswith("_")])
+    assert OPTIONAL == builder.f100
+    assert "DataclassBuilder(Wide, f3=-3, f7=-7)" == repr(builder)
+    wide = build(builder)
+    assert (-3, -7, 100) == (wide.f3, wide.f7, wide.f100)
+
+
+def test_nested():
+    builder = DataclassBuilder(Line, nested=True)
+    builder.start.x = 1.0
+    builder.start.y = 2.0
+    builder.end = Point(3.0, 4.0)
+    assert ("start", "end") == changed_fields(builder)
+    assert (
+        "DataclassBuilder(Line, start=DataclassBuilder(Point, x=1.0, y=2.0), "
+        "end=Point(x=3.0, y=4.0, w=1.0))"
+    ) == repr(builder)
+    assert Line(Point(1.0, 2.0), Point(3.0, 4.0)) == build(builder)
+    # the label is not a dataclass and repr does not create nested builders
+    assert "" == build(builder).label
+    builder = DataclassBuilder(Line, nested=True)
+    assert "DataclassBuilder(Line)" == repr(builder)
+    assert "DataclassBuilder(Line)" == repr(DataclassBuilder(Line, nested=False))
+    builder.start.x = 1.0
+    with pytest.raises(MissingFieldError):
+        build(builder)
+
+
+def test_nested_completeness():
+    builder = DataclassBuilder(Line, nested=True)
+    # reading a field creates its builder, which has no fields yet
+    builder.start.x = 1.0
+    builder.end  # pylint: disable=pointless-statement
+    assert not is_complete(builder)
+    assert ["start", "end"] == list(missing(builder))
+    with pytest.raises(MissingFieldError):
+        build(builder)
+    builder.start.y = 2.0
+    assert ["end"] == list(missing(builder))
+    builder.end = Point(3.0, 4.0)
+    assert is_complete(builder)
+    assert {} == missing(builder)
+    # builders of builders and their clones are checked too
+    drawing = DataclassBuilder(Drawing, nested=True)
+    drawing.line.start.x = 1.0
+    assert ["line"] == list(missing(drawing))
+    assert ["line"] == list(missing(clone(drawing)))
+
+
+def test_nested_builds_before_lazy():
+    builder = DataclassBuilder(Line, nested=True)
+    builder.start.x = 1.0
+    builder.end = Point(3.0, 4.0)
+    builder.label = lazy(pytest.fail)
+    with pytest.raises(MissingFieldError):
+        build(builder)
+
+
+def test_nested_is_recursive():
+    builder = DataclassBuilder(Drawing, nested=True)
+    builder.line.start.x = 1.0
+    builder.line.start.y = 2.0
+    builder.line.end.x = 3.0
+    builder.line.end.y = 4.0
+    # the optional parent is not used, so it is not built
+    assert Drawing(Line(Point(1.0, 2.0), Point(3.0, 4.0))) == build(builder)
+    other = pickle.loads(pickle.dumps(builder))
+    other.line.label = "copy"
+    assert "copy" == build(other).line.label
+    assert "" == build(builder).line.label
+
+
+def test_nested_option_is_a_field():
+    @dataclasses.dataclass
+    class Options:
+        line: Line
+        nested: bool = False
+
+    # the field takes precedence over the option
+    builder = DataclassBuilder(Options, nested=True)
+    assert builder.nested is True
+    assert REQUIRED == builder.line
+
+
 def test_access_invalid_field():
     builder = DataclassBuilder(Point)
     with pytest.raises(AttributeError):
@@ -292,3 +398,29 @@ def test_typing_module():
     builder = DataclassBuilder(Typing)
     builder.sequence = [1, 2, 3]
     builder.mapping = {"one": 1.0, "two": 2.0, "pi": 3.14}
+
+
+def test_pickle():
+    builder = DataclassBuilder(Point, y=2.0)
+    builder.x = 1.0
+    data = pickle.dumps(builder)
+    # only the dataclass and the assigned fields are pickled
+    assert b"_DataclassBuilder__" not in data
+    other = pickle.loads(data)
+    assert type(other) is DataclassBuilder
+    assert repr(builder) == repr(other)
+    assert ("y", "x") == changed_fields(other)
+    assert Point(1.0, 2.0) == build(other)
+    other.w = 3.0
+    assert OPTIONAL == builder.w
+
+
+def test_pickle_subclass():
+    builder = ExtendedBuilder(Point, x=1.0)
+    builder._extra = "value"
+    other = pickle.loads(pickle.dumps(builder))
+    assert type(other) is ExtendedBuilder
+    assert "value" == other._extra
+    assert REQUIRED == other.y
+    other.y = 2.0
+    assert Point(1.0, 2.0) == build(other)